@@ -0,0 +1,80 @@
+"""
+Compare the full and the lite scan profile of the chromedevtools scan module.
+
+For every site given on the command line, the site is scanned once with
+each profile. The script prints the scan duration of both profiles and
+reports which result keys differ between them. Keys that depend on
+timing (e.g. cookie lifetimes) are not compared.
+
+Usage:
+
+    python examples/compare_scan_profiles.py http://example.com/ ...
+"""
+import argparse
+import logging
+import sys
+import time
+from copy import deepcopy
+
+from privacyscanner.filehandlers import NoOpFileHandler
+from privacyscanner.loghandlers import ScanStreamHandler
+from privacyscanner.result import Result
+from privacyscanner.scanmeta import ScanMeta
+from privacyscanner.scanmodules.chromedevtools import ChromeDevtoolsScanModule
+from privacyscanner.scanner import load_config
+
+
+COMPARED_KEYS = ['final_url', 'redirect_chain', 'third_parties', 'tracking',
+                 'cookiestats', 'google_analytics', 'security_headers']
+
+
+def scan(site_url, options, logger):
+    scan_module = ChromeDevtoolsScanModule(deepcopy(options))
+    scan_module.logger = logger
+    result = Result({'site_url': site_url}, NoOpFileHandler())
+    # We pretend that this is not the first try to avoid retries.
+    meta = ScanMeta(worker_id=0, num_tries=2)
+    time_start = time.time()
+    scan_module.scan_site(result, meta)
+    return result.get_results(), time.time() - time_start
+
+
+def compare(full, lite):
+    differences = []
+    for key in COMPARED_KEYS:
+        if full.get(key) != lite.get(key):
+            differences.append(key)
+    full_urls = {request['url'] for request in full.get('requests', [])}
+    lite_urls = {request['url'] for request in lite.get('requests', [])}
+    if full_urls != lite_urls:
+        differences.append('requests ({} only full, {} only lite)'.format(
+            len(full_urls - lite_urls), len(lite_urls - full_urls)))
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare full and lite scan profiles.')
+    parser.add_argument('sites', nargs='+', help='Sites to scan')
+    parser.add_argument('-c', '--config', help='Configuration file')
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    options = dict(config['SCAN_MODULE_OPTIONS']['__all__'])
+    options.update(config['SCAN_MODULE_OPTIONS'].get('chromedevtools', {}))
+    logger = logging.Logger('compare_scan_profiles')
+    logger.addHandler(ScanStreamHandler())
+
+    has_differences = False
+    for site_url in args.sites:
+        full, full_time = scan(site_url, dict(options, scan_profile='full'), logger)
+        lite, lite_time = scan(site_url, dict(options, scan_profile='lite'), logger)
+        differences = compare(full, lite)
+        has_differences |= bool(differences)
+        print('{}: full {:.1f}s, lite {:.1f}s, differences: {}'.format(
+            site_url, full_time, lite_time, ', '.join(differences) or 'none'))
+    if has_differences:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
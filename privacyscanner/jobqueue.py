@@ -3,6 +3,8 @@ from typing import NamedTuple
 import psycopg2
 from psycopg2.extras import Json
 
+from privacyscanner.result import DELETED
+
 
 _FETCH_JOB_QUERY = """
 WITH job AS (
@@ -21,11 +23,12 @@ WITH job AS (
     AND (sj1.not_before IS NULL OR sj1.not_before <= NOW())
   ORDER BY sj1.priority DESC, sj1.scan_id, sj1.dependency_order
   FOR UPDATE OF sj1 SKIP LOCKED
-  LIMIT 1
+  LIMIT %s
 )
-DELETE FROM scanner_scanjob
-WHERE id = (SELECT id FROM job)
-RETURNING id, scan_id, scan_module, (SELECT num_tries FROM job) AS num_tries, dependency_order, priority
+DELETE FROM scanner_scanjob AS sj
+USING job
+WHERE sj.id = job.id
+RETURNING sj.id, sj.scan_id, sj.scan_module, job.num_tries, sj.dependency_order, sj.priority
 """
 
 _FETCH_RESULT_QUERY = """
@@ -44,6 +47,12 @@ SET result = result || %s::jsonb
 WHERE id = %s
 """
 
+_PATCH_RESULT_QUERY = """
+UPDATE scanner_scan
+SET result = {}
+WHERE id = %s
+"""
+
 _RESCHEDULE_JOB_QUERY = """
 INSERT INTO scanner_scanjob
 (scan_module, priority, dependency_order, scan_id, not_before)
@@ -56,6 +65,36 @@ SET num_tries = GREATEST(0, num_tries - 1)
 WHERE scan_id = %s AND scan_module = %s
 """
 
+_PENDING_SITES_QUERY = """
+SELECT s.result->>'site_url', s.result->'redirect_chain'
+FROM scanner_scanjob AS sj,
+     scanner_scan AS s
+WHERE sj.scan_module = %s
+  AND s.id = sj.scan_id
+"""
+
+
+# DSN of the queue database for scan modules (see configure_queue_db)
+_queue_db_dsn = None
+
+
+def configure_queue_db(dsn):
+    """Make the queue database available to the scan modules of this process.
+
+    Scan modules use it for caches and partial results. The DSN is not
+    passed with their options, because options are logged and it might
+    contain a password.
+    """
+    global _queue_db_dsn
+
+    _queue_db_dsn = dsn
+
+
+def get_queue_db_dsn():
+    """Return the DSN of the queue database or None if not configured."""
+    return _queue_db_dsn
+
+
 class Job(NamedTuple):
     scan_id: int
     scan_module: object
@@ -71,50 +110,172 @@ class JobQueue:
         self._scan_modules = scan_modules
         self._available_modules = tuple(self._scan_modules.keys())
         self._max_tries = max_tries
-        self._last_job = None
+        # Jobs claimed in the current transaction that have not been
+        # reported yet and the number of jobs claimed in total.
+        self._jobs = []
+        self._num_claimed = 0
         self._conn = None
         self._connect()
 
-    def report_result(self, updates):
-        assert self._last_job is not None
-        with self._conn.cursor() as c:
-            c.execute(_UPDATE_RESULT_QUERY, (Json(updates), self._last_job.scan_id))
-        self._last_job = None
-        self._conn.commit()
+    def report_result(self, updates, job=None):
+        """Apply the (path, value) patches of Result.get_updates()."""
+        job = self._pop_job(job)
+        if updates:
+            expression, params = _build_patch_expression(updates)
+            with self._conn.cursor() as c:
+                c.execute(_PATCH_RESULT_QUERY.format(expression), params + [job.scan_id])
+        self._commit_if_done()
 
-    def report_failure(self):
-        assert self._last_job is not None
-        self._last_job = None
-        self._conn.rollback()
+    def report_failure(self, job=None):
+        job = self._pop_job(job)
+        if self._num_claimed == 1:
+            self._num_claimed = 0
+            self._conn.rollback()
+            return
+        # Other jobs of the batch may already have reported their results,
+        # so we can not roll back. Put the job back into the queue instead.
+        with self._conn.cursor() as c:
+            c.execute(_RESCHEDULE_JOB_QUERY, (job.scan_module.name, job.priority,
+                                              job.dependency_order, job.scan_id, None))
+        self._commit_if_done()
 
     def _connect(self):
         self._conn = psycopg2.connect(self._dsn)
 
     def get_job_nowait(self):
-        assert self._last_job is None
+        assert not self._jobs
         if self._conn.closed:
             self._connect()
+        jobs = self._fetch_jobs(self._available_modules, 1)
+        if jobs:
+            return jobs[0]
+
+    def get_more_jobs_nowait(self, scan_module, limit):
+        """Claim up to limit more jobs of scan_module for a batch.
+
+        The jobs are claimed in the same transaction as the current job,
+        i.e., they all return to the queue if the worker dies before
+        every job of the batch has been reported.
+        """
+        assert self._jobs
+        return self._fetch_jobs((scan_module.name,), limit)
+
+    def _fetch_jobs(self, scan_module_names, limit):
+        jobs = []
         with self._conn.cursor() as c:
-            c.execute(_FETCH_JOB_QUERY, (self._available_modules, self._max_tries))
-            job = c.fetchone()
-            if job:
-                job_id, scan_id, scan_module_name, num_tries, dependency_order, priority = job
+            c.execute(_FETCH_JOB_QUERY, (scan_module_names, self._max_tries, limit))
+            rows = c.fetchall()
+            for job_id, scan_id, scan_module_name, num_tries, dependency_order, priority in rows:
                 scan_module = self._scan_modules[scan_module_name]
                 if scan_module.required_keys:
                     c.execute(_FETCH_RESULT_QUERY, (scan_id, tuple(scan_module.required_keys)))
                     result = dict(c.fetchall())
                 else:
                     result = {}
-                job = Job(scan_id, scan_module, result, num_tries, dependency_order, priority)
-                self._last_job = job
-                return job
+                jobs.append(Job(scan_id, scan_module, result, num_tries,
+                                dependency_order, priority))
+        self._jobs.extend(jobs)
+        self._num_claimed += len(jobs)
+        return jobs
 
-    def reschedule(self, not_before=None):
-        assert self._last_job is not None
+    def reschedule(self, not_before=None, job=None):
+        if job is None:
+            assert len(self._jobs) == 1
+            job = self._jobs[0]
         with self._conn.cursor() as c:
-            params = (self._last_job.scan_module.name, self._last_job.priority,
-                      self._last_job.dependency_order, self._last_job.scan_id,
-                      not_before)
+            params = (job.scan_module.name, job.priority, job.dependency_order,
+                      job.scan_id, not_before)
             c.execute(_RESCHEDULE_JOB_QUERY, params)
-            c.execute(_INCREASE_TRIES_QUERY, (self._last_job.scan_id,
-                                              self._last_job.scan_module.name))
+            c.execute(_INCREASE_TRIES_QUERY, (job.scan_id, job.scan_module.name))
+
+    def _pop_job(self, job):
+        if job is None:
+            assert len(self._jobs) == 1
+            job = self._jobs[0]
+        self._jobs.remove(job)
+        return job
+
+    def _commit_if_done(self):
+        if not self._jobs:
+            self._num_claimed = 0
+            self._conn.commit()
+
+
+class PartialResultWriter:
+    """Save parts of the result of a running job immediately.
+
+    The updates are committed outside of the transaction of the job, so
+    they survive if the worker is killed and the job is returned to the
+    queue. Scan modules use this to checkpoint long running scans. Errors
+    are logged and otherwise ignored.
+    """
+    def __init__(self, dsn, scan_id, logger=None):
+        self._dsn = dsn
+        self.scan_id = scan_id
+        self.logger = logger
+        self._conn = None
+
+    def write(self, updates):
+        try:
+            if self._conn is None or self._conn.closed:
+                self._conn = psycopg2.connect(self._dsn)
+                self._conn.autocommit = True
+            with self._conn.cursor() as c:
+                c.execute(_UPDATE_RESULT_QUERY, (Json(updates), self.scan_id))
+        except psycopg2.Error as e:
+            if self.logger is not None:
+                self.logger.warning('Could not save partial result: %s', e)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _build_patch_expression(patches):
+    """Return an SQL expression and its parameters applying the patches.
+
+    Top-level keys are merged at once, nested paths are set with
+    jsonb_set, so only the changed parts of the result are sent.
+    jsonb_set does nothing if the parent of the path is missing, so
+    missing ancestors are created as empty objects first.
+    """
+    top_level = {}
+    expression = 'result'
+    params = []
+    ancestors = {path[:i] for path, value in patches if value is not DELETED
+                 for i in range(1, len(path))}
+    for ancestor in sorted(ancestors, key=len):
+        ancestor = [str(key) for key in ancestor]
+        expression = ("jsonb_set({}, %s::text[], "
+                      "COALESCE(result #> %s::text[], '{{}}'::jsonb))").format(expression)
+        params += [ancestor, ancestor]
+    for path, value in patches:
+        if value is DELETED:
+            expression = '({} #- %s::text[])'.format(expression)
+            params.append([str(key) for key in path])
+        elif len(path) == 1:
+            top_level[path[0]] = value
+        else:
+            expression = 'jsonb_set({}, %s::text[], %s::jsonb)'.format(expression)
+            params += [[str(key) for key in path], Json(value)]
+    if top_level:
+        expression = '{} || %s::jsonb'.format(expression)
+        params.append(Json(top_level))
+    return expression, params
+
+
+def get_pending_sites(dsn, scan_module_name):
+    """Yield (site_url, redirect_chain) of all sites with pending jobs.
+
+    The redirect chain is None if it is not known yet.
+    """
+    conn = psycopg2.connect(dsn)
+    try:
+        # Use a server-side cursor, there might be a lot of pending jobs.
+        with conn.cursor(name='pending_sites') as c:
+            c.itersize = 10000
+            c.execute(_PENDING_SITES_QUERY, (scan_module_name,))
+            yield from c
+    finally:
+        conn.close()
@@ -2,16 +2,18 @@ import logging
 
 
 class WorkerWritePipeHandler(logging.Handler):
-    def __init__(self, pid, write_pipe, *args, **kwargs):
+    def __init__(self, pid, write_pipe, scan_id, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.pid = pid
         self.write_pipe = write_pipe
+        self.scan_id = scan_id
         fmt = '%(message)s (%(filename)s:%(lineno)d)'
         self.setFormatter(logging.Formatter(fmt))
 
     def emit(self, record):
         message = self.format(record)
-        self.write_pipe.send((self.pid, 'log', (record.created, record.levelno, message)))
+        self.write_pipe.send((self.pid, 'log', (self.scan_id, record.created,
+                                                record.levelno, message)))
 
 
 class ScanFileHandler(logging.FileHandler):
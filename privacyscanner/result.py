@@ -1,8 +1,24 @@
+from copy import deepcopy
+
+
+class _Deleted:
+    def __repr__(self):
+        return 'DELETED'
+
+    def __reduce__(self):
+        # Keep the identity when patches are sent to another process
+        return 'DELETED'
+
+
+# Value of a patch whose path has been deleted
+DELETED = _Deleted()
+
+
 class Result(object):
     def __init__(self, result_dict, file_handler):
         self._result_dict = result_dict
         self._file_handler = file_handler
-        self._updated_keys = set()
+        self._dirty_paths = set()
 
     def add_debug_file(self, filename, contents=None):
         self._file_handler.add_file(
@@ -21,47 +37,355 @@ class Result(object):
         return contents
 
     def __getitem__(self, key):
-        return self._result_dict[key]
+        return _track(self, (key,), False, self._result_dict[key])
 
     def __setitem__(self, key, value):
         self.mark_dirty(key)
-        self._result_dict[key] = value
+        self._result_dict[key] = unwrap(value)
+
+    def __delitem__(self, key):
+        self.mark_dirty(key)
+        del self._result_dict[key]
 
     def __contains__(self, key):
         return key in self._result_dict
 
     def get(self, key, d=None):
-        return self._result_dict.get(key, d)
+        if key not in self._result_dict:
+            return d
+        return self[key]
 
     def keys(self):
         return self._result_dict.keys()
 
     def values(self):
-        return self._result_dict.items()
+        return [self[key] for key in self._result_dict]
 
     def items(self):
-        return self._result_dict.items()
+        return [(key, self[key]) for key in self._result_dict]
 
-    def update(self, d, **kwargs):
-        if isinstance(d, dict):
-            for key in d:
-                self.mark_dirty(key)
-        else:
-            for key, _value in d:
-                self.mark_dirty(key)
-        for key in kwargs:
-            self.mark_dirty(key)
-        return self._result_dict.update(d, **kwargs)
+    def update(self, d=(), **kwargs):
+        d = dict(d, **kwargs)
+        for key in d:
+            self[key] = d[key]
 
-    def setdefault(self, key, d):
-        self.mark_dirty(key)
-        return self._result_dict.setdefault(key, d)
+    def setdefault(self, key, d=None):
+        if key not in self._result_dict:
+            self[key] = d
+        return self[key]
 
-    def mark_dirty(self, key):
-        self._updated_keys.add(key)
+    def mark_dirty(self, *path):
+        """Mark the value at path as changed.
+
+        Changes through result[key][...] are tracked automatically, so
+        this is only required if a nested value is changed through a
+        reference that has not been obtained from the result.
+        """
+        self._dirty_paths.add(path)
 
     def get_updates(self):
-        return {key: self._result_dict[key] for key in self._updated_keys}
+        """Return the changes as a list of (path, value) patches.
+
+        Paths whose ancestor has changed are left out, since they are
+        contained in the value of the ancestor. The value is DELETED if
+        the path does not exist anymore.
+        """
+        patches = []
+        for path in sorted(self._dirty_paths, key=len):
+            if any(path[:i] in self._dirty_paths for i in range(1, len(path))):
+                continue
+            patches.append((path, self._lookup(path)))
+        return patches
+
+    def apply_updates(self, patches):
+        """Apply patches as returned by get_updates() of another result.
+
+        The parents of all paths have to exist already.
+        """
+        for path, value in patches:
+            parent = self._result_dict
+            for key in path[:-1]:
+                parent = parent[key]
+            if value is DELETED:
+                if isinstance(parent, dict):
+                    parent.pop(path[-1], None)
+                elif path[-1] < len(parent):
+                    del parent[path[-1]]
+            else:
+                parent[path[-1]] = value
+            self.mark_dirty(*path)
+
+    def _lookup(self, path):
+        value = self._result_dict
+        for key in path:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return DELETED
+        return value
 
     def get_results(self):
         return self._result_dict
+
+
+def unwrap(value):
+    """Return value without change tracking.
+
+    Dicts and lists obtained from a result are copied into plain dicts and
+    lists. Plain dicts and lists are returned themselves, but tracked values
+    nested in them are replaced.
+    """
+    if isinstance(value, (_TrackedDict, _TrackedList)):
+        return deepcopy(value._data)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                unwrapped = unwrap(item)
+                if unwrapped is not item:
+                    value[key] = unwrapped
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                unwrapped = unwrap(item)
+                if unwrapped is not item:
+                    value[i] = unwrapped
+    return value
+
+
+def _track(result, path, whole, value):
+    """Return value wrapped as tracked dict or list.
+
+    The wrapper changes the stored value itself, so other references to
+    it see the changes. If whole is set, every change marks path itself
+    instead of the changed key.
+    """
+    if isinstance(value, dict):
+        return _TrackedDict(result, path, whole, value)
+    if isinstance(value, list):
+        return _TrackedList(result, path, whole, value)
+    return value
+
+
+class _TrackedDict(dict):
+    """Dict of a result that records changes at the path of the key.
+
+    Reads and writes go to the stored dict. The dict itself holds a copy,
+    so code that looks at the builtin storage directly still works.
+    """
+    def __init__(self, result, path, whole, data):
+        super().__init__(data)
+        self._result = result
+        self._path = path
+        self._whole = whole
+        self._data = data
+
+    def _mark_dirty(self, key):
+        if self._whole:
+            self._result.mark_dirty(*self._path)
+        else:
+            self._result.mark_dirty(*self._path, key)
+
+    def __getitem__(self, key):
+        path = self._path if self._whole else self._path + (key,)
+        return _track(self._result, path, self._whole, self._data[key])
+
+    def get(self, key, d=None):
+        if key not in self._data:
+            return d
+        return self[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        return self._data == unwrap(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return [self[key] for key in list(self._data)]
+
+    def items(self):
+        return [(key, self[key]) for key in list(self._data)]
+
+    def __setitem__(self, key, value):
+        value = unwrap(value)
+        self._data[key] = value
+        dict.__setitem__(self, key, value)
+        self._mark_dirty(key)
+
+    def __delitem__(self, key):
+        del self._data[key]
+        dict.pop(self, key, None)
+        self._mark_dirty(key)
+
+    def pop(self, key, *args):
+        if key in self._data:
+            self._mark_dirty(key)
+        dict.pop(self, key, None)
+        return self._data.pop(key, *args)
+
+    def popitem(self):
+        key, value = self._data.popitem()
+        dict.pop(self, key, None)
+        self._mark_dirty(key)
+        return key, value
+
+    def clear(self):
+        for key in list(self._data):
+            del self[key]
+
+    def update(self, d=(), **kwargs):
+        d = dict(d, **kwargs)
+        for key in d:
+            self[key] = d[key]
+
+    def setdefault(self, key, d=None):
+        if key not in self._data:
+            self[key] = d
+        return self[key]
+
+    def copy(self):
+        return self._data.copy()
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return deepcopy(self._data, memo)
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
+
+
+class _TrackedList(list):
+    """List of a result. Every change marks the whole list as changed,
+    since indexes are not stable when items are inserted or removed.
+    For the same reason, changes of items mark the whole list too.
+
+    Like _TrackedDict, it reads and writes the stored list.
+    """
+    def __init__(self, result, path, whole, data):
+        super().__init__(data)
+        self._result = result
+        self._path = path
+        self._whole = whole
+        self._data = data
+
+    def _mark_dirty(self):
+        list.__setitem__(self, slice(None), self._data)
+        self._result.mark_dirty(*self._path)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._data[index]
+        return _track(self._result, self._path, True, self._data[index])
+
+    def __iter__(self):
+        for i in range(len(self._data)):
+            yield self[i]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, value):
+        return value in self._data
+
+    def __eq__(self, other):
+        return self._data == unwrap(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def __add__(self, other):
+        return self._data + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self._data
+
+    def index(self, value, *args):
+        return self._data.index(value, *args)
+
+    def count(self, value):
+        return self._data.count(value)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [unwrap(item) for item in value]
+        else:
+            value = unwrap(value)
+        self._data[index] = value
+        self._mark_dirty()
+
+    def __delitem__(self, index):
+        del self._data[index]
+        self._mark_dirty()
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        self._data *= n
+        self._mark_dirty()
+        return self
+
+    def append(self, value):
+        self.extend([value])
+
+    def extend(self, values):
+        values = [unwrap(value) for value in values]
+        self._data.extend(values)
+        list.extend(self, values)
+        self._result.mark_dirty(*self._path)
+
+    def insert(self, index, value):
+        self._data.insert(index, unwrap(value))
+        self._mark_dirty()
+
+    def pop(self, index=-1):
+        value = self._data.pop(index)
+        self._mark_dirty()
+        return value
+
+    def remove(self, value):
+        self._data.remove(value)
+        self._mark_dirty()
+
+    def clear(self):
+        self._data.clear()
+        self._mark_dirty()
+
+    def sort(self, *args, **kwargs):
+        self._data.sort(*args, **kwargs)
+        self._mark_dirty()
+
+    def reverse(self):
+        self._data.reverse()
+        self._mark_dirty()
+
+    def copy(self):
+        return self._data.copy()
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return deepcopy(self._data, memo)
+
+    def __reduce__(self):
+        return list, (self.copy(),)
@@ -0,0 +1,81 @@
+import socket
+from typing import NamedTuple
+
+import psycopg2
+from psycopg2.extras import Json
+
+
+_GET_QUERY = """
+SELECT value, source, time_created
+FROM scanner_resultcache
+WHERE namespace = %s AND key = %s
+  AND time_created >= NOW() - %s * INTERVAL '1 second'
+"""
+
+_SET_QUERY = """
+INSERT INTO scanner_resultcache (namespace, key, value, source, time_created)
+VALUES (%s, %s, %s, %s, NOW())
+ON CONFLICT (namespace, key) DO UPDATE
+SET value = EXCLUDED.value,
+    source = EXCLUDED.source,
+    time_created = EXCLUDED.time_created
+"""
+
+
+class CachedResult(NamedTuple):
+    value: object
+    # Host of the worker that created the result
+    source: str
+    time_created: object
+
+
+class ResultCache:
+    """Cache of partial scan results in the queue database.
+
+    The cache is shared between all workers on all hosts. Entries are
+    grouped in namespaces (usually the name of the scan module) and are
+    only returned if they are younger than max_age seconds. Errors of
+    the database are treated as cache misses, so scans do not fail
+    because of the cache.
+    """
+    def __init__(self, dsn, namespace, max_age, logger=None):
+        self._dsn = dsn
+        self.namespace = namespace
+        self.max_age = max_age
+        self.logger = logger
+        self.source = socket.gethostname()
+        self._conn = None
+
+    def get(self, key):
+        try:
+            with self._cursor() as c:
+                c.execute(_GET_QUERY, (self.namespace, key, self.max_age))
+                row = c.fetchone()
+        except psycopg2.Error as e:
+            self._log_error('Could not get cached result', e)
+            return None
+        if row is None:
+            return None
+        return CachedResult(*row)
+
+    def set(self, key, value):
+        try:
+            with self._cursor() as c:
+                c.execute(_SET_QUERY, (self.namespace, key, Json(value), self.source))
+        except psycopg2.Error as e:
+            self._log_error('Could not cache result', e)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _cursor(self):
+        if self._conn is None or self._conn.closed:
+            self._conn = psycopg2.connect(self._dsn)
+            self._conn.autocommit = True
+        return self._conn.cursor()
+
+    def _log_error(self, message, exc):
+        if self.logger is not None:
+            self.logger.warning('%s: %s', message, exc)
@@ -1,7 +1,9 @@
 class ScanMeta:
-    def __init__(self, worker_id, num_tries):
+    def __init__(self, worker_id, num_tries, scan_id=None):
         self.worker_id = worker_id
         self.num_tries = num_tries
+        # Only known if the scan is run from the job queue
+        self.scan_id = scan_id
 
     @property
     def is_first_try(self):
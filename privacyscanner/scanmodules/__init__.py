@@ -21,6 +21,25 @@ class ScanModule:
     def scan_site(self, result, meta):
         raise NotImplemented
 
+    def scan_sites(self, sites):
+        """Scan a batch of sites.
+
+        sites is a list of (result, meta, logger) tuples. Returns a list
+        with the exception raised for every site or None if the scan of
+        the site succeeded. Scan modules which can scan several sites
+        at once override this; by default they are scanned one by one.
+        """
+        errors = []
+        for result, meta, logger in sites:
+            self.logger = logger
+            try:
+                self.scan_site(result, meta)
+            except Exception as e:
+                errors.append(e)
+            else:
+                errors.append(None)
+        return errors
+
     def update_dependencies(self):
         pass
 
@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from privacyscanner.filehandlers import NoOpFileHandler
 from privacyscanner.result import Result
 from privacyscanner.scanmodules import ScanModule
-from privacyscanner.scanmodules.chromedevtools.chromescan import ChromeScan, find_chrome_executable
+from privacyscanner.scanmodules.chromedevtools.chromescan import ChromeScan, ScanCancelled, \
+    SCAN_PROFILES, find_chrome_executable
 from privacyscanner.scanmodules.chromedevtools.extractors import FinalUrlExtractor, \
     GoogleAnalyticsExtractor, CookiesExtractor, RequestsExtractor, RedirectChainExtractor, \
     TLSDetailsExtractor, CertificateExtractor, ThirdPartyExtractor, InsecureContentExtractor, \
@@ -11,7 +13,8 @@ from privacyscanner.scanmodules.chromedevtools.extractors import FinalUrlExtract
     CookieStatsExtractor, JavaScriptLibsExtractor, ScreenshotExtractor, ImprintExtractor, \
     HSTSPreloadExtractor, FingerprintingExtractor
 from privacyscanner.scanmodules.chromedevtools.utils import TLDEXTRACT_CACHE_FILE, parse_domain
-from privacyscanner.utils import file_is_outdated, set_default_options, calculate_jaccard_index
+from privacyscanner.utils import file_is_outdated, set_default_options, MinHash
+from privacyscanner.utils.dnsresolver import configure_default_cache
 
 
 EXTRACTOR_CLASSES = [FinalUrlExtractor, RedirectChainExtractor, GoogleAnalyticsExtractor,
@@ -36,39 +39,93 @@ class ChromeDevtoolsScanModule(ScanModule):
             options['chrome_executable'] = find_chrome_executable()
         set_default_options(options, {
             'disable_javascript': False,
-            'https_same_content_threshold': 0.9
+            'https_same_content_threshold': 0.9,
+            # Number of token hashes kept for the content signature, which
+            # is used to estimate the similarity of two pages.
+            'content_signature_size': 128,
+            # Run the HTTPS scan of HTTP sites in parallel to the HTTP scan
+            # in a second browser instead of afterwards. The second browser
+            # listens on the debugging port of the first one plus the offset.
+            'parallel_https_scan': False,
+            'parallel_https_port_offset': 1000,
+            # The lite profile answers requests for the resource types
+            # below with an empty body instead of downloading them.
+            'scan_profile': 'full',
+            'lite_stub_resource_types': ['Image', 'Font', 'Media']
         })
+        if options['scan_profile'] not in SCAN_PROFILES:
+            raise ValueError('Invalid scan profile: `{}`.'.format(options['scan_profile']))
         super().__init__(options)
         cache_file = self.options['storage_path'] / TLDEXTRACT_CACHE_FILE
         parse_domain.cache_file = str(cache_file)
+        configure_default_cache(self.options)
 
     def scan_site(self, result, meta):
-        chrome_scan = ChromeScan(EXTRACTOR_CLASSES)
         debugging_port = self.options.get('start_port', 9222) + meta.worker_id
-        content = chrome_scan.scan(result, self.logger, self.options, meta, debugging_port)
-        if not result['reachable']:
-            return
-        result['https']['same_content'] = None
-        result['https']['same_content_score'] = None
-        if result['site_url'].startswith('http://') and not result['https']['redirects_secure']:
+        is_http = result['site_url'].startswith('http://')
+        https_scan = None
+        executor = None
+        if is_http and self.options['parallel_https_scan']:
+            # We do not know yet whether the site redirects to HTTPS, so
+            # we speculatively start the HTTPS scan right away. It will
+            # be cancelled if it turns out that we do not need it.
+            https_scan = ChromeScan(EXTRACTOR_CLASSES_HTTPS_RUN)
+            executor = ThreadPoolExecutor(max_workers=1)
+            https_future = executor.submit(
+                self._scan_https, https_scan, result['site_url'], meta,
+                debugging_port + self.options['parallel_https_port_offset'])
+        try:
+            chrome_scan = ChromeScan(EXTRACTOR_CLASSES)
+            content = chrome_scan.scan(result, self.logger, self.options, meta, debugging_port)
+            if not result['reachable']:
+                return
+            content_minhash = self._get_minhash(content)
+            # The signature allows to detect unchanged pages across rescans
+            # of the same site without storing the page itself.
+            result['content_signature'] = content_minhash.serialize()
+            result['https']['same_content'] = None
+            result['https']['same_content_score'] = None
+            if not is_http or result['https']['redirects_secure']:
+                return
             # Lets do another scan with https but with limited extractors.
             # We use this to annotate the http result with TLS details and
             # insecure content details if there is not redirect to https
-            site_url = 'https://' + result['site_url'][len('http://'):]
-            extra_result = Result({'site_url': site_url}, NoOpFileHandler())
-            chrome_scan = ChromeScan(EXTRACTOR_CLASSES_HTTPS_RUN)
+            if https_scan is None:
+                extra_result, https_content = self._scan_https(
+                    ChromeScan(EXTRACTOR_CLASSES_HTTPS_RUN), result['site_url'], meta,
+                    debugging_port)
+            else:
+                extra_result, https_content = https_future.result()
+        finally:
+            if executor is not None:
+                https_scan.cancel()
+                executor.shutdown(wait=True)
+        if not extra_result['reachable']:
+            return
+        similarity = content_minhash.similarity(self._get_minhash(https_content))
+        same_content = similarity >= self.options['https_same_content_threshold']
+        if same_content:
+            result['insecure_content'] = extra_result['insecure_content']
+            result['https'] = extra_result['https']
+            result['https']['redirects_secure'] = False
+        result['https']['same_content_score'] = similarity
+        result['https']['same_content'] = same_content
+
+    def _get_minhash(self, content):
+        minhash = MinHash(self.options['content_signature_size'])
+        minhash.update(content)
+        return minhash
+
+    def _scan_https(self, chrome_scan, site_url, meta, debugging_port):
+        site_url = 'https://' + site_url[len('http://'):]
+        extra_result = Result({'site_url': site_url}, NoOpFileHandler())
+        try:
             https_content = chrome_scan.scan(extra_result, self.logger, self.options, meta,
                                              debugging_port)
-            if not extra_result['reachable']:
-                return
-            similarity = calculate_jaccard_index(content, https_content)
-            same_content = similarity >= self.options['https_same_content_threshold']
-            if same_content:
-                result['insecure_content'] = extra_result['insecure_content']
-                result['https'] = extra_result['https']
-                result['https']['redirects_secure'] = False
-            result['https']['same_content_score'] = similarity
-            result['https']['same_content'] = same_content
+        except ScanCancelled:
+            self.logger.info('HTTPS scan cancelled, since it is not required.')
+            return None, None
+        return extra_result, https_content
 
     def update_dependencies(self):
         max_age = 14 * 24 * 3600
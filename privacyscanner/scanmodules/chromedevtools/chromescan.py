@@ -179,6 +179,8 @@ EXTRACT_ARGUMENTS_JAVASCRIPT = '''
 # See comments in ON_NEW_DOCUMENT_JAVASCRIPT
 ON_NEW_DOCUMENT_JAVASCRIPT_LINENO = 7
 
+SCAN_PROFILES = ('full', 'lite')
+
 
 class ChromeBrowserStartupError(Exception):
     pass
@@ -192,6 +194,10 @@ class DNSNotResolvedError(Exception):
     pass
 
 
+class ScanCancelled(Exception):
+    pass
+
+
 class ChromeBrowser:
     def __init__(self, debugging_port=9222, chrome_executable=None):
         self._debugging_port = debugging_port
@@ -243,10 +249,20 @@ class ChromeBrowser:
 class ChromeScan:
     def __init__(self, extractor_classes):
         self._extractor_classes = extractor_classes
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Abort a scan running in another thread.
+
+        The scan will raise ScanCancelled as soon as it notices.
+        """
+        self._cancel_event.set()
 
     def scan(self, result, logger, options, meta, debugging_port=9222):
+        if self._cancel_event.is_set():
+            raise ScanCancelled('Scan was cancelled before it started.')
         executable = options['chrome_executable']
-        scanner = PageScanner(self._extractor_classes)
+        scanner = PageScanner(self._extractor_classes, self._cancel_event)
         chrome_error = None
         content = None
         with ChromeBrowser(debugging_port, executable) as browser:
@@ -275,12 +291,14 @@ class ChromeScan:
 
 
 class PageScanner:
-    def __init__(self, extractor_classes):
+    def __init__(self, extractor_classes, cancel_event=None):
         self._extractor_classes = extractor_classes
+        self._cancel_event = cancel_event
         self._page_loaded = threading.Event()
         self._reset()
 
     def scan(self, browser, result, logger, options):
+        self._logger = logger
         self._tab = browser.new_tab()
         self._tab.start()
 
@@ -306,6 +324,16 @@ class PageScanner:
         self._register_network_callbacks()
         self._tab.Network.enable()
 
+        if options['scan_profile'] == 'lite':
+            # We let Chrome send the request and receive the response
+            # headers, so that requests, cookies and the like are the same
+            # as for the full profile. However, we answer the request
+            # with an empty body instead of downloading it.
+            self._fetch_patterns = [{'resourceType': resource_type, 'requestStage': 'Response'}
+                                    for resource_type in options['lite_stub_resource_types']]
+            self._tab.Fetch.requestPaused = self._cb_request_paused
+            self._tab.Fetch.enable(patterns=self._fetch_patterns)
+
         self._register_security_callbacks()
         self._tab.Security.enable()
         self._tab.Security.setIgnoreCertificateErrors(ignore=True)
@@ -343,7 +371,7 @@ class PageScanner:
         # We wait for the page to be loaded. Then we wait until we have the
         # page in a stable state, i.e. not changing the URL anymore.
         load_max_wait = 30
-        self._page_loaded.wait(load_max_wait)
+        self._wait(self._page_loaded, load_max_wait)
         has_responses = bool(self._page.response_log)
         if has_responses:
             total_wait = 60
@@ -352,12 +380,12 @@ class PageScanner:
                 # If the document was changed, we have to wait for the page to
                 # load again. This will not wait if there was no change,
                 # because page_loaded event is already set.
-                self._page_loaded.wait(load_max_wait)
+                self._wait(self._page_loaded, load_max_wait)
                 self._page_interaction()
                 # We wait 15 seconds after the page has loaded, so that any
                 # resources can load. This includes JavaScript which might
                 # issue further requests.
-                if not self._document_will_change.wait(CHANGE_WAIT_TIME):
+                if not self._wait(self._document_will_change, CHANGE_WAIT_TIME):
                     # OK, our page should be stable now. So we will disable any
                     # further requests by just intercepting them and not
                     # taking care of them.
@@ -367,9 +395,7 @@ class PageScanner:
                         if self._document_will_change.is_set():
                             # It changed again, so yet another loop :-(
                             continue
-                        self._tab.Network.setRequestInterception(patterns=[{
-                            'resourceType': 'Document'
-                        }])
+                        self._block_document_requests()
                     break
                 # We will only run this "infinite" loop for up to total_wait
                 # seconds. If the document changes over and over again, there
@@ -407,12 +433,30 @@ class PageScanner:
             self._extract_information()
         self._tab.Network.disable()
         self._tab.Security.disable()
+        if self._fetch_patterns is not None:
+            self._tab.Fetch.disable()
+            logger.info('Stubbed %d response bodies.', self._num_stubbed_responses)
         self._tab.stop()
         browser.close_tab(self._tab)
         self._reset()
 
         return content
 
+    def _wait(self, event, timeout):
+        # Behaves like event.wait(timeout), but gives up early with
+        # ScanCancelled if someone cancels the scan in the meantime.
+        if self._cancel_event is None:
+            return event.wait(timeout)
+        deadline = time.time() + timeout
+        while not event.is_set():
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            if self._cancel_event.wait(min(remaining, 0.25)):
+                self._reset()
+                raise ScanCancelled('Scan was cancelled.')
+        return event.is_set()
+
     def _cb_request_will_be_sent(self, request, requestId, **kwargs):
         # To avoid reparsing the URL in many places, we parse them all here
         request['parsed_url'] = urlparse(request['url'])
@@ -430,6 +474,7 @@ class PageScanner:
         else:
             request['post_data'] = None
         self._page.add_request(request)
+        self._dispatch_event('on_request', request)
 
         # Redirect requests don't have a received response but issue another
         # "request will be sent" event with a redirectResponse key.
@@ -445,6 +490,50 @@ class PageScanner:
         response['headers_lower'] = headers_lower
         response['extra'] = kwargs
         self._page.add_response(response)
+        self._dispatch_event('on_response', response)
+
+    def _cb_request_paused(self, requestId, resourceType, responseStatusCode=None,
+                           responseHeaders=None, responseErrorReason=None, **kwargs):
+        if responseErrorReason is not None:
+            # The request failed, so there is no response to stub. Let it
+            # fail with the same reason to get the usual loadingFailed.
+            self._tab.Fetch.failRequest(requestId=requestId,
+                                        errorReason=responseErrorReason)
+            return
+        if responseStatusCode is None:
+            if resourceType == 'Document':
+                # This is a paused document request after the page has become
+                # stable. By not continuing it we prevent any navigation.
+                return
+            self._tab.Fetch.continueRequest(requestId=requestId)
+            return
+        if 300 <= responseStatusCode < 400:
+            # Let Chrome follow redirects as usual.
+            self._tab.Fetch.continueRequest(requestId=requestId)
+            return
+        # The headers of the body we do not send must not be kept
+        headers = [header for header in responseHeaders or []
+                   if header['name'].lower() not in ('content-length', 'content-encoding')]
+        self._tab.Fetch.fulfillRequest(requestId=requestId,
+                                       responseCode=responseStatusCode,
+                                       responseHeaders=headers,
+                                       body='')
+        self._num_stubbed_responses += 1
+
+    def _block_document_requests(self):
+        # We disable any further requests that change the document by just
+        # intercepting them and not taking care of them.
+        if self._fetch_patterns is None:
+            self._tab.Network.setRequestInterception(patterns=[{
+                'resourceType': 'Document'
+            }])
+        else:
+            # Chrome does not allow to mix the interception of the Network
+            # domain with the Fetch domain.
+            self._tab.Fetch.enable(patterns=self._fetch_patterns + [{
+                'resourceType': 'Document',
+                'requestStage': 'Request'
+            }])
 
     def _cb_script_parsed(self, **script):
         # The first script loaded is our script we set via the method
@@ -510,6 +599,7 @@ class PageScanner:
 
     def _cb_loading_failed(self, **failed_request):
         self._page.add_failed_request(failed_request)
+        self._dispatch_event('on_failed', failed_request)
 
     def _register_network_callbacks(self):
         self._tab.Network.requestWillBeSent = self._cb_request_will_be_sent
@@ -575,6 +665,17 @@ class PageScanner:
         for extractor in self._extractors:
             extractor.receive_log(log_type, message, call_stack)
 
+    def _dispatch_event(self, hook_name, event):
+        for extractor in self._extractors:
+            try:
+                getattr(extractor, hook_name)(event)
+            except Exception:
+                # An exception would otherwise silently kill the event
+                # handling of the tab. The extractor will see the event
+                # again in extract_information() anyway.
+                self._logger.exception('%s.%s failed.', extractor.__class__.__name__,
+                                       hook_name)
+
     def _register_javascript(self):
         for extractor in self._extractors:
             extra_javascript = extractor.register_javascript()
@@ -588,6 +689,9 @@ class PageScanner:
         self._debugger_paused = threading.Event()
         self._log_breakpoint = None
         self._page = None
+        self._logger = None
+        self._fetch_patterns = None
+        self._num_stubbed_responses = 0
         self._extractors = []
         self._extra_scripts = []
 
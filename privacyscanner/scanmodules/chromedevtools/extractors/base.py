@@ -12,5 +12,21 @@ class Extractor:
     def receive_log(self, log_type, message, call_stack):
         pass
 
+    # The following hooks are called while the page is still loading, i.e.,
+    # as soon as Chrome reports the corresponding event. Extractors can
+    # use them to do expensive work during the time we are waiting for
+    # the page to settle anyway. Keep in mind that they are called from
+    # the event handling thread of the tab and that extract_information()
+    # still has to aggregate the final result.
+
+    def on_request(self, request):
+        pass
+
+    def on_response(self, response):
+        pass
+
+    def on_failed(self, failed_request):
+        pass
+
     def register_javascript(self):
         pass
@@ -1,7 +1,7 @@
 from base64 import b64decode
 
 from privacyscanner.scanmodules.chromedevtools.extractors.base import Extractor
-from privacyscanner.utils.tls import get_certificate_info
+from privacyscanner.utils.tls import get_certificate_info, get_chain_info
 
 
 class CertificateExtractor(Extractor):
@@ -17,3 +17,5 @@ class CertificateExtractor(Extractor):
                 self.result['https']['has_tls'] = True
             cert_der = b64decode(cert_chain[0])
             self.result['https']['certificate'] = get_certificate_info(cert_der)
+            self.result['https']['intermediate_certificates'] = get_chain_info(
+                b64decode(cert) for cert in cert_chain[1:])
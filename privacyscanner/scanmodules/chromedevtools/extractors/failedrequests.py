@@ -4,12 +4,18 @@ import dns.resolver
 
 from privacyscanner.scanmodules.chromedevtools.extractors.base import Extractor
 from privacyscanner.scanmodules.chromedevtools.utils import parse_domain
+from privacyscanner.utils.dnsresolver import CachingResolver, run_with_deadline
+
+
+# Total time in seconds we spend on checking whether domains are registered.
+DNS_TIMEOUT_BUDGET = 5
 
 
 class FailedRequestsExtractor(Extractor):
     def extract_information(self):
         requests_lookup = {request['requestId']: request for request in self.page.request_log}
         failed_requests = []
+        unresolved_errors = []
         for failed_request in self.page.failed_request_log:
             error_text = failed_request['errorText']
             valid_errors = ('net::ERR_CACHE_MISS', 'net::ERR_ABORTED')
@@ -19,6 +25,7 @@ class FailedRequestsExtractor(Extractor):
                 # not considered failed.
                 continue
             extra = None
+            unresolved_domain = None
             try:
                 request = requests_lookup[failed_request['requestId']]
             except KeyError:
@@ -33,24 +40,9 @@ class FailedRequestsExtractor(Extractor):
                 # absence of a SOA record for the domain itself, i.e.,
                 # not the netloc of the URL. Unregistered domains
                 # should have no SOA entry, while registered should.
-                domain = parse_domain(request['url']).registered_domain
-                try:
-                    dns.resolver.query(domain, 'SOA')
-                    domain_registered = True
-                # If we have a timeout, we better don't say anything about
-                # this domain rather than giving a wrong impressing wether
-                # the domain is registered or net
-                except dns.resolver.Timeout:
-                    domain_registered = None
-                # Nameservers behave weird, if the domain is not registered.
-                # Some send NXDOMAIN as expected, others prefer to give an
-                # answer but do not include a SOA entry in the response.
-                # Sometimes all nameservers do not like to answer if the
-                # domain is not registered. It is a real mess.
-                except (dns.resolver.NXDOMAIN, dns.resolver.NoNameservers,
-                        dns.resolver.NoAnswer):
-                    domain_registered = False
-                extra = {'domain_registered': domain_registered}
+                unresolved_domain = parse_domain(request['url']).registered_domain
+                # Will be filled in once all domains have been checked.
+                extra = {'domain_registered': None}
             elif 'net::ERR_' in error_text:
                 error_type = 'unknown'
                 match = re.search('net::ERR_([^\s])+', error_text)
@@ -66,5 +58,43 @@ class FailedRequestsExtractor(Extractor):
                 error.update(extra)
             if error_type == 'unknown':
                 error['error_text'] = error_text
+            if unresolved_domain is not None:
+                unresolved_errors.append((unresolved_domain, error))
             failed_requests.append(error)
+
+        # Many failed requests usually belong to a few domains, so we check
+        # every domain only once and all of them concurrently.
+        domains_registered = self._check_domains_registered(
+            {domain for domain, _error in unresolved_errors})
+        for domain, error in unresolved_errors:
+            error['domain_registered'] = domains_registered[domain]
         self.result['failed_requests'] = failed_requests
+
+    def _check_domains_registered(self, domains):
+        timeout = self.options.get('FailedRequestsExtractor.dns_timeout', DNS_TIMEOUT_BUDGET)
+        resolver = CachingResolver(lifetime=timeout)
+
+        async def is_registered(domain):
+            try:
+                await resolver.resolve(domain, 'SOA')
+                return True
+            # If we have a timeout, we better don't say anything about
+            # this domain rather than giving a wrong impressing wether
+            # the domain is registered or net
+            except dns.resolver.Timeout:
+                return None
+            # Nameservers behave weird, if the domain is not registered.
+            # Some send NXDOMAIN as expected, others prefer to give an
+            # answer but do not include a SOA entry in the response.
+            # Sometimes all nameservers do not like to answer if the
+            # domain is not registered. It is a real mess.
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoNameservers,
+                    dns.resolver.NoAnswer):
+                return False
+
+        # Domains that could not be checked within our time budget are
+        # treated like timeouts.
+        registered = run_with_deadline({domain: is_registered(domain) for domain in domains},
+                                       timeout, default=None)
+        resolver.log_statistics(self.logger)
+        return registered
@@ -20,7 +20,6 @@ class HSTSPreloadExtractor(Extractor):
             'is_preloaded': False
         }
         self.result['https']['hsts_preload'] = hsts_preload
-        self.result.mark_dirty('https')
 
         if _hsts_lookup is None:
             lookup_file = self.options['storage_path'] / 'hsts.json'
@@ -1,6 +1,17 @@
+import re
+from base64 import b64decode, b64encode
+from collections.abc import Mapping
+
 from privacyscanner.scanmodules.chromedevtools.extractors.base import Extractor
 
 
+COLUMNAR_FORMAT = 'columnar-v1'
+
+_BOOLEAN_COLUMNS = ('sets_cookie', 'is_thirdparty', 'is_tracker')
+_HEADER_COLUMNS = ('request_headers', 'response_headers')
+_URL_ORIGIN = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://[^/?#]*')
+
+
 class RequestsExtractor(Extractor):
     def extract_information(self):
         requests = []
@@ -31,6 +42,11 @@ class RequestsExtractor(Extractor):
                 request_dict['request_headers'] = request["headers"]
                 request_dict['response_headers'] = response["headers"]
             requests.append(request_dict)
+        # The columnar encoding is much smaller for sites with many requests,
+        # but consumers have to expand it with decode_requests().
+        # To enable it, set {'chromedevtools': {'RequestsExtractor.columnar': True}}
+        if self.options.get('RequestsExtractor.columnar', False):
+            requests = encode_requests(requests)
         self.result['requests'] = requests
 
     @staticmethod
@@ -38,3 +54,137 @@ class RequestsExtractor(Extractor):
         if response is None:
             return False
         return 'set-cookie' in response['headers_lower']
+
+
+def encode_requests(requests):
+    """Encode a list of requests as parallel columns.
+
+    Origins of URLs, MIME types, status texts and headers are stored as
+    indexes into a string table, booleans are packed into bitsets.
+    """
+    strings = _StringTable()
+    columns = {
+        'url_origin': [],
+        'url_rest': [],
+        'mime_type': [],
+        'status_code': [],
+        'status_text': [],
+    }
+    for request in requests:
+        match = _URL_ORIGIN.match(request['url'])
+        origin = match.group(0) if match else ''
+        columns['url_origin'].append(strings.add(origin))
+        columns['url_rest'].append(request['url'][len(origin):])
+        columns['mime_type'].append(strings.add(request['mime_type']))
+        columns['status_code'].append(request['status_code'])
+        columns['status_text'].append(strings.add(request['status_text']))
+    for key in _BOOLEAN_COLUMNS:
+        if any(key in request for request in requests):
+            columns[key] = _encode_booleans([request.get(key) for request in requests])
+    for key in _HEADER_COLUMNS:
+        if any(key in request for request in requests):
+            columns[key] = [_encode_headers(request.get(key), strings) for request in requests]
+    return {
+        'format': COLUMNAR_FORMAT,
+        'count': len(requests),
+        'strings': strings.strings,
+        'columns': columns,
+    }
+
+
+def decode_requests(requests):
+    """Return the requests as list of dicts.
+
+    Accepts the columnar encoding as well as the plain list, so it can
+    be used for all results.
+    """
+    if not isinstance(requests, Mapping):
+        return list(requests)
+    if requests.get('format') != COLUMNAR_FORMAT:
+        raise ValueError('Invalid requests format: `{}`.'.format(requests.get('format')))
+    strings = requests['strings']
+    columns = requests['columns']
+    count = requests['count']
+    booleans = {key: _decode_booleans(columns[key], count)
+                for key in _BOOLEAN_COLUMNS if key in columns}
+    decoded = []
+    for i in range(count):
+        request = {
+            'url': strings[columns['url_origin'][i]] + columns['url_rest'][i],
+            'sets_cookie': booleans['sets_cookie'][i],
+            'mime_type': _lookup(strings, columns['mime_type'][i]),
+            'status_code': columns['status_code'][i],
+            'status_text': _lookup(strings, columns['status_text'][i]),
+        }
+        for key in _BOOLEAN_COLUMNS[1:]:
+            if key in booleans and booleans[key][i] is not None:
+                request[key] = booleans[key][i]
+        for key in _HEADER_COLUMNS:
+            if key in columns and columns[key][i] is not None:
+                request[key] = _decode_headers(columns[key][i], strings)
+        decoded.append(request)
+    return decoded
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings = []
+        self._indexes = {}
+
+    def add(self, string):
+        if string is None:
+            return None
+        index = self._indexes.get(string)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(string)
+            self._indexes[string] = index
+        return index
+
+
+def _lookup(strings, index):
+    return strings[index] if index is not None else None
+
+
+def _encode_booleans(values):
+    """Pack booleans into a base64 encoded bitset.
+
+    None values (key not present) are recorded in a second bitset, which
+    is only stored if there are any.
+    """
+    bits = bytearray((len(values) + 7) // 8)
+    missing = bytearray(len(bits))
+    for i, value in enumerate(values):
+        if value is None:
+            missing[i // 8] |= 1 << (i % 8)
+        elif value:
+            bits[i // 8] |= 1 << (i % 8)
+    column = {'bits': b64encode(bits).decode()}
+    if any(missing):
+        column['missing'] = b64encode(missing).decode()
+    return column
+
+
+def _decode_booleans(column, count):
+    bits = b64decode(column['bits'])
+    missing = b64decode(column['missing']) if 'missing' in column else None
+    values = []
+    for i in range(count):
+        if missing is not None and missing[i // 8] & (1 << (i % 8)):
+            values.append(None)
+        else:
+            values.append(bool(bits[i // 8] & (1 << (i % 8))))
+    return values
+
+
+def _encode_headers(headers, strings):
+    if headers is None:
+        return None
+    encoded = []
+    for name, value in headers.items():
+        encoded += [strings.add(name), strings.add(value)]
+    return encoded
+
+
+def _decode_headers(encoded, strings):
+    return {strings[encoded[i]]: strings[encoded[i + 1]] for i in range(0, len(encoded), 2)}
@@ -3,6 +3,12 @@ from privacyscanner.scanmodules.chromedevtools.extractors.base import Extractor
 
 
 class ThirdPartyExtractor(Extractor):
+    def on_request(self, request):
+        # Parsing the domain is the expensive part, so we do it while
+        # the page is still loading. Whether the request is a third-party
+        # request can only be decided once the final URL is known.
+        request['extracted_url'] = parse_domain(request['url'])
+
     def extract_information(self):
         third_parties = {
             'fqdns': set(),
@@ -15,7 +21,9 @@ class ThirdPartyExtractor(Extractor):
             first_party_domains.add(extracted.registered_domain)
         for request in self.page.request_log:
             request['is_thirdparty'] = False
-            extracted_url = parse_domain(request['url'])
+            extracted_url = request.get('extracted_url')
+            if extracted_url is None:
+                extracted_url = parse_domain(request['url'])
             parsed_url = request['parsed_url']
             if extracted_url.registered_domain in first_party_domains:
                 continue
@@ -15,34 +15,54 @@ _adblock_rules_cache = None
 
 
 class TrackerDetectExtractor(Extractor):
+    def __init__(self, page, result, logger, options):
+        super().__init__(page, result, logger, options)
+        self.rules = None
+        self._blacklist = set()
+        # Registered domains that are known to be first-party so far
+        self._first_party_domains = {parse_domain(result['site_url']).registered_domain}
+        self._main_frame_id = None
+
+    def on_request(self, request):
+        # Matching against the adblock rules is expensive, so we do it
+        # while the page is still loading. We do not know yet which
+        # requests are third-party requests, because the final URL is not
+        # known yet. However, the final URL is the target of a navigation
+        # of the main frame, so requests to the domains of the site URL
+        # and of these navigations are never matched here. Whether the
+        # others are third-party requests is checked afterwards.
+        if request['url'].startswith('data:'):
+            return
+        # ThirdPartyExtractor has usually parsed the domain already.
+        extracted = request.get('extracted_url') or parse_domain(request['url'])
+        extra = request.get('extra', {})
+        if extra.get('type') == 'Document':
+            if self._main_frame_id is None:
+                self._main_frame_id = extra.get('frameId')
+            if extra.get('frameId') == self._main_frame_id:
+                self._first_party_domains.add(extracted.registered_domain)
+        if extracted.registered_domain in self._first_party_domains:
+            return
+        request['matches_tracker'] = self._match(request)
+
     def extract_information(self):
-        self._load_rules()
         trackers_fqdn = set()
         trackers_domain = set()
         num_tracker_requests = 0
-        blacklist = set()
-        num_evaluations = 0
         for request in self.page.request_log:
             request['is_tracker'] = False
             if not request['is_thirdparty'] or request['url'].startswith('data:'):
                 continue
-            is_tracker = request['parsed_url'].netloc in blacklist
-            if not is_tracker:
-                # Giving only the first 150 characters of an URL is
-                # sufficient to get good matches, so this will speed
-                # up checking quite a bit!
-                match_result = self.rules.match(request['url'][:150],
-                                                request['document_url'])
-                is_tracker = match_result.is_match
-                num_evaluations += 1
+            is_tracker = request.get('matches_tracker')
+            if is_tracker is None:
+                is_tracker = self._match(request)
             if is_tracker:
                 request['is_tracker'] = True
-                extracted = parse_domain(request['url'])
+                extracted = request.get('extracted_url') or parse_domain(request['url'])
                 if extracted.fqdn:
                     trackers_fqdn.add(extracted.fqdn)
                 trackers_domain.add(extracted.registered_domain)
                 num_tracker_requests += 1
-                blacklist.add(request['parsed_url'].netloc)
 
         num_tracker_cookies = 0
         for cookie in self.result['cookies']:
@@ -65,9 +85,26 @@ class TrackerDetectExtractor(Extractor):
             'num_tracker_cookies': num_tracker_cookies
         }
 
+    def _match(self, request):
+        netloc = request['parsed_url'].netloc
+        if netloc in self._blacklist:
+            return True
+        self._load_rules()
+        # Giving only the first 150 characters of an URL is
+        # sufficient to get good matches, so this will speed
+        # up checking quite a bit!
+        match_result = self.rules.match(request['url'][:150],
+                                        request['document_url'])
+        if match_result.is_match:
+            self._blacklist.add(netloc)
+        return match_result.is_match
+
     def _load_rules(self):
         global _adblock_rules_cache
 
+        if self.rules is not None:
+            return
+
         if _adblock_rules_cache is not None:
             self.rules = _adblock_rules_cache
             return
@@ -1,20 +1,63 @@
-import sys
+import asyncio
+import os
 import tarfile
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 from dns import resolver, reversename
 from dns.exception import DNSException
 from geoip2.database import Reader
 from geoip2.errors import AddressNotFoundError
+from maxminddb import MODE_MMAP, MODE_MMAP_EXT
 
 from privacyscanner.scanmodules import ScanModule
 from privacyscanner.scanmodules.chromedevtools import parse_domain, TLDEXTRACT_CACHE_FILE
 from privacyscanner.utils import set_default_options, copy_to, download_file, file_is_outdated
+from privacyscanner.utils.dnsresolver import CachingResolver, run_with_deadline, \
+    configure_default_cache
 
 GEOIP_DATABASE_PATH = Path('GeoIP/GeoLite2-Country.mmdb')
 GEOIP_DOWNLOAD_URL = 'https://download.maxmind.com/app/geoip_download?edition_id=GeoLite2-Country&license_key={license_key}&suffix=tar.gz'
 GEOIP_MAX_AGE = 3 * 24 * 3600
+GEOIP_CACHE_SIZE = 65536
+
+_geoip_lookup = None
+
+
+class GeoIPLookup:
+    """Country lookups of IP addresses with an LRU cache.
+
+    The database is memory-mapped, so all workers on a host share the
+    same copy of it in the page cache.
+    """
+    def __init__(self, database_path, cache_size=GEOIP_CACHE_SIZE):
+        self.database_path = database_path
+        try:
+            self._reader = Reader(str(database_path), mode=MODE_MMAP_EXT)
+        except ValueError:
+            # The C extension of maxminddb is not available
+            self._reader = Reader(str(database_path), mode=MODE_MMAP)
+        self.lookup = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def _lookup(self, ip):
+        try:
+            geo_result = self._reader.country(ip)
+        except AddressNotFoundError:
+            return None, None
+        return geo_result.country.name, geo_result.continent.name
+
+    def lookup_many(self, addresses):
+        """Return a dict mapping every address to (country, continent)."""
+        return {ip: self.lookup(ip) for ip in set(addresses)}
+
+
+def get_geoip_lookup(database_path):
+    global _geoip_lookup
+
+    if _geoip_lookup is None or _geoip_lookup.database_path != database_path:
+        _geoip_lookup = GeoIPLookup(database_path)
+    return _geoip_lookup
 
 
 class DNSScanModule(ScanModule):
@@ -27,6 +70,17 @@ class DNSScanModule(ScanModule):
             'geoip_download_url': GEOIP_DOWNLOAD_URL,
             'geoip_max_age': GEOIP_MAX_AGE,
             'geoip_license_key': None,
+            # Maximum number of DNS queries in flight at the same time
+            'max_concurrent_queries': 16,
+            # Maximum number of seconds for all DNS queries of a scan
+            'timeout': 30,
+            # Same as above, but for prefetching the records of many sites
+            'prefetch_concurrent_queries': 500,
+            'prefetch_timeout': 3600,
+            # Minimum number of seconds prefetched records are cached.
+            # Many records have a TTL of a few minutes, which often runs
+            # out before the scans of the sites are started.
+            'prefetch_min_ttl': 6 * 3600,
         })
         super().__init__(options)
         cache_file = self.options['storage_path'] / TLDEXTRACT_CACHE_FILE
@@ -36,34 +90,26 @@ class DNSScanModule(ScanModule):
         except KeyError:
             geoip_path = self.options['storage_path'] / GEOIP_DATABASE_PATH
         self.options['geoip_database_path'] = geoip_path
-        self._geoip_reader = None
+        configure_default_cache(self.options)
+        self._resolver = None
+        self._semaphore = None
 
     def scan_site(self, result, meta):
         self._warn_geoip_availability()
-        dns = {}
 
-        # Fetch MX records
-        p = parse_domain(result['site_url'])
-        mail_domain = p.fqdn[len('www.'):] if p.fqdn.startswith('www.') else p.fqdn
-        mx_records = self._get_mx_records(mail_domain)
-
-        # Create a list for which we fetch A/AAAA records
-        domain_list = {mail_domain}
         # If the site is not reachable, we do not have a redirect chain.
         # Nonetheless, we try to get as much information as possible without it.
-        if 'redirect_chain' in result:
-            domain_list.update(parse_domain(url).fqdn for url in result['redirect_chain'])
-        if mx_records is not None:
-            domain_list.update(record['host'] for record in mx_records)
-
-        # Fetch A/AAAA records and reverse (PTR)
-        for url in domain_list:
-            p = parse_domain(url)
-            records = dns.setdefault(p.fqdn, {})
-            records['A'] = self._get_dns_records(p.fqdn, 'A')
-            records['AAAA'] = self._get_dns_records(p.fqdn, 'AAAA')
-
-        dns.setdefault(mail_domain, {})['MX'] = mx_records
+        site = self._prepare_site(result['site_url'], result.get('redirect_chain'))
+        dns, mail_domain, domain_list = site
+        self._resolver = CachingResolver()
+        finished = run_with_deadline({
+            'dns': self._resolve_sites([site], self.options['max_concurrent_queries'])
+        }, self.options['timeout'], default=False)['dns']
+        if not finished:
+            self.logger.warning('Could not resolve all DNS records within %s seconds.',
+                                self.options['timeout'])
+        self._resolver.log_statistics(self.logger)
+        self._annotate_geoip(dns)
 
         # If there is neither an A/AAAA record nor an MX record it makes no
         # sense to add a mail domain because there will be no mailserver.
@@ -72,6 +118,80 @@ class DNSScanModule(ScanModule):
             result['mail'] = {'domain': mail_domain}
         result['dns'] = dns
 
+    def prefetch(self, sites):
+        """Resolve the records of many sites at once into the DNS cache.
+
+        sites is an iterable of (site_url, redirect_chain) tuples, where
+        redirect_chain may be None. Hosts that are shared between sites
+        are resolved only once. Afterwards, scan_site can take most
+        records of these sites from the cache (see shared_dns_cache).
+        Records are cached for at least prefetch_min_ttl seconds, so
+        they are still available when the scans run later. Negative
+        answers keep their TTL, so records added later are found.
+        Returns the number of queries that were actually sent.
+        """
+        sites = [self._prepare_site(site_url, redirect_chain)
+                 for site_url, redirect_chain in sites]
+        self._resolver = CachingResolver(min_ttl=self.options['prefetch_min_ttl'])
+        finished = run_with_deadline({
+            'dns': self._resolve_sites(sites, self.options['prefetch_concurrent_queries'])
+        }, self.options['prefetch_timeout'], default=False)['dns']
+        if not finished:
+            self.logger.warning('Could not prefetch all DNS records within %s seconds.',
+                                self.options['prefetch_timeout'])
+        self._resolver.log_statistics(self.logger)
+        return self._resolver.num_queries
+
+    @staticmethod
+    def _prepare_site(site_url, redirect_chain):
+        p = parse_domain(site_url)
+        mail_domain = p.fqdn[len('www.'):] if p.fqdn.startswith('www.') else p.fqdn
+
+        # Create a list for which we fetch A/AAAA records. The hosts of
+        # the MX records are added as soon as we know them.
+        domain_list = {mail_domain}
+        if redirect_chain:
+            domain_list.update(parse_domain(url).fqdn for url in redirect_chain)
+
+        # All records are None until they have been resolved, so they stay
+        # None if we run out of time.
+        dns = {domain: {'A': None, 'AAAA': None} for domain in domain_list}
+        dns[mail_domain]['MX'] = None
+        return dns, mail_domain, domain_list
+
+    async def _resolve_sites(self, sites, max_concurrent_queries):
+        # The semaphore has to be created within the running event loop.
+        self._semaphore = asyncio.Semaphore(max_concurrent_queries)
+        await asyncio.gather(*(self._resolve_all(*site) for site in sites))
+        return True
+
+    async def _resolve_all(self, dns, mail_domain, domain_list):
+        """Resolve all records of a scan and store them in dns.
+
+        Queries are started as soon as we know that we need them, e.g.,
+        the A/AAAA records of MX hosts are queried right after the MX
+        records arrived and PTR records right after the A/AAAA records.
+        """
+
+        async def resolve_host(fqdn):
+            records = dns.setdefault(fqdn, {'A': None, 'AAAA': None})
+            await asyncio.gather(self._get_dns_records(records, fqdn, 'A'),
+                                 self._get_dns_records(records, fqdn, 'AAAA'))
+
+        async def resolve_mail():
+            mx_records = await self._get_mx_records(mail_domain)
+            dns[mail_domain]['MX'] = mx_records
+            if mx_records:
+                mx_hosts = {record['host'] for record in mx_records}
+                await asyncio.gather(*(resolve_host(host) for host in mx_hosts
+                                       if host not in domain_list))
+
+        await asyncio.gather(resolve_mail(), *(resolve_host(domain) for domain in domain_list))
+
+    async def _query(self, qname, rdtype):
+        async with self._semaphore:
+            return await self._resolver.resolve(qname, rdtype)
+
     def update_dependencies(self):
         if self.options['geoip_license_key'] is None:
             self.logger.warning('License key for GeoIP database download not specified.')
@@ -90,59 +210,64 @@ class DNSScanModule(ScanModule):
             for member in archive.getmembers():
                 base_name = Path(member.name).name
                 if base_name in FILES and member.isfile():
-                    with (geoip_database_path.parent / base_name).open('wb') as f:
+                    # Running workers have the database memory-mapped, so
+                    # we must not overwrite it in place, but replace it.
+                    target_path = geoip_database_path.parent / base_name
+                    tmp_path = target_path.with_name(base_name + '.tmp')
+                    with tmp_path.open('wb') as f:
                         copy_to(archive.extractfile(member), f)
+                    os.replace(str(tmp_path), str(target_path))
 
-    def _get_geoip_reader(self):
-        if self._geoip_reader is None:
-            if not self.options['geoip_database_path'].exists():
-                return None
-            self._geoip_reader = Reader(str(self.options['geoip_database_path']))
-        return self._geoip_reader
+    def _annotate_geoip(self, dns):
+        """Set country and continent of all A/AAAA entries at once."""
+        geoip_database_path = self.options['geoip_database_path']
+        if not geoip_database_path.exists():
+            return
+        entries = [entry for records in dns.values()
+                   for rdtype in ('A', 'AAAA') for entry in records.get(rdtype) or []]
+        locations = get_geoip_lookup(geoip_database_path).lookup_many(
+            entry['ip'] for entry in entries)
+        for entry in entries:
+            entry['country'], entry['continent'] = locations[entry['ip']]
 
-    def _get_dns_records(self, qname, rdtype):
-        reader = self._get_geoip_reader()
+    async def _get_dns_records(self, records, qname, rdtype):
         try:
-            answer = resolver.query(qname, rdtype)
+            answer = await self._query(qname, rdtype)
         except (resolver.NXDOMAIN, resolver.NoAnswer, resolver.NoNameservers):
-            return []
+            records[rdtype] = []
+            return
         except DNSException as e:
-            self.logger.exception('Could not get %(rdtype) records for %(qname)s: %(msg)s',
+            self.logger.exception('Could not get %(rdtype)s records for %(qname)s: %(msg)s',
                                   {'qname': qname, 'rdtype': rdtype, 'msg': str(e)})
-            return None
-        entries = []
-        for a in answer:
-            country = None
-            continent = None
-            if reader:
-                try:
-                    geo_result = reader.country(a.address)
-                    country = geo_result.country.name
-                    continent = geo_result.continent.name
-                except AddressNotFoundError:
-                    pass
-            entries.append({
-                'ip': a.address,
-                'reverse': self._get_reverse_records(a.address),
-                'country': country,
-                'continent': continent
-            })
-        return entries
+            return
+        # Country and continent are looked up for all entries of the scan
+        # at once after resolving (see _annotate_geoip).
+        entries = [{
+            'ip': a.address,
+            'reverse': None,
+            'country': None,
+            'continent': None
+        } for a in answer]
+        # We store the entries right away, so we have them even if the
+        # reverse lookups do not finish in time.
+        records[rdtype] = entries
+        await asyncio.gather(*(self._get_reverse_records(entry) for entry in entries))
 
-    def _get_reverse_records(self, address):
-        qname = reversename.from_address(address)
+    async def _get_reverse_records(self, entry):
+        qname = reversename.from_address(entry['ip'])
         try:
-            answer = resolver.query(qname, 'PTR')
+            answer = await self._query(qname, 'PTR')
         except (resolver.NXDOMAIN, resolver.NoAnswer, resolver.NoNameservers):
-            return []
+            entry['reverse'] = []
+            return
         except DNSException as e:
-            self.logger.exception('Could not get PTR records for %s: %s', address, str(e))
-            return None
-        return [a.target.to_text()[:-1] for a in answer]
+            self.logger.exception('Could not get PTR records for %s: %s', entry['ip'], str(e))
+            return
+        entry['reverse'] = [a.target.to_text()[:-1] for a in answer]
 
-    def _get_mx_records(self, mail_domain):
+    async def _get_mx_records(self, mail_domain):
         try:
-            answer = resolver.query(mail_domain, 'MX')
+            answer = await self._query(mail_domain, 'MX')
         except (resolver.NXDOMAIN, resolver.NoAnswer, resolver.NoNameservers):
             return []
         except DNSException as e:
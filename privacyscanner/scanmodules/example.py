@@ -12,9 +12,11 @@ class ExampleScanModule(ScanModule):
         """Scans a site and adds more information to the result.
 
         The parameter result behaves like a dictionary, you can set keys on it
-        and call the usual methods on dicts. If you change a non-shallow key,
-        you have to mark the underlying shallow key as dirty by calling
-        result.mark_dirty(shallow_key).
+        and call the usual methods on dicts. Changes of nested dicts and lists
+        obtained from result are tracked, so only the changed paths are sent
+        to the master. If you change a nested value through a reference you
+        did not obtain from result, mark its path as dirty by calling
+        result.mark_dirty(key, nested_key, ...).
 
         Furthermore result exposes a logger on the logger parameter where you can
         send log messages to the scanning master.
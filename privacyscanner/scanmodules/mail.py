@@ -1,16 +1,28 @@
+import asyncio
 import socket
 import ssl
 from collections import namedtuple
-import smtplib
+from datetime import datetime, timezone
 from pathlib import Path
 
+from privacyscanner.jobqueue import get_queue_db_dsn
+from privacyscanner.resultcache import ResultCache
 from privacyscanner.scanmodules import ScanModule
 from privacyscanner.utils import set_default_options
-from privacyscanner.utils.tls import get_cipher_info, get_certificate_info
+from privacyscanner.utils.dnsresolver import configure_default_cache, resolve_addresses, \
+    run_with_deadline
+from privacyscanner.utils.smtp import SMTPClient, SMTPError, SMTPHeloError
+from privacyscanner.utils.tls import get_chain_info, get_cipher_info, get_certificate_info, \
+    get_peer_chain, get_trust_store, get_trust_store_digest, verify_chain
 
 
 LINUX_CA_FILE = Path('/etc/ssl/certs/ca-certificates.crt')
 
+# Keys of the most preferred host that are copied to the top level
+_TOP_LEVEL_KEYS = {'reachable', 'banner', 'has_starttls', 'cipher', 'key_exchange',
+                   'key_exchange_group', 'mac', 'protocol', 'certificate', 'allows_vrfy',
+                   'allows_expn', 'error'}
+
 MailserverResult = namedtuple('MailserverResult',
                               ['banner', 'cipher', 'certificate', 'features',
                                'error'])
@@ -26,11 +38,29 @@ class MailScanModule(ScanModule):
             ca_file = str(LINUX_CA_FILE)
         set_default_options(options, {
             'local_hostname': None,
+            # Maximum number of seconds for every single step of a probe
             'timeout': 10,
+            # Maximum number of seconds for probing all mail servers
+            'deadline': 60,
             'ca_file': ca_file,
-            'ca_path': None
+            'ca_path': None,
+            # Results of a mail server are shared with other scans via
+            # the queue database for this many seconds. None disables it.
+            'cache_max_age': None
         })
         super().__init__(options)
+        configure_default_cache(self.options)
+        self._result_cache = None
+        # We verify certificates offline after the handshake, so we can
+        # use the same context for all mail servers.
+        self._context = ssl.create_default_context()
+        self._context.check_hostname = False
+        self._context.verify_mode = ssl.CERT_NONE
+        self._context.set_ciphers('ALL@SECLEVEL=0')
+        # Load the CA certificates once per process instead of once per probe
+        self._trust_store = get_trust_store(self.options['ca_file'], self.options['ca_path'])
+        self._trust_store_digest = get_trust_store_digest(self.options['ca_file'],
+                                                          self.options['ca_path'])
 
     def scan_site(self, result, meta):
         # We did not find a MX record or an A record for the domain
@@ -38,80 +68,148 @@ class MailScanModule(ScanModule):
             return
 
         mail = result['mail']
+        mail_hosts = self._get_mail_hosts(result['dns'], mail['domain'])
+
+        has_cas = self._trust_store is not None
+        if not has_cas:
+            self.logger.warning('No CA certificates loaded. Cannot check for trust.')
+
+        # The addresses have usually been resolved by the dns scan module
+        # already, so we take them from the DNS cache. If this fails, we
+        # let the connection resolve the host itself.
+        addresses = resolve_addresses(mail_hosts, self.options['timeout'], self.logger)
+
+        # Many sites share the same mail servers, so we reuse results of
+        # other scans if the same server has been probed recently.
+        result_cache = self._get_result_cache()
+        hosts = []
+        probes = {}
+        for mail_host in mail_hosts:
+            host_result = {'host': mail_host, 'address': addresses[mail_host]}
+            hosts.append(host_result)
+            cached = None
+            if result_cache is not None and host_result['address'] is not None:
+                cached = result_cache.get(self._get_cache_key(host_result))
+            if cached is not None:
+                self.logger.info('Using cached result for %s (%s)',
+                                 mail_host, host_result['address'])
+                host_result.update(cached.value)
+                host_result['probe_source'] = cached.source
+                host_result['probed_at'] = cached.time_created.isoformat()
+                host_result['from_cache'] = True
+            else:
+                probes[mail_host] = self._probe(host_result, mail_host,
+                                                host_result['address'] or mail_host, has_cas)
+
+        # All mail servers are probed concurrently. Probes that did not
+        # finish in time keep what they found out so far.
+        probed_at = datetime.now(timezone.utc).isoformat()
+        finished = run_with_deadline(probes, self.options['deadline'], default=False)
+        for host_result in hosts:
+            if host_result['host'] not in finished:
+                continue
+            if not finished[host_result['host']]:
+                host_result.setdefault('error', 'deadline_exceeded')
+            elif (result_cache is not None and host_result['address'] is not None and
+                    host_result['reachable']):
+                probe = {key: value for key, value in host_result.items()
+                         if key not in ('host', 'address')}
+                result_cache.set(self._get_cache_key(host_result), probe)
+            host_result['probe_source'] = socket.gethostname()
+            host_result['probed_at'] = probed_at
+            host_result['from_cache'] = False
+
+        # The most preferred mail server is reported at the top level with
+        # the keys reported before all hosts were probed. Everything else,
+        # e.g., where it was probed, is only stored in hosts.
+        mail.update({key: value for key, value in hosts[0].items()
+                     if key in _TOP_LEVEL_KEYS})
+        mail['hosts'] = hosts
+
+    @staticmethod
+    def _get_mail_hosts(dns, mail_domain):
         try:
             # MX records are ordered by priority (most preferred first)
-            mail_host = result['dns'][mail['domain']]['MX'][0]['host']
-        except (KeyError, IndexError):
+            mx_records = dns[mail_domain]['MX']
+        except KeyError:
+            mx_records = None
+        if not mx_records:
             # We have either an error when receiving MX records
             # or have no MX records.
-            mail_host = mail['domain']
+            return [mail_domain]
+        mail_hosts = []
+        for record in mx_records:
+            if record['host'] not in mail_hosts:
+                mail_hosts.append(record['host'])
+        return mail_hosts
 
-        has_cas = (self.options['ca_file'] is not None or
-                   self.options['ca_path'] is not None)
-        if not has_cas:
-            self.logger.warning('No CA certificates loaded. Cannot check for trust.')
+    def _get_cache_key(self, host_result):
+        # is_trusted depends on the CA certificates of the worker that
+        # probed the server, so only workers with the same ones share.
+        return '{}|{}|{}'.format(host_result['host'], host_result['address'],
+                                 self._trust_store_digest)
 
-        conn = smtplib.SMTP(local_hostname=self.options['local_hostname'],
+    async def _probe(self, probe, mail_host, mail_address, has_cas):
+        client = SMTPClient(mail_host, mail_address,
+                            local_hostname=self.options['local_hostname'],
                             timeout=self.options['timeout'])
-        mail['reachable'] = False
+        probe['reachable'] = False
         try:
-            # The Python API of smtplib has a flaw: If you pass the host
-            # to the initializer, it will connect and set self._host to
-            # the host, but will not return the first message after connecting.
-            # We want that message, because it might contain a version number.
-            # You get the first message if you do not pass the host to the
-            # initializer, but call connect with the host yourself. However,
-            # this does not set self._host and therefore .starttls() fails.
-            # So we add this ugly hack, which sets self._host before connect.
-            conn._host = mail_host
-            code, banner = conn.connect(mail_host)
-            mail['banner'] = banner.decode('utf-8', errors='replace')
-            mail['reachable'] = True
-            mail['has_starttls'] = None
-            conn.ehlo_or_helo_if_needed()
-            has_starttls = conn.has_extn('STARTTLS')
-            mail['has_starttls'] = has_starttls
+            # We keep the greeting, because it might contain a version number.
+            code, banner = await client.connect()
+            probe['banner'] = banner.decode('utf-8', errors='replace')
+            probe['reachable'] = True
+            probe['has_starttls'] = None
+            await client.ehlo_or_helo()
+            has_starttls = client.has_extension('STARTTLS')
+            probe['has_starttls'] = has_starttls
             if has_starttls:
-                context = ssl.create_default_context(
-                    cafile=self.options['ca_file'],
-                    capath=self.options['ca_path']
-                )
-                context.check_hostname = has_cas
-                context.verify_mode = ssl.CERT_REQUIRED if has_cas else ssl.CERT_NONE
-                context.set_ciphers('ALL@SECLEVEL=0')
-                try:
-                    conn.starttls(context=context)
-                    is_trusted = True if has_cas else None
-                except ssl.CertificateError:
-                    is_trusted = False
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                    conn.connect(mail_host)
-                    conn.starttls(context=context)
-                conn.ehlo_or_helo_if_needed()
-
-                mail.update(get_cipher_info(conn.sock.cipher()))
-                cert_der = conn.sock.getpeercert(binary_form=True)
-                mail['certificate'] = get_certificate_info(cert_der)
-                mail['certificate']['is_trusted'] = is_trusted
-            code, msg = conn.verify('root')
-            mail['allows_vrfy'] = code in (250, 251, 252, 550, 551, 553)
-            code, msg = conn.expn('admin')
-            mail['allows_expn'] = code in (250, 550)
-        except smtplib.SMTPHeloError:
-            mail['error'] = 'EHLO'
-        except smtplib.SMTPException:
-            mail['error'] = 'smtp_other'
+                # We handshake only once without verification and check the
+                # chain offline, so untrusted servers do not need a second
+                # connection.
+                await client.starttls(self._context)
+                await client.ehlo_or_helo()
+
+                ssl_object = client.ssl_object
+                probe.update(get_cipher_info(ssl_object.cipher()))
+                chain, is_complete = get_peer_chain(ssl_object)
+                probe['certificate'] = get_certificate_info(chain[0])
+                # Without the intermediates we cannot tell whether the
+                # chain is trusted, so it is reported as unknown.
+                is_trusted = None
+                if has_cas and is_complete:
+                    is_trusted = verify_chain(chain, mail_host, self._trust_store)
+                probe['certificate']['is_trusted'] = is_trusted
+                probe['intermediate_certificates'] = get_chain_info(chain[1:])
+            code, msg = await client.command('VRFY root')
+            probe['allows_vrfy'] = code in (250, 251, 252, 550, 551, 553)
+            code, msg = await client.command('EXPN admin')
+            probe['allows_expn'] = code in (250, 550)
+        except SMTPHeloError:
+            probe['error'] = 'EHLO'
         except ConnectionRefusedError:
-            mail['error'] = 'connection_refused'
-        except socket.timeout:
-            mail['error'] = 'socket_timeout'
+            probe['error'] = 'connection_refused'
+        except (SMTPError, ConnectionError, asyncio.IncompleteReadError):
+            probe['error'] = 'smtp_other'
+        except ssl.SSLError:
+            probe['error'] = 'tls_error'
+        except (socket.timeout, asyncio.TimeoutError):
+            probe['error'] = 'socket_timeout'
         except socket.gaierror:
-            mail['error'] = 'socket_addressinfo'
+            probe['error'] = 'socket_addressinfo'
+        except OSError:
+            # e.g., the host or network is unreachable
+            probe['error'] = 'connection_error'
         finally:
-            # We only close the connection if we are actually connected
-            # (yes, this how smtplib checks for this)
-            if hasattr(conn, 'sock') and conn.sock:
-                conn.close()
+            await client.close()
+        return True
 
-        result.mark_dirty('mail')
+    def _get_result_cache(self):
+        queue_db_dsn = get_queue_db_dsn()
+        if self.options['cache_max_age'] is None or queue_db_dsn is None:
+            return None
+        if self._result_cache is None:
+            self._result_cache = ResultCache(queue_db_dsn, self.name,
+                                             self.options['cache_max_age'])
+        self._result_cache.logger = self.logger
+        return self._result_cache
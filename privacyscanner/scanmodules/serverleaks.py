@@ -1,15 +1,27 @@
 """
 Test for common server leaks.
+
+Every trial requests a path on the host of the site and checks whether the
+start of the response contains one of its patterns. Paths may contain the
+placeholders {domain} (example for www.example.com), {subdomain} (www) and
+{hostname} (www.example.com). Trials with an empty placeholder for the
+host are skipped.
+
+Additional trials can be loaded from a JSON file (option `trials_file`)
+containing a list of trials in the same format as TRIALS below.
 """
+import json
+import string
 from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 import requests
-from requests.exceptions import ConnectionError
-from requests.models import Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
 from tldextract import extract
 
 from privacyscanner.scanmodules import ScanModule
+from privacyscanner.utils.multipattern import MultiPatternSearch
 
 
 class ServerleaksScanModule(ScanModule):
@@ -21,216 +33,204 @@ class ServerleaksScanModule(ScanModule):
         scan_site(result, self.logger, self.options, meta)
 
 
-def _match_db_dump(content):
-    targets = ["SQLite", "CREATE TABLE", "INSERT INTO", "DROP TABLE"]
-    matched = False
-    for target in targets:
-        matched |= target in content
-    return matched
-
-
-def _concat_sub(url, suffix):
-    url_extract = extract(url)
-    if url_extract.subdomain == "":
-        return None
-    site = url_extract.subdomain + "." + url_extract.domain
-    return site + suffix
-
-
-def _concat_full(url, suffix):
-    url_extract = extract(url)
-    site = url_extract.domain + "." + url_extract.suffix
-    if url_extract.subdomain != "":
-        site = url_extract.subdomain + "." + site
-    return site + suffix
-
-
-def _gen_db_domain_sql(url):
-    return extract(url).domain + ".sql"
-
-
-def _gen_db_sub_domain_sql(url):
-    return _concat_sub(url, ".sql")
-
-
-def _gen_db_full_domain_sql(url):
-    return _concat_full(url, ".sql")
-
-
-def _gen_db_domain_db(url):
-    return extract(url).domain + ".db"
-
-
-def _gen_db_sub_domain_db(url):
-    return _concat_sub(url, ".db")
-
-
-def _gen_db_full_domain_db(url):
-    return _concat_full(url, ".db")
-
-
-def _gen_db_domain_key(url):
-    return extract(url).domain + ".key"
-
-
-def _gen_db_sub_domain_key(url):
-    return _concat_sub(url, ".key")
-
-
-def _gen_db_full_domain_key(url):
-    return _concat_full(url, ".key")
-
-
-def _gen_db_domain_pem(url):
-    return extract(url).domain + ".pem"
-
-
-def _gen_db_sub_domain_pem(url):
-    return _concat_sub(url, ".pem")
-
-
-def _gen_db_full_domain_pem(url):
-    return _concat_full(url, ".pem")
-
+DB_DUMP_PATTERNS = ['SQLite', 'CREATE TABLE', 'INSERT INTO', 'DROP TABLE']
 
 TRIALS = [
-    ('server-status/', 'Apache Server Status'),
-    ('server-info/', 'Apache Server Information'),
-    ('test.php', 'phpinfo()'),
-    ('phpinfo.php', 'phpinfo()'),
-    ('.git/HEAD', 'ref:'),
-    ('.svn/wc.db', 'SQLite'),
-    ('core', 'ELF'),
-    ('.DS_Store', 'Bud1'),
+    {'path': 'server-status/', 'patterns': ['Apache Server Status']},
+    {'path': 'server-info/', 'patterns': ['Apache Server Information']},
+    {'path': 'test.php', 'patterns': ['phpinfo()']},
+    {'path': 'phpinfo.php', 'patterns': ['phpinfo()']},
+    {'path': '.git/HEAD', 'patterns': ['ref:']},
+    {'path': '.svn/wc.db', 'patterns': ['SQLite']},
+    {'path': 'core', 'patterns': ['ELF']},
+    {'path': '.DS_Store', 'patterns': ['Bud1']},
 
     # Check for Database dumps
     # sqldump - MySQL/MariaDB
-    ('dump.db', _match_db_dump),
-    ('dump.sql', _match_db_dump),
-    ('sqldump.sql', _match_db_dump),
-    ('sqldump.db', _match_db_dump),
+    {'path': 'dump.db', 'patterns': DB_DUMP_PATTERNS},
+    {'path': 'dump.sql', 'patterns': DB_DUMP_PATTERNS},
+    {'path': 'sqldump.sql', 'patterns': DB_DUMP_PATTERNS},
+    {'path': 'sqldump.db', 'patterns': DB_DUMP_PATTERNS},
     # SQLite
-    ('db.sqlite', _match_db_dump),
-    ('data.sqlite', _match_db_dump),
-    ('sqlite.db', _match_db_dump),
-    (_gen_db_domain_sql, _match_db_dump),
-    (_gen_db_sub_domain_sql, _match_db_dump),
-    (_gen_db_full_domain_sql, _match_db_dump),
-    (_gen_db_domain_db, _match_db_dump),
-    (_gen_db_sub_domain_db, _match_db_dump),
-    (_gen_db_full_domain_db, _match_db_dump),
+    {'path': 'db.sqlite', 'patterns': DB_DUMP_PATTERNS},
+    {'path': 'data.sqlite', 'patterns': DB_DUMP_PATTERNS},
+    {'path': 'sqlite.db', 'patterns': DB_DUMP_PATTERNS},
+    {'path': '{domain}.sql', 'patterns': DB_DUMP_PATTERNS},
+    {'path': '{subdomain}.{domain}.sql', 'patterns': DB_DUMP_PATTERNS},
+    {'path': '{hostname}.sql', 'patterns': DB_DUMP_PATTERNS},
+    {'path': '{domain}.db', 'patterns': DB_DUMP_PATTERNS},
+    {'path': '{subdomain}.{domain}.db', 'patterns': DB_DUMP_PATTERNS},
+    {'path': '{hostname}.db', 'patterns': DB_DUMP_PATTERNS},
 
     # TODO PostgreSQL etc., additional common names
 
     # TLS Certs
-    ('server.key', '-----BEGIN'),
-    ('privatekey.key', '-----BEGIN'),
-    ('private.key', '-----BEGIN'),
-    ('myserver.key', '-----BEGIN'),
-    ('key.pem', '-----BEGIN'),
-    ('privkey.pem', '-----BEGIN'),
-    (_gen_db_domain_key, '-----BEGIN'),
-    (_gen_db_sub_domain_key, '-----BEGIN'),
-    (_gen_db_full_domain_key, '-----BEGIN'),
-    (_gen_db_domain_pem, '-----BEGIN'),
-    (_gen_db_sub_domain_pem, '-----BEGIN'),
-    (_gen_db_full_domain_pem, '-----BEGIN'),
+    {'path': 'server.key', 'patterns': ['-----BEGIN']},
+    {'path': 'privatekey.key', 'patterns': ['-----BEGIN']},
+    {'path': 'private.key', 'patterns': ['-----BEGIN']},
+    {'path': 'myserver.key', 'patterns': ['-----BEGIN']},
+    {'path': 'key.pem', 'patterns': ['-----BEGIN']},
+    {'path': 'privkey.pem', 'patterns': ['-----BEGIN']},
+    {'path': '{domain}.key', 'patterns': ['-----BEGIN']},
+    {'path': '{subdomain}.{domain}.key', 'patterns': ['-----BEGIN']},
+    {'path': '{hostname}.key', 'patterns': ['-----BEGIN']},
+    {'path': '{domain}.pem', 'patterns': ['-----BEGIN']},
+    {'path': '{subdomain}.{domain}.pem', 'patterns': ['-----BEGIN']},
+    {'path': '{hostname}.pem', 'patterns': ['-----BEGIN']},
 
     # Docker
     # https://infosec.rm-it.de/2018/08/19/scanning-the-alexa-top-1m-sites-for-dockerfiles/
-    ('Dockerfile', 'FROM'),
+    {'path': 'Dockerfile', 'patterns': ['FROM']},
     # https://twitter.com/svblxyz/status/1045013939904532482
-    ('docker.env', '='),
-    ('.env', '='),
+    {'path': 'docker.env', 'patterns': ['=']},
+    {'path': '.env', 'patterns': ['=']},
     # Docker Compose
-    ('docker-compose.yml', 'version:'),
+    {'path': 'docker-compose.yml', 'patterns': ['version:']},
 ]
 
+PLACEHOLDERS = ('domain', 'subdomain', 'hostname')
 
-def _get(url, timeout):
-    try:
-        response = requests.get(url, timeout=timeout)
-        return response
-    except ConnectionError:
-        return None
-
+_trial_sets = {}
 
-def _response_to_json(resp: Response):
-    """Generate a json byte string from a response
-    received through requests."""
-    # we store only the top of the file
-    # because core dumps can become very large
-    # also: we do not want to store more potentially sensitive data
-    # than necessary to determine whether there is a leak or not
 
-    return {
-        'text': resp.content[0:50*1024].decode(errors='replace'),
-        'status_code': resp.status_code,
-        'headers': dict(resp.headers),
-        'url': resp.url,
-    }
+class TrialSet:
+    """Compiled set of trials.
 
-
-def _check_leaks(url, max_workers):
+    The patterns of all trials are deduplicated into one
+    MultiPatternSearch. A response is only searched for the patterns of
+    its trials, one by one with bytes.find() for a few patterns or with a
+    single regular expression for many.
+    """
+    def __init__(self, trials):
+        self.trials = []
+        pattern_indexes = {}
+        for trial in trials:
+            try:
+                path = trial['path']
+                patterns = trial['patterns']
+                fields = {field for _, field, _, _ in string.Formatter().parse(path)
+                          if field is not None}
+            except (KeyError, TypeError, ValueError):
+                raise ValueError('Invalid trial: `{}`.'.format(trial)) from None
+            if not patterns or not fields.issubset(PLACEHOLDERS):
+                raise ValueError('Invalid trial: `{}`.'.format(trial))
+            indexes = frozenset(pattern_indexes.setdefault(pattern, len(pattern_indexes))
+                                for pattern in patterns)
+            self.trials.append((path, fields, indexes))
+        self.search = MultiPatternSearch(pattern.encode() for pattern in pattern_indexes)
+
+    def expand(self, url):
+        """Return a list of (path, pattern_indexes) for the host of url.
+
+        Trials with the same path are merged into one.
+        """
+        url_extract = extract(url)
+        values = {
+            'domain': url_extract.domain,
+            'subdomain': url_extract.subdomain,
+            'hostname': '.'.join(part for part in (url_extract.subdomain, url_extract.domain,
+                                                   url_extract.suffix) if part),
+        }
+        paths = {}
+        for path, fields, indexes in self.trials:
+            if not all(values[field] for field in fields):
+                continue
+            path = path.format(**values)
+            paths[path] = paths.get(path, frozenset()) | indexes
+        return list(paths.items())
+
+
+def get_trial_set(trials_file=None):
+    if trials_file not in _trial_sets:
+        trials = TRIALS
+        if trials_file is not None:
+            with open(trials_file) as f:
+                trials = trials + json.load(f)
+        _trial_sets[trials_file] = TrialSet(trials)
+    return _trial_sets[trials_file]
+
+
+def _create_session(max_workers):
+    # All trials go to the same host, so we keep up to one connection per
+    # worker alive and reuse it for the following trials.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _discard_body(response, max_bytes):
+    # A connection can only be reused after its response has been read
+    # completely. Most responses are short error pages, so we read them
+    # as long as they are not too large.
+    bytes_read = 0
+    for chunk in response.iter_content(chunk_size=8192):
+        bytes_read += len(chunk)
+        if bytes_read >= max_bytes:
+            break
+    return bytes_read
+
+
+def _fetch_trial(session, url, match_url, search, pattern_indexes, timeout, max_bytes):
+    """Fetch a trial URL and match its patterns on the start of the body.
+
+    The body is streamed and matched while it is read. We stop reading as
+    soon as a pattern matches or max_bytes have been read, because some
+    files (e.g., core dumps) can become very large. Also, we do not want
+    to download more potentially sensitive data than necessary to
+    determine whether there is a leak or not.
+
+    Returns a tuple (is_leak, bytes_read).
+    """
+    try:
+        with session.get(url, timeout=timeout, stream=True) as response:
+            if match_url not in response.url or response.status_code != 200:
+                # There has been a redirect or the file does not exist.
+                return False, _discard_body(response, max_bytes)
+            bytes_read = 0
+            tail = b''
+            for chunk in response.iter_content(chunk_size=8192):
+                chunk = chunk[:max_bytes - bytes_read]
+                bytes_read += len(chunk)
+                tail, match = search.feed(chunk, tail, pattern_indexes)
+                if match is not None:
+                    return True, bytes_read
+                if bytes_read >= max_bytes:
+                    break
+            return False, bytes_read
+    except (ConnectionError, Timeout):
+        return False, 0
+
+
+def _check_leaks(url, trial_set, max_workers, max_bytes, logger):
     leaks = []
-    trials = {}
     # determine hostname
     parsed_url = urlparse(url)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        url_to_future = {}
+    with _create_session(max_workers) as session, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        trial_to_future = {}
 
-        for trial, pattern in TRIALS:
-            trial_t = trial
-            # Check if trial is callable. If so, call it and save the result
-            if callable(trial):
-                trial_t = trial(url)
-                if trial_t is None:
-                    continue
+        for trial, pattern_indexes in trial_set.expand(url):
             request_url = '{}://{}/{}'.format(
-                parsed_url.scheme, parsed_url.netloc, trial_t)
-            url_to_future[trial_t] = executor.submit(_get, request_url, 10)
-
-        for trial in url_to_future:
+                parsed_url.scheme, parsed_url.netloc, trial)
+            match_url = '{}/{}'.format(parsed_url.netloc, trial)
+            trial_to_future[trial] = executor.submit(
+                _fetch_trial, session, request_url, match_url, trial_set.search,
+                pattern_indexes, 10, max_bytes)
+
+        total_bytes_read = 0
+        for trial, future in trial_to_future.items():
             try:
-                # response = requests.get(request_url, timeout=10)
-                response = url_to_future[trial].result()
-                if response is None:
-                    continue
-
-                match_url = '{}/{}'.format(parsed_url.netloc, trial)
-
-                if match_url not in response.url:
-                    # There has been a redirect.
-                    continue
-
-                trials[trial] = _response_to_json(response)
+                is_leak, bytes_read = future.result()
             except Exception:
                 continue
-
-    for trial, pattern in TRIALS:
-        if callable(trial):
-            trial = trial(url)
-            if trial is None:
-                continue
-        if trial not in trials:
-            # Test raw data too old or particular request failed.
-            continue
-
-        response = trials[trial]
-
-        if response['status_code'] == 200:
-            # The pattern can have three different types.
-            # - If it is a simple string,
-            #   we only check if it is contained in the response
-            if isinstance(pattern, str):
-                if pattern in response['text']:
-                    leaks.append(trial)
-            # - If it is callable,
-            #   we call it with the response text and check the return value
-            elif callable(pattern):
-                if pattern(response['text']):
-                    leaks.append(trial)
+            logger.debug('Read %d bytes for trial %s', bytes_read, trial)
+            total_bytes_read += bytes_read
+            if is_leak:
+                leaks.append(trial)
+    logger.info('Read %d bytes for %d trials', total_bytes_read, len(trial_to_future))
 
     return leaks
 
@@ -240,8 +240,12 @@ def scan_site(result, logger, options, meta):
         return
 
     max_workers = options.get('max_workers', 8)
+    # Maximum number of bytes read from the body of each trial
+    max_bytes = options.get('max_response_size', 50 * 1024)
+    trial_set = get_trial_set(options.get('trials_file'))
 
     # Note: This does not scan the original site_url before redirection.
     #       There might be cases where only the start page redirects, but
     #       other paths (which do not get redirected) contain sensitive files.
-    result['leaks'] = _check_leaks(result['final_url'], max_workers)
+    result['leaks'] = _check_leaks(result['final_url'], trial_set, max_workers, max_bytes,
+                                   logger)
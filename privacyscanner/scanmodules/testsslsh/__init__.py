@@ -16,12 +16,20 @@ class TestsslshHttpsScanModule(TestsslshScanModuleBase):
             host_url = 'https://' + host_url[len('http://'):]
         return host_url
 
+    def _get_server_identity(self, result, hostname):
+        certificate = result['https'].get('certificate')
+        if certificate:
+            return certificate['fingerprint_sha256']
+        return hostname
+
     def _can_run(self, result):
         return 'https' in result and result['https']['has_tls']
 
 
 class TestsslshMailScanModule(TestsslshScanModuleBase):
     name = 'testssl_mail'
+    # _can_run() needs the result of the mail scan module
+    dependencies = TestsslshScanModuleBase.dependencies + ['mail']
     required_keys = ['mail', 'testssl_mail']
     target_type = 'mail'
     target_parameters = [Parameter.STARTTLS, 'smtp']
@@ -1,25 +1,132 @@
 import io
 import re
+import socket
 import tarfile
+import time
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import NamedTuple, Optional
+from urllib.parse import urlparse
+
+from cryptography.exceptions import UnsupportedAlgorithm
 
 from privacyscanner.exceptions import RescheduleLater
+from privacyscanner.jobqueue import PartialResultWriter, get_queue_db_dsn
+from privacyscanner.resultcache import CachedResult, ResultCache
 from privacyscanner.scanmodules import ScanModule
 from privacyscanner.scanmodules.testsslsh.scanner import TestsslshScanner, Parameter, TestsslshFailed, \
     TestsslshFailedPartially
 from privacyscanner.utils import set_default_options, download_file
-from privacyscanner.utils.tls import get_cipher_info
+from privacyscanner.utils.cipherinfo import lookup_ciphersuite
+from privacyscanner.utils.dnsresolver import configure_default_cache, resolve_addresses, \
+    run_with_deadline
+from privacyscanner.utils.tls import get_certificate_features, get_cipher_info
+from privacyscanner.utils.tlsprobe import TLSProbeError, TLSProber
 
 
 DOWNLOAD_URL = 'https://github.com/drwetter/testssl.sh/archive/3.0.tar.gz'
 DOWNLOAD_HASH = 'ab3c9a000f0f6703e4fc94821e06f531de6d2799322bf534188ebf766365a9c1'
 
 _TESTSSL_PROTOCOL_NEGOTIATED_REGEXP = re.compile('^Default protocol (TLS1.[0-3]|SSLv[23])$')
-_TESTSSL_SUITE_NAME = re.compile('^([A-Za-z0-9-]+)(,| |$)')
+_TESTSSL_SUITE_NAME = re.compile('^([A-Za-z0-9_-]+)(,| |$)')
 _TESTSSL_DH = re.compile('(\d+) bit (DH|ECDH)')
 _TESTSSL_ECDH_CURVE = re.compile(r'\(([^)]+)\)')
 
 
+# The checks of every stage. Each check is a parameter of testssl.sh and
+# the ids of the findings we need from it. If all of them are known from
+# a checkpoint of an interrupted scan, the check is not run again.
+STAGE_CHECKS = {
+    # Stage 0: Protocols, ciphers, forward secrecy and server defaults
+    'basic': [
+        (Parameter.PROTOCOLS, ('SSLv2', 'SSLv3', 'TLS1', 'TLS1_1', 'TLS1_2', 'TLS1_3')),
+        (Parameter.STANDARD_CIPHERS, ('cipherlist_NULL', 'cipherlist_aNULL',
+                                      'cipherlist_EXPORT', 'cipherlist_DES+64Bit',
+                                      'cipherlist_128Bit', 'cipherlist_3DES',
+                                      'cipherlist_HIGH', 'cipherlist_STRONG')),
+        (Parameter.CHECK_FORWARD_SECRECY, ('PFS',)),
+        (Parameter.SERVER_DEFAULTS, ('cert_mustStapleExtension', 'sessionresumption_ID',
+                                     'sessionresumption_ticket')),
+        (Parameter.SERVER_PREFERENCE, ('cipher_order',)),
+    ],
+    # Stage 1: Vulnerabilities which are IDS-proof
+    'vulns': [
+        (Parameter.VULN_RENEGOTIATION, ('secure_renego', 'secure_client_renego')),
+        (Parameter.VULN_CRIME, ('CRIME_TLS',)),
+        (Parameter.VULN_BREACH, ('BREACH',)),
+        (Parameter.VULN_POODLE, ('POODLE_SSL',)),
+        (Parameter.VULN_TLS_FALLBACK, ('fallback_SCSV',)),
+        (Parameter.VULN_SWEET32, ('SWEET32',)),
+        (Parameter.VULN_FREAK, ('FREAK',)),
+        (Parameter.VULN_DROWN, ('DROWN',)),
+        (Parameter.VULN_LOGJAM, ('LOGJAM',)),
+        (Parameter.VULN_BEAST, ('BEAST',)),
+        (Parameter.VULN_LUCKY13, ('LUCKY13',)),
+        (Parameter.VULN_RC4, ('RC4',)),
+    ],
+    # Stage 2: Vulnerabilities that could trigger an IDS
+    'vulns_ids': [
+        (Parameter.VULN_HEARTBLEED, ('heartbleed',)),
+        (Parameter.VULN_CCS_INJECTION, ('CCS',)),
+        (Parameter.VULN_TICKETBLEED, ('ticketbleed',)),
+        (Parameter.VULN_ROBOT, ('ROBOT',)),
+    ],
+}
+
+# Parameters that apply to all checks of a stage
+STAGE_OPTIONS = {
+    'basic': [Parameter.PHONE_OUT],
+}
+
+
+def get_stage_parameters(stage_key, findings=None):
+    """Return the parameters to run the checks of a stage.
+
+    Checks whose findings are all known already are left out. An empty
+    list means that there is nothing left to check.
+    """
+    parameters = [parameter for parameter, finding_ids in STAGE_CHECKS[stage_key]
+                  if not findings or not all(key in findings for key in finding_ids)]
+    if parameters:
+        parameters += STAGE_OPTIONS.get(stage_key, [])
+    return parameters
+
+
+class _Stage(NamedTuple):
+    key: str
+    testssl: dict
+    stage_dict: dict
+    host: str
+    # Parameters of the checks that still have to run
+    checks: list
+    parameters: list
+    # Findings of an interrupted scan of this stage by their id
+    findings: dict
+    cache_key: Optional[str]
+    cached: Optional[CachedResult]
+
+
+class _Checkpoint:
+    """Collect the findings of running stages and save them regularly."""
+    def __init__(self, stages, result_key, writer, interval):
+        self._checkpoints = [stage.stage_dict.setdefault('checkpoint', {}) for stage in stages]
+        self._testssl = stages[0].testssl
+        self._result_key = result_key
+        self._writer = writer
+        self._interval = interval
+        self._last_write = time.monotonic()
+
+    def __call__(self, findings):
+        for finding in findings:
+            if 'id' not in finding:
+                continue
+            for checkpoint in self._checkpoints:
+                checkpoint[finding['id']] = finding
+        if self._writer is not None and time.monotonic() - self._last_write >= self._interval:
+            self._writer.write({self._result_key: self._testssl})
+            self._last_write = time.monotonic()
+
+
 class IncompleteStage(Exception):
     def __init__(self, partial_result):
         self.partial_result = partial_result
@@ -39,19 +146,214 @@ class TestsslshScanModuleBase(ScanModule):
             'download_url': DOWNLOAD_URL,
             'download_hash': DOWNLOAD_HASH,
             'stages': ['basic', 'vulns', 'vulns_ids'],
+            # Consecutive stages that are scanned in the same job. Only
+            # between groups, the job goes back to the queue to space out
+            # the stages, e.g., [['basic', 'vulns'], ['vulns_ids']] if
+            # only the IDS checks need spacing. None puts every stage in
+            # its own group. Stages of a group are either merged into one
+            # testssl.sh run (merge) or run one after another (chain).
+            'stage_groups': None,
+            'stage_group_mode': 'merge',
+            # Results of a stage are shared with other sites on the same
+            # endpoint via the queue database for this many seconds.
+            # None disables it.
+            'cache_max_age': None,
+            # Timeout for resolving the address of the scanned endpoint
+            'dns_timeout': 10,
+            # Number of jobs a worker claims at once. All sites of a batch
+            # are scanned by a single testssl.sh mass test, testing up to
+            # batch_parallel sites in parallel.
+            'batch_size': 1,
+            'batch_parallel': 20,
+            # Findings of a running stage are saved to the queue database
+            # every checkpoint_interval seconds. If the worker is killed,
+            # the next try only runs the checks that did not finish.
+            'checkpoint_interval': 30,
+            # Stop testssl.sh after this many seconds and keep its partial
+            # result. Should be lower than the maximum execution time.
+            'stage_timeout': None,
+            # Run the basic stage with testssl.sh or with the native prober
+            # (native), which sends hand-crafted ClientHellos concurrently
+            # over prober_connections connections.
+            'basic_prober': 'testssl',
+            'prober_connections': 4,
+            'prober_timeout': 10,
         })
+        if options['basic_prober'] not in ('testssl', 'native'):
+            raise ValueError('Invalid basic prober: `{}`.'.format(options['basic_prober']))
 
         for stage in options['stages']:
-            if not hasattr(self, '_scan_stage_' + stage):
+            if stage not in STAGE_CHECKS:
                 raise ValueError('Invalid stage: `{}`.'.format(stage))
+        if options['stage_groups'] is None:
+            options['stage_groups'] = [[stage] for stage in options['stages']]
+        if [stage for group in options['stage_groups'] for stage in group] != options['stages']:
+            raise ValueError('Invalid stage groups: `{}`.'.format(options['stage_groups']))
+        if options['stage_group_mode'] not in ('merge', 'chain'):
+            raise ValueError('Invalid stage group mode: `{}`.'.format(
+                options['stage_group_mode']))
 
         super().__init__(options)
+        configure_default_cache(self.options)
         self._install_dir = self.options['install_base_dir'] / self.options['download_hash']
+        self._result_cache = None
+        self._stage_groups = {stage: group for group in self.options['stage_groups']
+                              for stage in group}
 
     def scan_site(self, result, meta):
+        while True:
+            stages = self._prepare_stages(result)
+            if not stages:
+                return
+            scan_result, error = self._run_stages(stages, meta)
+            if not self._finish_stages(result, stages, scan_result, error):
+                return
+
+    def scan_sites(self, sites):
+        """Scan the current stage of all sites with one testssl.sh run per stage.
+
+        The targets of a stage are scanned in parallel by a single mass
+        test. Cached stages and the stage state machine are handled per
+        site as in scan_site, i.e., a failure of one site does not affect
+        the other sites of the batch.
+        """
+        errors = [None] * len(sites)
+        pending = list(range(len(sites)))
+        while pending:
+            runs = {}
+            for index in pending:
+                result, meta, logger = sites[index]
+                self.logger = logger
+                try:
+                    stages = self._prepare_stages(result)
+                except Exception as e:
+                    errors[index] = e
+                    continue
+                if stages:
+                    runs[index] = stages
+
+            outcomes = self._run_batch(sites, runs)
+
+            # Sites whose next stage is in the same group are scanned
+            # again in the next round.
+            pending = []
+            for index, stages in runs.items():
+                result, meta, logger = sites[index]
+                self.logger = logger
+                scan_result = outcomes.get(index)
+                error = None
+                if isinstance(scan_result, Exception):
+                    scan_result, error = None, scan_result
+                try:
+                    if self._finish_stages(result, stages, scan_result, error):
+                        pending.append(index)
+                except Exception as e:
+                    errors[index] = e
+        return errors
+
+    def _run_batch(self, sites, runs):
+        outcomes = {}
+        targets_by_stages = {}
+        native_indexes = []
+        for index, stages in runs.items():
+            if self._needs_run(stages[0]):
+                if self._is_native(stages[0]):
+                    native_indexes.append(index)
+                else:
+                    stage_keys = tuple(stage.key for stage in stages)
+                    targets_by_stages.setdefault(stage_keys, []).append(index)
+        if native_indexes:
+            native_results = self._probe_native([runs[index][0] for index in native_indexes])
+            outcomes.update(zip(native_indexes, native_results))
+        for stage_keys, indexes in targets_by_stages.items():
+            for index in indexes:
+                sites[index][2].info('Scanning stage %s of %d sites in one testssl.sh run.',
+                                     ', '.join(stage_keys), len(indexes))
+            # The checks are given per target, as resumed stages might need
+            # only some of them.
+            scanner = TestsslshScanner(self._install_dir)
+            targets = [(runs[index][0].host,
+                        self._get_checks(runs[index]) + runs[index][0].parameters)
+                       for index in indexes]
+            try:
+                scan_results = scanner.scan_many(targets, self.options['batch_parallel'])
+            except Exception as e:
+                scan_results = [e] * len(indexes)
+            for index, scan_result in zip(indexes, scan_results):
+                outcomes[index] = scan_result
+        return outcomes
+
+    def _prepare_stages(self, result):
+        """Prepare the current stage and the stages that are run with it.
+
+        If stage_group_mode is merge, the following stages of the group
+        of the current stage are added as long as they have to run
+        testssl.sh, too.
+        """
+        stage = self._prepare_stage(result)
+        if stage is None:
+            return []
+        stages = [stage]
+        if (self.options['stage_group_mode'] == 'merge' and self._needs_run(stage) and
+                not self._is_native(stage)):
+            group = self._stage_groups[stage.key]
+            for stage_key in group[group.index(stage.key) + 1:]:
+                next_stage = self._prepare_stage(result, stage_key)
+                if not self._needs_run(next_stage) or self._is_native(next_stage):
+                    break
+                stages.append(next_stage)
+            if len(stages) > 1:
+                self.logger.info('Merging stages %s into one testssl.sh run.',
+                                 ', '.join(stage.key for stage in stages))
+        return stages
+
+    def _run_stages(self, stages, meta):
+        """Run the checks of the stages and return (scan_result, error)."""
+        stage = stages[0]
+        if not self._needs_run(stage):
+            return None, None
+        if self._is_native(stage):
+            scan_result = self._probe_native([stage])[0]
+            if isinstance(scan_result, Exception):
+                return None, scan_result
+            return scan_result, None
+
+        writer = None
+        queue_db_dsn = get_queue_db_dsn()
+        if meta.scan_id is not None and queue_db_dsn is not None:
+            writer = PartialResultWriter(queue_db_dsn, meta.scan_id, self.logger)
+        checkpoint = _Checkpoint(stages, 'testssl_' + self.target_type, writer,
+                                 self.options['checkpoint_interval'])
+        scanner = TestsslshScanner(self._install_dir)
+        scanner.add_parameters(*self._get_checks(stages), *stage.parameters)
+        try:
+            return scanner.scan(stage.host, on_findings=checkpoint,
+                                timeout=self.options['stage_timeout']), None
+        except Exception as e:
+            return None, e
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _finish_stages(self, result, stages, scan_result, error):
+        """Finish the stages of a run in their order.
+
+        Returns True if the next stage is scanned in the same job.
+        """
+        for index, stage in enumerate(stages):
+            if not self._finish_stage(result, stage, scan_result, error):
+                # The scan ended with this stage, so the stages merged
+                # into its run are dropped like stages that never ran.
+                for merged_stage in stages[index + 1:]:
+                    del merged_stage.testssl['stages'][merged_stage.key]
+                return False
+        return True
+
+    def _prepare_stage(self, result, stage_key=None):
+        """Prepare the given stage or, by default, the current stage."""
         if not self._can_run(result):
             self.logger.info('Skipping testssl.sh checks: No (START)TLS found.')
-            return
+            return None
         stages = self.options['stages']
         testssl_key = 'testssl_' + self.target_type
         if testssl_key not in result:
@@ -59,24 +361,68 @@ class TestsslshScanModuleBase(ScanModule):
                 'current_stage': stages[0],
                 'stages': {}
             }
-        result.mark_dirty(testssl_key)
         testssl = result[testssl_key]
-        stage_key = testssl['current_stage']
-
-        self.logger.info('Current stage: %s', stage_key)
+        if stage_key is None:
+            stage_key = testssl['current_stage']
+            self.logger.info('Current stage: %s', stage_key)
         if stage_key not in stages:
             self.logger.error('Stage `%s` is not available', stage_key)
-            return
+            return None
 
         if stage_key not in testssl['stages']:
             testssl['stages'][stage_key] = {'status': 'open'}
         stage_dict = testssl['stages'][stage_key]
 
-        scan_result = None
+        host = self._get_host(result)
+        extra_parameters = list(self.target_parameters)
+        result_cache = self._get_result_cache()
+        cache_key = None
+        cached = None
+        if result_cache is not None:
+            # We scan a single IP address, so the result belongs to exactly
+            # one endpoint and can be shared with other sites on it.
+            hostname, port = self._split_host(host)
+            ip = resolve_addresses([hostname], self.options['dns_timeout'])[hostname]
+            if ip is not None:
+                extra_parameters += [Parameter.IP, ip]
+                prober = self.options['basic_prober'] if stage_key == 'basic' else 'testssl'
+                cache_key = '|'.join((ip, str(port), self._get_server_identity(result, hostname),
+                                      stage_key, prober, self.options['download_hash']))
+                cached = result_cache.get(cache_key)
+                if cached is not None:
+                    self.logger.info('Using cached result for endpoint %s:%s', ip, port)
+        stage_dict['from_cache'] = cached is not None
+
+        findings = dict(stage_dict.get('checkpoint', {}))
+        checks = get_stage_parameters(stage_key, findings)
+        if findings:
+            self.logger.info('Resuming stage %s with %d findings of an interrupted scan.',
+                             stage_key, len(findings))
+        return _Stage(stage_key, testssl, stage_dict, host, checks, extra_parameters,
+                      findings, cache_key, cached)
+
+    def _finish_stage(self, result, stage, scan_result, error):
+        """Evaluate the testssl.sh result of a stage and move to the next one.
+
+        Either scan_result or error (the exception raised when running
+        testssl.sh) is given unless the result of the stage is cached.
+        Returns True if the next stage is in the same stage group and
+        raises RescheduleLater if it is in another one.
+        """
+        stages = self.options['stages']
+        testssl = stage.testssl
+        stage_key = stage.key
+        stage_dict = stage.stage_dict
         try:
-            stage_method = getattr(self, '_scan_stage_' + stage_key)
-            host = self._get_host(result)
-            scan_result = stage_method(host, self.target_parameters)
+            if stage.cached is not None:
+                scan_result = stage.cached.value
+                stage_dict['probe_source'] = stage.cached.source
+                stage_dict['probed_at'] = stage.cached.time_created.isoformat()
+            else:
+                scan_result, error = self._merge_findings(stage, scan_result, error)
+                scan_result = self._parse_stage(stage_key, scan_result, error)
+                stage_dict['probe_source'] = socket.gethostname()
+                stage_dict['probed_at'] = datetime.now(timezone.utc).isoformat()
         except IncompleteStage as e:
             self.logger.info('testssl.sh result is incomplete.')
             scan_result = e.partial_result
@@ -96,6 +442,9 @@ class TestsslshScanModuleBase(ScanModule):
         else:
             self.logger.info('testssl.sh result is complete.')
             stage_dict['status'] = 'complete'
+            if stage.cache_key is not None and stage.cached is None:
+                self._get_result_cache().set(stage.cache_key, scan_result)
+        stage_dict.pop('checkpoint', None)
 
         if scan_result:
             target_result = result[self.target_type]
@@ -103,7 +452,6 @@ class TestsslshScanModuleBase(ScanModule):
                 if key in target_result:
                     continue
                 target_result[key] = value
-            result.mark_dirty(self.target_type)
 
         has_failed = stage_dict['status'] != 'complete'
         if has_failed:
@@ -118,9 +466,79 @@ class TestsslshScanModuleBase(ScanModule):
             return
         self.logger.info('Next stage: %s', next_stage)
         testssl['current_stage'] = next_stage
+        if next_stage in self._stage_groups[stage_key]:
+            return True
         raise RescheduleLater(10)
 
-    def _scan_stage_basic(self, target, extra_parameters):
+    @staticmethod
+    def _needs_run(stage):
+        return stage.cached is None and bool(stage.checks)
+
+    @staticmethod
+    def _get_checks(stages):
+        return [check for stage in stages for check in stage.checks]
+
+    def _is_native(self, stage):
+        return stage.key == 'basic' and self.options['basic_prober'] == 'native'
+
+    def _probe_native(self, stages):
+        """Probe the basic stage of all stages with the native prober.
+
+        Returns a list with the findings (in the format of testssl.sh) or
+        the exception for every stage.
+        """
+        starttls = None
+        if Parameter.STARTTLS in self.target_parameters:
+            starttls = self.target_parameters[self.target_parameters.index(Parameter.STARTTLS) + 1]
+
+        async def probe(stage):
+            hostname, port = self._split_host(stage.host)
+            address = None
+            if Parameter.IP in stage.parameters:
+                address = stage.parameters[stage.parameters.index(Parameter.IP) + 1]
+            prober = TLSProber(hostname, address, port, starttls=starttls,
+                               timeout=self.options['prober_timeout'],
+                               max_connections=self.options['prober_connections'])
+            try:
+                findings = _get_native_findings(await prober.probe())
+            except TLSProbeError as e:
+                return TestsslshFailed(-1100, str(e))
+            if prober.num_failed_connections:
+                self.logger.warning('%d of %d connections to %s failed while probing.',
+                                    prober.num_failed_connections, prober.num_connections,
+                                    stage.host)
+            return findings
+
+        results = run_with_deadline({index: probe(stage) for index, stage in enumerate(stages)},
+                                    self.options['stage_timeout'])
+        return [results[index] if results[index] is not None else
+                TestsslshFailed(-1003, 'Native prober timed out.')
+                for index in range(len(stages))]
+
+    @staticmethod
+    def _merge_findings(stage, scan_result, error):
+        """Add the findings of an interrupted scan to the new ones."""
+        if not stage.findings:
+            return scan_result, error
+        if error is None:
+            return dict(stage.findings, **(scan_result or {})), None
+        if isinstance(error, TestsslshFailedPartially):
+            error.partial_result = dict(stage.findings, **error.partial_result)
+        elif isinstance(error, TestsslshFailed):
+            error = TestsslshFailedPartially(error.exit_code, dict(stage.findings), *error.args)
+        return None, error
+
+    def _parse_stage(self, stage_key, scan_result, error):
+        parse_method = getattr(self, '_parse_stage_' + stage_key)
+        if error is None:
+            return parse_method(scan_result)
+        # The findings of an incomplete basic stage are still useful. All
+        # other stages fail if testssl.sh did not finish.
+        if stage_key == 'basic' and isinstance(error, TestsslshFailedPartially):
+            raise IncompleteStage(parse_method(error.partial_result))
+        raise error
+
+    def _parse_stage_basic(self, scan_result):
         """Stage 0 scan: Contains the most relevant checks.
 
         These include:
@@ -129,20 +547,6 @@ class TestsslshScanModuleBase(ScanModule):
         - Forward Secrecy support
 
         """
-        scanner = TestsslshScanner(self._install_dir)
-        scanner.add_parameters(Parameter.PROTOCOLS,
-                               Parameter.STANDARD_CIPHERS,
-                               Parameter.CHECK_FORWARD_SECRECY,
-                               Parameter.SERVER_DEFAULTS,
-                               Parameter.SERVER_PREFERENCE,
-                               Parameter.PHONE_OUT,
-                               *extra_parameters)
-        try:
-            scan_result = scanner.scan(target)
-            incomplete = False
-        except TestsslshFailedPartially as e:
-            scan_result = e.partial_result
-            incomplete = True
         findings = ScanResultFindings(scan_result, self.logger)
 
         forward_secrecy = {
@@ -241,7 +645,8 @@ class TestsslshScanModuleBase(ScanModule):
             if 'Default protocol' in protocol_negotiated:
                 match = _TESTSSL_PROTOCOL_NEGOTIATED_REGEXP.match(protocol_negotiated)
                 if match:
-                    protocol = protocol_name_map[match.group(1).replace('.', '_')]
+                    protocol_key = match.group(1).replace('.', '_').replace('TLS1_0', 'TLS1')
+                    protocol = protocol_name_map[protocol_key]
                     tls_result['protocol'] = protocol
 
         cipher_negotiated = findings.get('cipher_negotiated')
@@ -334,27 +739,10 @@ class TestsslshScanModuleBase(ScanModule):
             if finding_ct == 'yes (certificate extension)':
                 certificate_transparency['has_extension'] = True
 
-        if incomplete:
-            raise IncompleteStage(tls_result)
         return tls_result
 
-    def _scan_stage_vulns(self, target, extra_parameters):
+    def _parse_stage_vulns(self, scan_result):
         """Stage 1 scan: Contains vulnerabilities which are IDS-proof"""
-        scanner = TestsslshScanner(self._install_dir)
-        scanner.add_parameters(Parameter.VULN_RENEGOTIATION,
-                               Parameter.VULN_CRIME,
-                               Parameter.VULN_BREACH,
-                               Parameter.VULN_POODLE,
-                               Parameter.VULN_TLS_FALLBACK,
-                               Parameter.VULN_SWEET32,
-                               Parameter.VULN_FREAK,
-                               Parameter.VULN_DROWN,
-                               Parameter.VULN_LOGJAM,
-                               Parameter.VULN_BEAST,
-                               Parameter.VULN_LUCKY13,
-                               Parameter.VULN_RC4,
-                               *extra_parameters)
-        scan_result = scanner.scan(target)
         findings = ScanResultFindings(scan_result, self.logger)
 
         vulns = {
@@ -423,15 +811,8 @@ class TestsslshScanModuleBase(ScanModule):
 
         return vulns
 
-    def _scan_stage_vulns_ids(self, target, extra_parameters):
+    def _parse_stage_vulns_ids(self, scan_result):
         """Stage 2 scan: Contains vulnerabilities that could trigger an IDS"""
-        scanner = TestsslshScanner(self._install_dir)
-        scanner.add_parameters(Parameter.VULN_HEARTBLEED,
-                               Parameter.VULN_CCS_INJECTION,
-                               Parameter.VULN_TICKETBLEED,
-                               Parameter.VULN_ROBOT,
-                               *extra_parameters)
-        scan_result = scanner.scan(target)
         findings = ScanResultFindings(scan_result, self.logger)
 
         vulns = {
@@ -492,6 +873,31 @@ class TestsslshScanModuleBase(ScanModule):
         hash_symlink.symlink_to(directory_name, target_is_directory=True)
         self.logger.info('Successfully installed testssl.sh')
 
+    def _get_result_cache(self):
+        queue_db_dsn = get_queue_db_dsn()
+        if self.options['cache_max_age'] is None or queue_db_dsn is None:
+            return None
+        if self._result_cache is None:
+            self._result_cache = ResultCache(queue_db_dsn, self.name,
+                                             self.options['cache_max_age'])
+        self._result_cache.logger = self.logger
+        return self._result_cache
+
+    @staticmethod
+    def _split_host(host):
+        parsed = urlparse(host if '://' in host else '//' + host)
+        return parsed.hostname, parsed.port or 443
+
+    def _get_server_identity(self, result, hostname):
+        """Return what identifies the server on its endpoint.
+
+        Subclasses return the fingerprint of the certificate if they know
+        it, because different names with the same certificate are usually
+        served by the same configuration. The default is the server name
+        (SNI).
+        """
+        return hostname
+
     def _get_host(self, result):
         raise NotImplemented
 
@@ -499,6 +905,121 @@ class TestsslshScanModuleBase(ScanModule):
         raise NotImplemented
 
 
+_NATIVE_PROTOCOL_IDS = {
+    'SSLv2': ('SSLv2', 'SSLv2'),
+    'SSLv3': ('SSLv3', 'SSLv3'),
+    'TLSv1': ('TLS1', 'TLSv1'),
+    'TLSv1.1': ('TLS1_1', 'TLSv1_1'),
+    'TLSv1.2': ('TLS1_2', 'TLSv1_2'),
+    'TLSv1.3': ('TLS1_3', 'TLSv1_3'),
+}
+
+_CIPHER_BITS = re.compile(r'-(\d+)')
+
+_FORWARD_SECRECY_KEAS = ('kx-dhe', 'kx-ecdhe', 'kx-dhe-psk', 'kx-ecdhe-psk')
+
+
+def _get_cipherlist(info):
+    """Return the cipher list of testssl.sh that contains the cipher suite.
+
+    The categories resemble the ones of testssl.sh, but are derived from
+    our cipher table instead of OpenSSL cipher strings.
+    """
+    symmetric = info.symmetric
+    if symmetric is None:
+        return 'NULL'
+    if info.auth == 'auth-null':
+        return 'aNULL'
+    if info.name.startswith('EXP'):
+        return 'EXPORT'
+    match = _CIPHER_BITS.search(symmetric)
+    bits = int(match.group(1)) if match else 128
+    if symmetric.startswith(('des-', 'rc2', 'rc4')) or bits <= 64:
+        return 'DES_and_64Bit'
+    if symmetric.startswith(('3des', 'idea')):
+        return '3DES'
+    if info.aead:
+        return 'STRONG'
+    if bits <= 128:
+        return '128Bit'
+    return 'HIGH'
+
+
+def _get_native_findings(probe):
+    """Convert the result of the native prober to findings of testssl.sh."""
+    findings = {}
+
+    def add(key, finding):
+        findings[key] = {'id': key, 'severity': 'INFO', 'finding': finding}
+
+    def offered(value):
+        return 'offered' if value else 'not offered'
+
+    cipherlists = set()
+    pfs_ciphers = []
+    for protocol, supported in probe['protocols'].items():
+        protocol_id, order_id = _NATIVE_PROTOCOL_IDS[protocol]
+        add(protocol_id, offered(supported))
+        for name in probe['ciphers'].get(protocol, []):
+            info = lookup_ciphersuite(name)
+            cipherlists.add(_get_cipherlist(info))
+            if ((info.kea in _FORWARD_SECRECY_KEAS or info.protocol == 'TLSv1.3') and
+                    name not in pfs_ciphers):
+                pfs_ciphers.append(name)
+        if protocol in probe['ciphers']:
+            add('cipherorder_' + order_id, ' '.join(probe['ciphers'][protocol]))
+    for cipherlist in ('NULL', 'aNULL', 'EXPORT', 'DES_and_64Bit', '3DES', '128Bit',
+                       'HIGH', 'STRONG'):
+        source_key = 'cipherlist_DES+64Bit' if cipherlist == 'DES_and_64Bit' else \
+            'cipherlist_' + cipherlist
+        add(source_key, offered(cipherlist in cipherlists))
+
+    add('PFS', offered(pfs_ciphers))
+    if pfs_ciphers:
+        add('PFS_ciphers', ' '.join(pfs_ciphers))
+    if probe['groups']:
+        add('PFS_ECDHE_curves', ' '.join(probe['groups']))
+    if probe['server_preference'] is not None:
+        add('cipher_order', 'server' if probe['server_preference']
+            else 'NOT cipher order configured')
+
+    default = probe['default']
+    if default is not None:
+        protocol = default['protocol'].replace('TLSv', 'TLS')
+        if protocol == 'TLS1':
+            protocol = 'TLS1.0'
+        add('protocol_negotiated', 'Default protocol ' + protocol)
+        cipher_negotiated = default['cipher']
+        if default['key_exchange'] is not None:
+            cipher_negotiated += ', {} bit {}'.format(default['key_exchange_bits'],
+                                                      default['key_exchange'])
+            if default['group'] is not None:
+                cipher_negotiated += ' ({})'.format(default['group'])
+        add('cipher_negotiated', cipher_negotiated)
+
+    if probe['ocsp_stapling'] is not None:
+        add('OCSP_stapling', offered(probe['ocsp_stapling']))
+    if probe['session_id_resumption'] is not None:
+        add('sessionresumption_ID',
+            'supported' if probe['session_id_resumption'] else 'not supported')
+    if probe['session_ticket'] is not None:
+        add('sessionresumption_ticket',
+            'supported' if probe['session_ticket'] else 'not supported')
+    features = None
+    if probe['certificate'] is not None:
+        try:
+            features = get_certificate_features(probe['certificate'])
+        except (ValueError, UnsupportedAlgorithm):
+            # The certificate cannot be parsed, so these findings are
+            # left out instead of failing the whole stage.
+            pass
+    if features is not None:
+        add('cert_mustStapleExtension', 'supported' if features['must_staple'] else '--')
+        add('certificate_transparency', 'yes (certificate extension)' if features['has_sct']
+            else 'no')
+    return findings
+
+
 class ScanResultFindings:
     def __init__(self, scan_result, logger):
         self._scan_result = scan_result
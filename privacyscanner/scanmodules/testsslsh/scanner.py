@@ -1,8 +1,13 @@
 import enum
 import json
+import shlex
 import subprocess
 import tempfile
+import time
 from pathlib import Path
+from urllib.parse import urlparse
+
+from privacyscanner.utils import kill_everything
 
 
 class TestsslshFailed(Exception):
@@ -31,6 +36,9 @@ class Parameter(enum.Enum):
     PHONE_OUT = '--phone-out'
     JSONFILE = '--jsonfile'
     HTMLFILE = '--htmlfile'
+    # Mass testing: Scan every target (and its options) in the file
+    FILE = '--file'
+    PARALLEL = '--parallel'
 
     VULN_ALL = '-U'
     VULN_HEARTBLEED = '-H'
@@ -61,6 +69,8 @@ class TestsslshScanner:
             'TESTSSL_INSTALL_DIR': str(self._install_dir)
         }
         self.result = None
+        # Seconds between two reads of the JSON output while testssl.sh runs
+        self.poll_interval = 1
 
     def add_parameters(self, *parameters):
         for parameter in parameters:
@@ -68,43 +78,202 @@ class TestsslshScanner:
                 parameter = parameter.value
             self.parameters.append(parameter)
 
-    def scan(self, target_url):
-        executable = self._install_dir / 'testssl.sh'
-        command = [str(executable)] + self.parameters
+    def scan(self, target_url, on_findings=None, timeout=None):
+        """Scan target_url and return the findings by their id.
+
+        The JSON output is parsed while testssl.sh is running. Every time
+        new findings are available, on_findings is called with a list of
+        them. If the scan takes longer than timeout seconds, testssl.sh
+        is terminated and the findings so far are raised as partial result.
+        """
         with tempfile.NamedTemporaryFile() as f:
-            command += (Parameter.JSONFILE.value, f.name, target_url)
-            p = subprocess.run(command,
-                               stderr=subprocess.PIPE,
-                               stdout=subprocess.DEVNULL,
-                               env=self.environment,
-                               check=False,
-                               encoding='utf-8',
-                               errors='replace')
-            f.seek(0)
+            p, stderr, scan_list = self._run([Parameter.JSONFILE.value, f.name, target_url],
+                                             f.name, on_findings=on_findings, timeout=timeout)
+
+        result = _build_result(scan_list)
+        if not (0 <= p.returncode < 50):
+            if result is not None:
+                raise TestsslshFailedPartially(p.returncode, result, stderr)
+            raise TestsslshFailed(p.returncode, stderr)
+
+        return result
+
+    def scan_many(self, targets, max_parallel=20):
+        """Scan many targets with a single (parallel) mass test.
+
+        targets is a list of (target_url, parameters) tuples, where the
+        parameters apply only to this target. Returns a list with the
+        result or the TestsslshFailed exception of every target. The exit
+        code of a mass test can not be attributed to a target, so a target
+        whose scan did not finish (no scanTime) is reported as partially
+        failed. Targets on the same host and port are scanned only once.
+        """
+        lines = []
+        endpoints = []
+        for target_url, parameters in targets:
+            endpoint = _get_endpoint(target_url)
+            if endpoint not in endpoints:
+                parameters = [parameter.value if isinstance(parameter, Parameter) else parameter
+                              for parameter in parameters]
+                lines.append(' '.join(shlex.quote(arg) for arg in parameters + [target_url]))
+            endpoints.append(endpoint)
+
+        environment = dict(self.environment, MAX_PARALLEL=str(max_parallel))
+        with tempfile.NamedTemporaryFile('w') as target_file, \
+                tempfile.NamedTemporaryFile() as f:
+            target_file.write('\n'.join(lines) + '\n')
+            target_file.flush()
             try:
-                scan_list = json.load(f)
-            except json.JSONDecodeError:
-                raise TestsslshFailed(-1000, 'JSON decode failed.')
+                p, stderr, scan_list = self._run([Parameter.JSONFILE.value, f.name,
+                                                  Parameter.PARALLEL.value,
+                                                  Parameter.FILE.value, target_file.name],
+                                                 f.name, environment)
+            except TestsslshFailed as e:
+                return [e] * len(targets)
 
-        result = {}
+        # Entries of all targets are mixed, but each of them names the
+        # host (and IP address) and port it belongs to.
+        entries = {}
         for entry in scan_list:
-            if 'id' not in entry:
+            hostname, _, _ip = entry.get('ip', '').partition('/')
+            endpoint = (hostname.lower(), str(entry.get('port', '')))
+            entries.setdefault(endpoint, []).append(entry)
+
+        results = []
+        for endpoint in endpoints:
+            result = _build_result(entries.get(endpoint, []))
+            if result is None:
+                results.append(TestsslshFailed(-1001, 'No result in mass test.', stderr))
+            elif 'scanTime' not in result:
+                results.append(TestsslshFailedPartially(-1002, result,
+                                                        'Scan did not finish in mass test.',
+                                                        stderr))
+            else:
+                results.append(result)
+        return results
+
+    def _run(self, arguments, json_filename, environment=None, on_findings=None,
+             timeout=None):
+        """Run testssl.sh and return (process, stderr, findings)."""
+        executable = self._install_dir / 'testssl.sh'
+        command = [str(executable)] + self.parameters + arguments
+        deadline = None if timeout is None else time.monotonic() + timeout
+        reader = JSONArrayReader()
+        scan_list = []
+        # stderr goes to a file, a pipe could fill up while we are polling.
+        with tempfile.TemporaryFile() as stderr_file, open(json_filename, 'rb') as f:
+            p = subprocess.Popen(command,
+                                 stderr=stderr_file,
+                                 stdout=subprocess.DEVNULL,
+                                 env=environment or self.environment)
+            timed_out = False
+            while p.poll() is None:
+                try:
+                    p.wait(self.poll_interval)
+                except subprocess.TimeoutExpired:
+                    pass
+                findings = reader.feed(f.read())
+                if findings:
+                    scan_list += findings
+                    if on_findings is not None:
+                        on_findings(findings)
+                if deadline is not None and p.poll() is None and time.monotonic() > deadline:
+                    kill_everything(p.pid)
+                    p.wait()
+                    timed_out = True
+            findings = reader.feed(f.read())
+            if findings:
+                scan_list += findings
+                if on_findings is not None:
+                    on_findings(findings)
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode('utf-8', errors='replace')
+        if timed_out:
+            _raise_partial(scan_list, -1003, 'testssl.sh timed out after {} seconds.'.format(timeout))
+        if not reader.is_complete and not scan_list:
+            raise TestsslshFailed(-1000, 'JSON decode failed.')
+        return p, stderr, scan_list
+
+
+class JSONArrayReader:
+    """Parse the elements of a JSON array while it is being written.
+
+    Data is fed in chunks as it is appended to the file. feed() returns the
+    elements that are complete so far. is_complete tells whether the end of
+    the array has been seen.
+    """
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._bytes = b''
+        self._started = False
+        self.is_complete = False
+
+    def feed(self, data):
+        self._bytes += data
+        try:
+            self._buffer += self._bytes.decode('utf-8')
+            self._bytes = b''
+        except UnicodeDecodeError:
+            # The chunk ends in the middle of a multibyte character
+            return []
+        elements = []
+        pos = 0
+        buffer = self._buffer
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos == len(buffer) or self.is_complete:
+                break
+            if not self._started:
+                if buffer[pos] != '[':
+                    break
+                self._started = True
+                pos += 1
                 continue
-            result[entry['id']] = entry
-
-        # Check if we actually have any results. This means that we check
-        # whether there are keys that are not engine_problem or scanTime,
-        # which are available even if the host is not reachable.
-        min_length = 1
-        for no_result_key in ('engine_problem', 'scanTime'):
-            if no_result_key in result:
-                min_length += 1
-        if len(result) < min_length:
-            result = None
+            if buffer[pos] == ']':
+                self.is_complete = True
+                pos += 1
+                continue
+            try:
+                element, pos = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The element has not been written completely yet
+                break
+            elements.append(element)
+        self._buffer = buffer[pos:]
+        return elements
 
-        if not (0 <= p.returncode < 50):
-            if result is not None:
-                raise TestsslshFailedPartially(p.returncode, result, p.stderr)
-            raise TestsslshFailed(p.returncode, p.stderr)
 
-        return result
+def _raise_partial(scan_list, exit_code, message):
+    result = _build_result(scan_list)
+    if result is not None:
+        raise TestsslshFailedPartially(exit_code, result, message)
+    raise TestsslshFailed(exit_code, message)
+
+
+def _build_result(scan_list):
+    result = {}
+    for entry in scan_list:
+        if 'id' not in entry:
+            continue
+        result[entry['id']] = entry
+
+    # Check if we actually have any results. This means that we check
+    # whether there are keys that are not engine_problem or scanTime,
+    # which are available even if the host is not reachable.
+    min_length = 1
+    for no_result_key in ('engine_problem', 'scanTime'):
+        if no_result_key in result:
+            min_length += 1
+    if len(result) < min_length:
+        return None
+    return result
+
+
+def _get_endpoint(target_url):
+    parsed = urlparse(target_url if '://' in target_url else '//' + target_url)
+    default_port = 443
+    if parsed.scheme == 'http':
+        default_port = 80
+    return parsed.hostname.lower(), str(parsed.port or default_port)
@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import pprint
 import string
@@ -9,12 +10,13 @@ import sys
 import tempfile
 import time
 from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
-from toposort import toposort, toposort_flatten
+from toposort import toposort_flatten
 
 from privacyscanner.filehandlers import DirectoryFileHandler
 from privacyscanner.raven import has_raven, raven
@@ -65,6 +67,9 @@ def load_config(config_file):
     # are stored. Use the default path if not configured.
     all_options = config['SCAN_MODULE_OPTIONS'].setdefault('__all__', {})
     all_options['storage_path'] = config['STORAGE_PATH']
+    # All worker processes on this host share a single DNS cache
+    # in the storage path unless this is disabled explicitly.
+    all_options.setdefault('shared_dns_cache', True)
 
     return config
 
@@ -158,21 +163,76 @@ def scan_site(args):
     logs_dir.mkdir(exist_ok=True)
     lock_dir = config['STORAGE_PATH'] / 'locks'
     lock_dir.mkdir(exist_ok=True)
-    scan_queue = [QueueEntry(mod_name, 0, None) for mod_name in scan_module_names]
-    scan_queue.reverse()
+    # A scan module is started as soon as all of its dependencies that
+    # are part of this scan have finished, so independent scan modules
+    # run concurrently in subprocesses. Scan modules may start threads
+    # (e.g., for Chrome), so we do not fork.
+    waiting = {scan_module_name: dependencies.get(scan_module_name, set()) &
+               set(scan_module_names) for scan_module_name in scan_module_names}
+    finished = set()
+    mp_context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max(len(waiting), 1),
+                             mp_context=mp_context) as executor:
+        futures = {}
+        while waiting or futures:
+            for scan_module_name in scan_module_names:
+                if scan_module_name in waiting and waiting[scan_module_name] <= finished:
+                    del waiting[scan_module_name]
+                    future = executor.submit(
+                        _run_scan_module, scan_module_name, config['SCAN_MODULES'],
+                        config['SCAN_MODULE_OPTIONS'], config['MAX_TRIES'], config['QUEUE_DB_DSN'],
+                        result.get_results(), results_dir, logs_dir, lock_dir)
+                    futures[future] = scan_module_name
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                scan_module_name = futures.pop(future)
+                finished.add(scan_module_name)
+                try:
+                    updates, module_has_error = future.result()
+                except Exception:
+                    logger = logging.Logger(scan_module_name)
+                    logger.addHandler(stream_handler)
+                    logger.exception('Scan module `%s` crashed.', scan_module_name)
+                    has_error = True
+                    continue
+                has_error = has_error or module_has_error
+                result.apply_updates(updates)
+                with result_file.open('w') as f:
+                    json.dump(result.get_results(), f, indent=2, sort_keys=True)
+                    f.write('\n')
+    pprint.pprint(result.get_results())
+    if has_error:
+        sys.exit(1)
+
+
+def _run_scan_module(scan_module_name, scan_module_list, scan_module_options,
+                     max_tries, queue_db_dsn, result_json, results_dir, logs_dir, lock_dir):
+    """Run a scan module including its retries in a subprocess.
+
+    Returns the changes to the result as patches and whether the scan
+    module had an error.
+    """
+    from .jobqueue import configure_queue_db
+
+    # Scan modules may cache results in the queue database.
+    configure_queue_db(queue_db_dsn)
+    scan_modules = load_modules(scan_module_list, scan_module_options)
+    mod = scan_modules[scan_module_name]
+    has_error = False
+    result = Result(result_json, DirectoryFileHandler(results_dir))
+    log_filename = (logs_dir / (mod.name + '.log'))
+    logger = logging.Logger(mod.name)
+    logger.addHandler(ScanStreamHandler())
+    logger.addHandler(ScanFileHandler(str(log_filename)))
+    mod.logger = logger
+    scan_queue = [QueueEntry(scan_module_name, 0, None)]
     while scan_queue:
         scan_module_name, num_try, not_before = scan_queue.pop()
         if not_before is not None:
             # noinspection PyTypeChecker
             while datetime.utcnow() < not_before:
                 time.sleep(0.5)
-        mod = scan_modules[scan_module_name]
         num_try += 1
-        log_filename = (logs_dir / (mod.name + '.log'))
-        file_handler = ScanFileHandler(str(log_filename))
-        logger = logging.Logger(mod.name)
-        logger.addHandler(stream_handler)
-        logger.addHandler(file_handler)
         with tempfile.TemporaryDirectory() as temp_dir:
             old_cwd = os.getcwd()
             os.chdir(temp_dir)
@@ -180,10 +240,9 @@ def scan_site(args):
             try:
                 with NumericLock(lock_dir) as worker_id:
                     scan_meta = ScanMeta(worker_id=worker_id, num_tries=num_try)
-                    mod.logger = logger
                     mod.scan_site(result, scan_meta)
             except RetryScan:
-                if num_try <= config['MAX_TRIES']:
+                if num_try <= max_tries:
                     scan_queue.append(QueueEntry(scan_module_name, num_try, not_before))
                     logger.info('Scan module `%s` will be retried', mod.name)
                 else:
@@ -191,19 +250,14 @@ def scan_site(args):
             except RescheduleLater as e:
                 scan_queue.append(QueueEntry(scan_module_name, num_try, e.not_before))
             except Exception:
-                if num_try <= config['MAX_TRIES']:
+                if num_try <= max_tries:
                     scan_queue.append(QueueEntry(scan_module_name, num_try, not_before))
                 has_error = True
                 logger.exception('Scan module `%s` failed.', mod.name)
             finally:
                 os.chdir(old_cwd)
-                with result_file.open('w') as f:
-                    json.dump(result.get_results(), f, indent=2, sort_keys=True)
-                    f.write('\n')
             logger.info('Finished %s', mod.name)
-    pprint.pprint(result.get_results())
-    if has_error:
-        sys.exit(1)
+    return result.get_updates(), has_error
 
 
 def update_dependencies(args):
@@ -225,6 +279,40 @@ def update_dependencies(args):
         print('\nNothing to update.')
 
 
+def prefetch_dns(args):
+    from .jobqueue import get_pending_sites
+
+    config = load_config(args.config)
+    _require_dependencies(config)
+
+    scan_modules = load_modules(config['SCAN_MODULES'],
+                                config['SCAN_MODULE_OPTIONS'])
+    if 'dns' not in scan_modules:
+        raise CommandError('The dns scan module is not enabled.')
+    dns_module = scan_modules['dns']
+    if not dns_module.options.get('shared_dns_cache'):
+        raise CommandError('Prefetching requires the shared DNS cache.')
+    if args.concurrency is not None:
+        dns_module.options['prefetch_concurrent_queries'] = args.concurrency
+
+    if args.sites:
+        try:
+            with open(args.sites) as f:
+                sites = [(line.strip(), None) for line in f if line.strip()]
+        except IOError as e:
+            raise CommandError('Could not open sites: {}'.format(e)) from e
+    else:
+        sites = list(get_pending_sites(config['QUEUE_DB_DSN'], dns_module.name))
+
+    logger = logging.Logger(dns_module.name)
+    logger.addHandler(ScanStreamHandler())
+    dns_module.logger = logger
+    time_start = time.time()
+    num_queries = dns_module.prefetch(sites)
+    print('Prefetched DNS records of {} sites with {} queries in {:.1f} seconds.'.format(
+        len(sites), num_queries, time.time() - time_start))
+
+
 def print_master_config(args):
     config = load_config(args.config)
     scan_modules = load_modules(config['SCAN_MODULES'],
@@ -276,6 +364,15 @@ def main():
     parser_print_master_config.add_argument('-c', '--config', help='Configuration_file')
     parser_print_master_config.set_defaults(func=print_master_config)
 
+    parser_prefetch_dns = subparsers.add_parser('prefetch_dns')
+    parser_prefetch_dns.add_argument('-c', '--config', help='Configuration_file')
+    parser_prefetch_dns.add_argument('-s', '--sites',
+                                     help='File with one site per line instead of '
+                                          'the sites of pending jobs')
+    parser_prefetch_dns.add_argument('--concurrency', type=int,
+                                     help='Maximum number of DNS queries in flight')
+    parser_prefetch_dns.set_defaults(func=prefetch_dns)
+
     parser_run_workers = subparsers.add_parser('update_dependencies')
     parser_run_workers.add_argument('--config', help='Configuration_file')
     parser_run_workers.set_defaults(func=update_dependencies)
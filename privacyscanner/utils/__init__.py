@@ -1,10 +1,12 @@
 import hashlib
+import heapq
 import os
 import errno
 import fcntl
 import re
+import struct
 import time
-from base64 import b32encode
+from base64 import b32encode, b64decode, b64encode
 from contextlib import suppress
 from urllib.request import Request, urlopen
 
@@ -13,6 +15,8 @@ import psutil
 
 FAKE_UA = 'Mozilla/5.0 (X11; Linux x86_64; rv:61.0) Gecko/20100101 Firefox/61.0'
 
+_TOKEN_SEPARATOR = re.compile(rb'[ \n]')
+
 
 class DownloadVerificationFailed(Exception):
     pass
@@ -87,16 +91,135 @@ def rand_str(length):
     return b32encode(rand_bits).decode()[:length].lower()
 
 
-def calculate_jaccard_index(a: bytes, b: bytes) -> float:
-    """Calculate the jaccard similarity of a and b."""
-    pattern = re.compile(rb'[ \n]')
-    # remove tokens containing / to prevent wrong classifications for
-    # absolute paths
-    a = {token for token in pattern.split(a) if b'/' not in token}
-    b = {token for token in pattern.split(b) if b'/' not in token}
-    intersection = a.intersection(b)
-    union = a.union(b)
-    return len(intersection) / len(union)
+class MinHash:
+    """Bottom-k MinHash signature of the tokens of a (large) document.
+
+    The document is split into tokens at spaces and newlines. Tokens
+    containing a slash are ignored to prevent wrong classifications for
+    absolute paths. Only the `size` smallest token hashes are kept, so
+    memory usage is bounded no matter how large the document is. The data
+    can be fed in chunks using update().
+
+    The jaccard similarity of two documents can be estimated by comparing
+    their signatures with similarity(). Tokens longer than MAX_TOKEN_SIZE
+    count as one token per piece. If both documents have less than `size`
+    distinct tokens (and pieces), the result is exact, otherwise it is an
+    approximation.
+    """
+    CHUNK_SIZE = 64 * 1024
+    # Longer tokens (e.g., of minified or binary data without separators)
+    # are split into pieces of this size, so the pending token stays small.
+    MAX_TOKEN_SIZE = 4096
+
+    def __init__(self, size=128):
+        self.size = size
+        # Max-heap (negated values) of the smallest hashes seen so far
+        self._heap = []
+        self._hashes = set()
+        self._pending = b''
+        # Hashes of the pieces of the pending token that are complete.
+        # They are only added when the token ends without a slash.
+        self._pending_hashes = []
+        self._pending_has_slash = False
+
+    def update(self, data: bytes):
+        for offset in range(0, len(data), self.CHUNK_SIZE):
+            tokens = _TOKEN_SEPARATOR.split(self._pending + data[offset:offset + self.CHUNK_SIZE])
+            # The last token might continue in the next chunk
+            pending = tokens.pop()
+            for token in tokens:
+                self._add_token(token)
+            # Pieces are cut at the same offsets of a token no matter how
+            # the data is chunked.
+            num_complete = len(pending) - len(pending) % self.MAX_TOKEN_SIZE
+            if num_complete:
+                self._add_pending_pieces(pending[:num_complete])
+            self._pending = pending[num_complete:]
+
+    def _add_pending_pieces(self, data):
+        if self._pending_has_slash or b'/' in data:
+            self._pending_has_slash = True
+            self._pending_hashes = []
+            return
+        self._pending_hashes += self._hash_pieces(data)
+        # Only the smallest hashes can end up in the signature
+        if len(self._pending_hashes) > 2 * self.size:
+            self._pending_hashes = heapq.nsmallest(self.size, self._pending_hashes)
+
+    def _add_token(self, token):
+        """Add the end of the pending token, which is complete now."""
+        if not self._pending_has_slash and b'/' not in token:
+            for token_hash in self._pending_hashes + self._hash_pieces(token):
+                self._add_hash(token_hash)
+        self._pending_hashes = []
+        self._pending_has_slash = False
+
+    def _hash_pieces(self, data):
+        return [struct.unpack('<Q', hashlib.blake2b(data[offset:offset + self.MAX_TOKEN_SIZE],
+                                                    digest_size=8).digest())[0]
+                for offset in range(0, len(data), self.MAX_TOKEN_SIZE)]
+
+    def _add_hash(self, token_hash):
+        if token_hash in self._hashes:
+            return
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, -token_hash)
+        elif token_hash < -self._heap[0]:
+            self._hashes.discard(-heapq.heapreplace(self._heap, -token_hash))
+        else:
+            return
+        self._hashes.add(token_hash)
+
+    def signature(self):
+        """Return the signature as sorted tuple of hashes.
+
+        This marks the end of the document, i.e., data passed to update()
+        afterwards starts a new token.
+        """
+        self._add_token(self._pending)
+        self._pending = b''
+        return tuple(sorted(self._hashes))
+
+    def serialize(self):
+        """Return the signature as compact string to be stored in results."""
+        signature = self.signature()
+        return b64encode(struct.pack('<{}Q'.format(len(signature)), *signature)).decode()
+
+    @classmethod
+    def deserialize(cls, serialized, size=None):
+        raw = b64decode(serialized)
+        signature = struct.unpack('<{}Q'.format(len(raw) // 8), raw)
+        minhash = cls(size if size is not None else max(len(signature), 1))
+        for token_hash in signature[:minhash.size]:
+            heapq.heappush(minhash._heap, -token_hash)
+            minhash._hashes.add(token_hash)
+        return minhash
+
+    def similarity(self, other):
+        """Estimate the jaccard similarity of both documents."""
+        a = set(self.signature())
+        b = set(other.signature())
+        size = min(self.size, other.size)
+        union = heapq.nsmallest(size, a | b)
+        if not union:
+            # Two documents without tokens are considered to be equal.
+            return 1.0
+        both = sum(1 for token_hash in union if token_hash in a and token_hash in b)
+        return both / len(union)
+
+
+def calculate_jaccard_index(a: bytes, b: bytes, size=128) -> float:
+    """Estimate the jaccard similarity of a and b using MinHash.
+
+    The result is only approximate if a or b has more than `size`
+    distinct tokens. Tokens longer than MinHash.MAX_TOKEN_SIZE are
+    compared piecewise.
+    """
+    minhash_a = MinHash(size)
+    minhash_a.update(a)
+    minhash_b = MinHash(size)
+    minhash_b.update(b)
+    return minhash_a.similarity(minhash_b)
 
 
 def kill_everything(pid, timeout=3, only_children=False):
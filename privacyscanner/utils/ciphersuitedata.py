@@ -0,0 +1,259 @@
+# Cipher suites exported from OpenSSL 1.1.1a with ALL ciphers string. We use
+# this table because not everyone has an OpenSSL with that many (ancient)
+# ciphers enabled. The IANA names are taken from OpenSSL and NSS, cipher
+# suites without an IANA name (SSLv2, drafts) have None.
+#
+# This module is only imported by privacyscanner.utils.cipherinfo on the
+# first lookup. Every row contains:
+# (id, name, iana_name, protocol, strength_bits, alg_bits, aead, symmetric,
+#  digest, kea, auth, kx, au, enc, mac)
+# where kx, au, enc and mac are the fields of the OpenSSL description.
+CIPHERSUITES = (
+    (0x03001302, 'TLS_AES_256_GCM_SHA384', 'TLS_AES_256_GCM_SHA384', 'TLSv1.3', 256, 256, True, 'aes-256-gcm', None, 'kx-any', 'auth-any', 'any', 'any', 'AESGCM(256)', 'AEAD'),
+    (0x03001303, 'TLS_CHACHA20_POLY1305_SHA256', 'TLS_CHACHA20_POLY1305_SHA256', 'TLSv1.3', 256, 256, True, 'chacha20-poly1305', None, 'kx-any', 'auth-any', 'any', 'any', 'CHACHA20/POLY1305(256)', 'AEAD'),
+    (0x03001301, 'TLS_AES_128_GCM_SHA256', 'TLS_AES_128_GCM_SHA256', 'TLSv1.3', 128, 128, True, 'aes-128-gcm', None, 'kx-any', 'auth-any', 'any', 'any', 'AESGCM(128)', 'AEAD'),
+    (0x0300C02C, 'ECDHE-ECDSA-AES256-GCM-SHA384', 'TLS_ECDHE_ECDSA_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AESGCM(256)', 'AEAD'),
+    (0x0300C030, 'ECDHE-RSA-AES256-GCM-SHA384', 'TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'AESGCM(256)', 'AEAD'),
+    (0x030000A3, 'DHE-DSS-AES256-GCM-SHA384', 'TLS_DHE_DSS_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'AESGCM(256)', 'AEAD'),
+    (0x0300009F, 'DHE-RSA-AES256-GCM-SHA384', 'TLS_DHE_RSA_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AESGCM(256)', 'AEAD'),
+    (0x0300CCA9, 'ECDHE-ECDSA-CHACHA20-POLY1305', 'TLS_ECDHE_ECDSA_WITH_CHACHA20_POLY1305_SHA256', 'TLSv1.2', 256, 256, True, 'chacha20-poly1305', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'CHACHA20/POLY1305(256)', 'AEAD'),
+    (0x0300CCA8, 'ECDHE-RSA-CHACHA20-POLY1305', 'TLS_ECDHE_RSA_WITH_CHACHA20_POLY1305_SHA256', 'TLSv1.2', 256, 256, True, 'chacha20-poly1305', None, 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'CHACHA20/POLY1305(256)', 'AEAD'),
+    (0x0300CCAA, 'DHE-RSA-CHACHA20-POLY1305', 'TLS_DHE_RSA_WITH_CHACHA20_POLY1305_SHA256', 'TLSv1.2', 256, 256, True, 'chacha20-poly1305', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'CHACHA20/POLY1305(256)', 'AEAD'),
+    (0x0300C0AF, 'ECDHE-ECDSA-AES256-CCM8', 'TLS_ECDHE_ECDSA_WITH_AES_256_CCM_8', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AESCCM8(256)', 'AEAD'),
+    (0x0300C0AD, 'ECDHE-ECDSA-AES256-CCM', 'TLS_ECDHE_ECDSA_WITH_AES_256_CCM', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AESCCM(256)', 'AEAD'),
+    (0x0300C0A3, 'DHE-RSA-AES256-CCM8', 'TLS_DHE_RSA_WITH_AES_256_CCM_8', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AESCCM8(256)', 'AEAD'),
+    (0x0300C09F, 'DHE-RSA-AES256-CCM', 'TLS_DHE_RSA_WITH_AES_256_CCM', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AESCCM(256)', 'AEAD'),
+    (0x0300C05D, 'ECDHE-ECDSA-ARIA256-GCM-SHA384', 'TLS_ECDHE_ECDSA_WITH_ARIA_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aria-256-gcm', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'ARIAGCM(256)', 'AEAD'),
+    (0x0300C061, 'ECDHE-ARIA256-GCM-SHA384', 'TLS_ECDHE_RSA_WITH_ARIA_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aria-256-gcm', None, 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'ARIAGCM(256)', 'AEAD'),
+    (0x0300C057, 'DHE-DSS-ARIA256-GCM-SHA384', 'TLS_DHE_DSS_WITH_ARIA_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aria-256-gcm', None, 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'ARIAGCM(256)', 'AEAD'),
+    (0x0300C053, 'DHE-RSA-ARIA256-GCM-SHA384', 'TLS_DHE_RSA_WITH_ARIA_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aria-256-gcm', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'ARIAGCM(256)', 'AEAD'),
+    (0x030000A7, 'ADH-AES256-GCM-SHA384', 'TLS_DH_anon_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-dhe', 'auth-null', 'DH', 'None', 'AESGCM(256)', 'AEAD'),
+    (0x0300C02B, 'ECDHE-ECDSA-AES128-GCM-SHA256', 'TLS_ECDHE_ECDSA_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AESGCM(128)', 'AEAD'),
+    (0x0300C02F, 'ECDHE-RSA-AES128-GCM-SHA256', 'TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'AESGCM(128)', 'AEAD'),
+    (0x030000A2, 'DHE-DSS-AES128-GCM-SHA256', 'TLS_DHE_DSS_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'AESGCM(128)', 'AEAD'),
+    (0x0300009E, 'DHE-RSA-AES128-GCM-SHA256', 'TLS_DHE_RSA_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AESGCM(128)', 'AEAD'),
+    (0x0300C0AE, 'ECDHE-ECDSA-AES128-CCM8', 'TLS_ECDHE_ECDSA_WITH_AES_128_CCM_8', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AESCCM8(128)', 'AEAD'),
+    (0x0300C0AC, 'ECDHE-ECDSA-AES128-CCM', 'TLS_ECDHE_ECDSA_WITH_AES_128_CCM', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AESCCM(128)', 'AEAD'),
+    (0x0300C0A2, 'DHE-RSA-AES128-CCM8', 'TLS_DHE_RSA_WITH_AES_128_CCM_8', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AESCCM8(128)', 'AEAD'),
+    (0x0300C09E, 'DHE-RSA-AES128-CCM', 'TLS_DHE_RSA_WITH_AES_128_CCM', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AESCCM(128)', 'AEAD'),
+    (0x0300C05C, 'ECDHE-ECDSA-ARIA128-GCM-SHA256', 'TLS_ECDHE_ECDSA_WITH_ARIA_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aria-128-gcm', None, 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'ARIAGCM(128)', 'AEAD'),
+    (0x0300C060, 'ECDHE-ARIA128-GCM-SHA256', 'TLS_ECDHE_RSA_WITH_ARIA_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aria-128-gcm', None, 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'ARIAGCM(128)', 'AEAD'),
+    (0x0300C056, 'DHE-DSS-ARIA128-GCM-SHA256', 'TLS_DHE_DSS_WITH_ARIA_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aria-128-gcm', None, 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'ARIAGCM(128)', 'AEAD'),
+    (0x0300C052, 'DHE-RSA-ARIA128-GCM-SHA256', 'TLS_DHE_RSA_WITH_ARIA_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aria-128-gcm', None, 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'ARIAGCM(128)', 'AEAD'),
+    (0x030000A6, 'ADH-AES128-GCM-SHA256', 'TLS_DH_anon_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-dhe', 'auth-null', 'DH', 'None', 'AESGCM(128)', 'AEAD'),
+    (0x0300C024, 'ECDHE-ECDSA-AES256-SHA384', 'TLS_ECDHE_ECDSA_WITH_AES_256_CBC_SHA384', 'TLSv1.2', 256, 256, False, 'aes-256-cbc', 'sha384', 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AES(256)', 'SHA384'),
+    (0x0300C028, 'ECDHE-RSA-AES256-SHA384', 'TLS_ECDHE_RSA_WITH_AES_256_CBC_SHA384', 'TLSv1.2', 256, 256, False, 'aes-256-cbc', 'sha384', 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'AES(256)', 'SHA384'),
+    (0x0300006B, 'DHE-RSA-AES256-SHA256', 'TLS_DHE_RSA_WITH_AES_256_CBC_SHA256', 'TLSv1.2', 256, 256, False, 'aes-256-cbc', 'sha256', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AES(256)', 'SHA256'),
+    (0x0300006A, 'DHE-DSS-AES256-SHA256', 'TLS_DHE_DSS_WITH_AES_256_CBC_SHA256', 'TLSv1.2', 256, 256, False, 'aes-256-cbc', 'sha256', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'AES(256)', 'SHA256'),
+    (0x0300C073, 'ECDHE-ECDSA-CAMELLIA256-SHA384', 'TLS_ECDHE_ECDSA_WITH_CAMELLIA_256_CBC_SHA384', 'TLSv1.2', 256, 256, False, 'camellia-256-cbc', 'sha384', 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'Camellia(256)', 'SHA384'),
+    (0x0300C077, 'ECDHE-RSA-CAMELLIA256-SHA384', 'TLS_ECDHE_RSA_WITH_CAMELLIA_256_CBC_SHA384', 'TLSv1.2', 256, 256, False, 'camellia-256-cbc', 'sha384', 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'Camellia(256)', 'SHA384'),
+    (0x030000C4, 'DHE-RSA-CAMELLIA256-SHA256', 'TLS_DHE_RSA_WITH_CAMELLIA_256_CBC_SHA256', 'TLSv1.2', 256, 256, False, 'camellia-256-cbc', 'sha256', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'Camellia(256)', 'SHA256'),
+    (0x030000C3, 'DHE-DSS-CAMELLIA256-SHA256', 'TLS_DHE_DSS_WITH_CAMELLIA_256_CBC_SHA256', 'TLSv1.2', 256, 256, False, 'camellia-256-cbc', 'sha256', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'Camellia(256)', 'SHA256'),
+    (0x0300006D, 'ADH-AES256-SHA256', 'TLS_DH_anon_WITH_AES_256_CBC_SHA256', 'TLSv1.2', 256, 256, False, 'aes-256-cbc', 'sha256', 'kx-dhe', 'auth-null', 'DH', 'None', 'AES(256)', 'SHA256'),
+    (0x030000C5, 'ADH-CAMELLIA256-SHA256', 'TLS_DH_anon_WITH_CAMELLIA_256_CBC_SHA256', 'TLSv1.2', 256, 256, False, 'camellia-256-cbc', 'sha256', 'kx-dhe', 'auth-null', 'DH', 'None', 'Camellia(256)', 'SHA256'),
+    (0x0300C023, 'ECDHE-ECDSA-AES128-SHA256', 'TLS_ECDHE_ECDSA_WITH_AES_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AES(128)', 'SHA256'),
+    (0x0300C027, 'ECDHE-RSA-AES128-SHA256', 'TLS_ECDHE_RSA_WITH_AES_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'AES(128)', 'SHA256'),
+    (0x03000067, 'DHE-RSA-AES128-SHA256', 'TLS_DHE_RSA_WITH_AES_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AES(128)', 'SHA256'),
+    (0x03000040, 'DHE-DSS-AES128-SHA256', 'TLS_DHE_DSS_WITH_AES_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'AES(128)', 'SHA256'),
+    (0x0300C072, 'ECDHE-ECDSA-CAMELLIA128-SHA256', 'TLS_ECDHE_ECDSA_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'Camellia(128)', 'SHA256'),
+    (0x0300C076, 'ECDHE-RSA-CAMELLIA128-SHA256', 'TLS_ECDHE_RSA_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'Camellia(128)', 'SHA256'),
+    (0x030000BE, 'DHE-RSA-CAMELLIA128-SHA256', 'TLS_DHE_RSA_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'Camellia(128)', 'SHA256'),
+    (0x030000BD, 'DHE-DSS-CAMELLIA128-SHA256', 'TLS_DHE_DSS_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'Camellia(128)', 'SHA256'),
+    (0x0300006C, 'ADH-AES128-SHA256', 'TLS_DH_anon_WITH_AES_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-dhe', 'auth-null', 'DH', 'None', 'AES(128)', 'SHA256'),
+    (0x030000BF, 'ADH-CAMELLIA128-SHA256', 'TLS_DH_anon_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-dhe', 'auth-null', 'DH', 'None', 'Camellia(128)', 'SHA256'),
+    (0x0300C00A, 'ECDHE-ECDSA-AES256-SHA', 'TLS_ECDHE_ECDSA_WITH_AES_256_CBC_SHA', 'TLSv1.0', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AES(256)', 'SHA1'),
+    (0x0300C014, 'ECDHE-RSA-AES256-SHA', 'TLS_ECDHE_RSA_WITH_AES_256_CBC_SHA', 'TLSv1.0', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'AES(256)', 'SHA1'),
+    (0x03000039, 'DHE-RSA-AES256-SHA', 'TLS_DHE_RSA_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AES(256)', 'SHA1'),
+    (0x03000038, 'DHE-DSS-AES256-SHA', 'TLS_DHE_DSS_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'AES(256)', 'SHA1'),
+    (0x03000088, 'DHE-RSA-CAMELLIA256-SHA', 'TLS_DHE_RSA_WITH_CAMELLIA_256_CBC_SHA', 'SSLv3', 256, 256, False, 'camellia-256-cbc', 'sha1', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'Camellia(256)', 'SHA1'),
+    (0x03000087, 'DHE-DSS-CAMELLIA256-SHA', 'TLS_DHE_DSS_WITH_CAMELLIA_256_CBC_SHA', 'SSLv3', 256, 256, False, 'camellia-256-cbc', 'sha1', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'Camellia(256)', 'SHA1'),
+    (0x0300C019, 'AECDH-AES256-SHA', 'TLS_ECDH_anon_WITH_AES_256_CBC_SHA', 'TLSv1.0', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-ecdhe', 'auth-null', 'ECDH', 'None', 'AES(256)', 'SHA1'),
+    (0x0300003A, 'ADH-AES256-SHA', 'TLS_DH_anon_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-dhe', 'auth-null', 'DH', 'None', 'AES(256)', 'SHA1'),
+    (0x03000089, 'ADH-CAMELLIA256-SHA', 'TLS_DH_anon_WITH_CAMELLIA_256_CBC_SHA', 'SSLv3', 256, 256, False, 'camellia-256-cbc', 'sha1', 'kx-dhe', 'auth-null', 'DH', 'None', 'Camellia(256)', 'SHA1'),
+    (0x0300C009, 'ECDHE-ECDSA-AES128-SHA', 'TLS_ECDHE_ECDSA_WITH_AES_128_CBC_SHA', 'TLSv1.0', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-ecdhe', 'auth-ecdsa', 'ECDH', 'ECDSA', 'AES(128)', 'SHA1'),
+    (0x0300C013, 'ECDHE-RSA-AES128-SHA', 'TLS_ECDHE_RSA_WITH_AES_128_CBC_SHA', 'TLSv1.0', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-ecdhe', 'auth-rsa', 'ECDH', 'RSA', 'AES(128)', 'SHA1'),
+    (0x03000033, 'DHE-RSA-AES128-SHA', 'TLS_DHE_RSA_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'AES(128)', 'SHA1'),
+    (0x03000032, 'DHE-DSS-AES128-SHA', 'TLS_DHE_DSS_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'AES(128)', 'SHA1'),
+    (0x0300009A, 'DHE-RSA-SEED-SHA', 'TLS_DHE_RSA_WITH_SEED_CBC_SHA', 'SSLv3', 128, 128, False, 'seed-cbc', 'sha1', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'SEED(128)', 'SHA1'),
+    (0x03000099, 'DHE-DSS-SEED-SHA', 'TLS_DHE_DSS_WITH_SEED_CBC_SHA', 'SSLv3', 128, 128, False, 'seed-cbc', 'sha1', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'SEED(128)', 'SHA1'),
+    (0x03000045, 'DHE-RSA-CAMELLIA128-SHA', 'TLS_DHE_RSA_WITH_CAMELLIA_128_CBC_SHA', 'SSLv3', 128, 128, False, 'camellia-128-cbc', 'sha1', 'kx-dhe', 'auth-rsa', 'DH', 'RSA', 'Camellia(128)', 'SHA1'),
+    (0x03000044, 'DHE-DSS-CAMELLIA128-SHA', 'TLS_DHE_DSS_WITH_CAMELLIA_128_CBC_SHA', 'SSLv3', 128, 128, False, 'camellia-128-cbc', 'sha1', 'kx-dhe', 'auth-dss', 'DH', 'DSS', 'Camellia(128)', 'SHA1'),
+    (0x0300C018, 'AECDH-AES128-SHA', 'TLS_ECDH_anon_WITH_AES_128_CBC_SHA', 'TLSv1.0', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-ecdhe', 'auth-null', 'ECDH', 'None', 'AES(128)', 'SHA1'),
+    (0x03000034, 'ADH-AES128-SHA', 'TLS_DH_anon_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-dhe', 'auth-null', 'DH', 'None', 'AES(128)', 'SHA1'),
+    (0x0300009B, 'ADH-SEED-SHA', 'TLS_DH_anon_WITH_SEED_CBC_SHA', 'SSLv3', 128, 128, False, 'seed-cbc', 'sha1', 'kx-dhe', 'auth-null', 'DH', 'None', 'SEED(128)', 'SHA1'),
+    (0x03000046, 'ADH-CAMELLIA128-SHA', 'TLS_DH_anon_WITH_CAMELLIA_128_CBC_SHA', 'SSLv3', 128, 128, False, 'camellia-128-cbc', 'sha1', 'kx-dhe', 'auth-null', 'DH', 'None', 'Camellia(128)', 'SHA1'),
+    (0x030000AD, 'RSA-PSK-AES256-GCM-SHA384', 'TLS_RSA_PSK_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'AESGCM(256)', 'AEAD'),
+    (0x030000AB, 'DHE-PSK-AES256-GCM-SHA384', 'TLS_DHE_PSK_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AESGCM(256)', 'AEAD'),
+    (0x0300CCAE, 'RSA-PSK-CHACHA20-POLY1305', 'TLS_RSA_PSK_WITH_CHACHA20_POLY1305_SHA256', 'TLSv1.2', 256, 256, True, 'chacha20-poly1305', None, 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'CHACHA20/POLY1305(256)', 'AEAD'),
+    (0x0300CCAD, 'DHE-PSK-CHACHA20-POLY1305', 'TLS_DHE_PSK_WITH_CHACHA20_POLY1305_SHA256', 'TLSv1.2', 256, 256, True, 'chacha20-poly1305', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'CHACHA20/POLY1305(256)', 'AEAD'),
+    (0x0300CCAC, 'ECDHE-PSK-CHACHA20-POLY1305', 'TLS_ECDHE_PSK_WITH_CHACHA20_POLY1305_SHA256', 'TLSv1.2', 256, 256, True, 'chacha20-poly1305', None, 'kx-ecdhe-psk', 'auth-psk', 'ECDHEPSK', 'PSK', 'CHACHA20/POLY1305(256)', 'AEAD'),
+    (0x0300C0AB, 'DHE-PSK-AES256-CCM8', 'TLS_PSK_DHE_WITH_AES_256_CCM_8', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AESCCM8(256)', 'AEAD'),
+    (0x0300C0A7, 'DHE-PSK-AES256-CCM', 'TLS_DHE_PSK_WITH_AES_256_CCM', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AESCCM(256)', 'AEAD'),
+    (0x0300C06F, 'RSA-PSK-ARIA256-GCM-SHA384', 'TLS_RSA_PSK_WITH_ARIA_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aria-256-gcm', None, 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'ARIAGCM(256)', 'AEAD'),
+    (0x0300C06D, 'DHE-PSK-ARIA256-GCM-SHA384', 'TLS_DHE_PSK_WITH_ARIA_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aria-256-gcm', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'ARIAGCM(256)', 'AEAD'),
+    (0x0300009D, 'AES256-GCM-SHA384', 'TLS_RSA_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AESGCM(256)', 'AEAD'),
+    (0x0300C0A1, 'AES256-CCM8', 'TLS_RSA_WITH_AES_256_CCM_8', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AESCCM8(256)', 'AEAD'),
+    (0x0300C09D, 'AES256-CCM', 'TLS_RSA_WITH_AES_256_CCM', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AESCCM(256)', 'AEAD'),
+    (0x0300C051, 'ARIA256-GCM-SHA384', 'TLS_RSA_WITH_ARIA_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aria-256-gcm', None, 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'ARIAGCM(256)', 'AEAD'),
+    (0x030000A9, 'PSK-AES256-GCM-SHA384', 'TLS_PSK_WITH_AES_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aes-256-gcm', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AESGCM(256)', 'AEAD'),
+    (0x0300CCAB, 'PSK-CHACHA20-POLY1305', 'TLS_PSK_WITH_CHACHA20_POLY1305_SHA256', 'TLSv1.2', 256, 256, True, 'chacha20-poly1305', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'CHACHA20/POLY1305(256)', 'AEAD'),
+    (0x0300C0A9, 'PSK-AES256-CCM8', 'TLS_PSK_WITH_AES_256_CCM_8', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AESCCM8(256)', 'AEAD'),
+    (0x0300C0A5, 'PSK-AES256-CCM', 'TLS_PSK_WITH_AES_256_CCM', 'TLSv1.2', 256, 256, True, 'aes-256-ccm', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AESCCM(256)', 'AEAD'),
+    (0x0300C06B, 'PSK-ARIA256-GCM-SHA384', 'TLS_PSK_WITH_ARIA_256_GCM_SHA384', 'TLSv1.2', 256, 256, True, 'aria-256-gcm', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'ARIAGCM(256)', 'AEAD'),
+    (0x030000AC, 'RSA-PSK-AES128-GCM-SHA256', 'TLS_RSA_PSK_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'AESGCM(128)', 'AEAD'),
+    (0x030000AA, 'DHE-PSK-AES128-GCM-SHA256', 'TLS_DHE_PSK_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AESGCM(128)', 'AEAD'),
+    (0x0300C0AA, 'DHE-PSK-AES128-CCM8', 'TLS_PSK_DHE_WITH_AES_128_CCM_8', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AESCCM8(128)', 'AEAD'),
+    (0x0300C0A6, 'DHE-PSK-AES128-CCM', 'TLS_DHE_PSK_WITH_AES_128_CCM', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AESCCM(128)', 'AEAD'),
+    (0x0300C06E, 'RSA-PSK-ARIA128-GCM-SHA256', 'TLS_RSA_PSK_WITH_ARIA_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aria-128-gcm', None, 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'ARIAGCM(128)', 'AEAD'),
+    (0x0300C06C, 'DHE-PSK-ARIA128-GCM-SHA256', 'TLS_DHE_PSK_WITH_ARIA_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aria-128-gcm', None, 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'ARIAGCM(128)', 'AEAD'),
+    (0x0300009C, 'AES128-GCM-SHA256', 'TLS_RSA_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AESGCM(128)', 'AEAD'),
+    (0x0300C0A0, 'AES128-CCM8', 'TLS_RSA_WITH_AES_128_CCM_8', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AESCCM8(128)', 'AEAD'),
+    (0x0300C09C, 'AES128-CCM', 'TLS_RSA_WITH_AES_128_CCM', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AESCCM(128)', 'AEAD'),
+    (0x0300C050, 'ARIA128-GCM-SHA256', 'TLS_RSA_WITH_ARIA_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aria-128-gcm', None, 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'ARIAGCM(128)', 'AEAD'),
+    (0x030000A8, 'PSK-AES128-GCM-SHA256', 'TLS_PSK_WITH_AES_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aes-128-gcm', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AESGCM(128)', 'AEAD'),
+    (0x0300C0A8, 'PSK-AES128-CCM8', 'TLS_PSK_WITH_AES_128_CCM_8', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AESCCM8(128)', 'AEAD'),
+    (0x0300C0A4, 'PSK-AES128-CCM', 'TLS_PSK_WITH_AES_128_CCM', 'TLSv1.2', 128, 128, True, 'aes-128-ccm', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AESCCM(128)', 'AEAD'),
+    (0x0300C06A, 'PSK-ARIA128-GCM-SHA256', 'TLS_PSK_WITH_ARIA_128_GCM_SHA256', 'TLSv1.2', 128, 128, True, 'aria-128-gcm', None, 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'ARIAGCM(128)', 'AEAD'),
+    (0x0300003D, 'AES256-SHA256', 'TLS_RSA_WITH_AES_256_CBC_SHA256', 'TLSv1.2', 256, 256, False, 'aes-256-cbc', 'sha256', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AES(256)', 'SHA256'),
+    (0x030000C0, 'CAMELLIA256-SHA256', 'TLS_RSA_WITH_CAMELLIA_256_CBC_SHA256', 'TLSv1.2', 256, 256, False, 'camellia-256-cbc', 'sha256', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'Camellia(256)', 'SHA256'),
+    (0x0300003C, 'AES128-SHA256', 'TLS_RSA_WITH_AES_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AES(128)', 'SHA256'),
+    (0x030000BA, 'CAMELLIA128-SHA256', 'TLS_RSA_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'Camellia(128)', 'SHA256'),
+    (0x0300C038, 'ECDHE-PSK-AES256-CBC-SHA384', 'TLS_ECDHE_PSK_WITH_AES_256_CBC_SHA384', 'TLSv1.0', 256, 256, False, 'aes-256-cbc', 'sha384', 'kx-ecdhe-psk', 'auth-psk', 'ECDHEPSK', 'PSK', 'AES(256)', 'SHA384'),
+    (0x0300C036, 'ECDHE-PSK-AES256-CBC-SHA', 'TLS_ECDHE_PSK_WITH_AES_256_CBC_SHA', 'TLSv1.0', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-ecdhe-psk', 'auth-psk', 'ECDHEPSK', 'PSK', 'AES(256)', 'SHA1'),
+    (0x0300C022, 'SRP-DSS-AES-256-CBC-SHA', 'TLS_SRP_SHA_DSS_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-srp', 'auth-dss', 'SRP', 'DSS', 'AES(256)', 'SHA1'),
+    (0x0300C021, 'SRP-RSA-AES-256-CBC-SHA', 'TLS_SRP_SHA_RSA_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-srp', 'auth-rsa', 'SRP', 'RSA', 'AES(256)', 'SHA1'),
+    (0x0300C020, 'SRP-AES-256-CBC-SHA', 'TLS_SRP_SHA_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-srp', 'auth-srp', 'SRP', 'SRP', 'AES(256)', 'SHA1'),
+    (0x030000B7, 'RSA-PSK-AES256-CBC-SHA384', 'TLS_RSA_PSK_WITH_AES_256_CBC_SHA384', 'TLSv1.0', 256, 256, False, 'aes-256-cbc', 'sha384', 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'AES(256)', 'SHA384'),
+    (0x030000B3, 'DHE-PSK-AES256-CBC-SHA384', 'TLS_DHE_PSK_WITH_AES_256_CBC_SHA384', 'TLSv1.0', 256, 256, False, 'aes-256-cbc', 'sha384', 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AES(256)', 'SHA384'),
+    (0x03000095, 'RSA-PSK-AES256-CBC-SHA', 'TLS_RSA_PSK_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'AES(256)', 'SHA1'),
+    (0x03000091, 'DHE-PSK-AES256-CBC-SHA', 'TLS_DHE_PSK_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AES(256)', 'SHA1'),
+    (0x0300C09B, 'ECDHE-PSK-CAMELLIA256-SHA384', 'TLS_ECDHE_PSK_WITH_CAMELLIA_256_CBC_SHA384', 'TLSv1.0', 256, 256, False, 'camellia-256-cbc', 'sha384', 'kx-ecdhe-psk', 'auth-psk', 'ECDHEPSK', 'PSK', 'Camellia(256)', 'SHA384'),
+    (0x0300C099, 'RSA-PSK-CAMELLIA256-SHA384', 'TLS_RSA_PSK_WITH_CAMELLIA_256_CBC_SHA384', 'TLSv1.0', 256, 256, False, 'camellia-256-cbc', 'sha384', 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'Camellia(256)', 'SHA384'),
+    (0x0300C097, 'DHE-PSK-CAMELLIA256-SHA384', 'TLS_DHE_PSK_WITH_CAMELLIA_256_CBC_SHA384', 'TLSv1.0', 256, 256, False, 'camellia-256-cbc', 'sha384', 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'Camellia(256)', 'SHA384'),
+    (0x03000035, 'AES256-SHA', 'TLS_RSA_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AES(256)', 'SHA1'),
+    (0x03000084, 'CAMELLIA256-SHA', 'TLS_RSA_WITH_CAMELLIA_256_CBC_SHA', 'SSLv3', 256, 256, False, 'camellia-256-cbc', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'Camellia(256)', 'SHA1'),
+    (0x030000AF, 'PSK-AES256-CBC-SHA384', 'TLS_PSK_WITH_AES_256_CBC_SHA384', 'TLSv1.0', 256, 256, False, 'aes-256-cbc', 'sha384', 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AES(256)', 'SHA384'),
+    (0x0300008D, 'PSK-AES256-CBC-SHA', 'TLS_PSK_WITH_AES_256_CBC_SHA', 'SSLv3', 256, 256, False, 'aes-256-cbc', 'sha1', 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AES(256)', 'SHA1'),
+    (0x0300C095, 'PSK-CAMELLIA256-SHA384', 'TLS_PSK_WITH_CAMELLIA_256_CBC_SHA384', 'TLSv1.0', 256, 256, False, 'camellia-256-cbc', 'sha384', 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'Camellia(256)', 'SHA384'),
+    (0x0300C037, 'ECDHE-PSK-AES128-CBC-SHA256', 'TLS_ECDHE_PSK_WITH_AES_128_CBC_SHA256', 'TLSv1.0', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-ecdhe-psk', 'auth-psk', 'ECDHEPSK', 'PSK', 'AES(128)', 'SHA256'),
+    (0x0300C035, 'ECDHE-PSK-AES128-CBC-SHA', 'TLS_ECDHE_PSK_WITH_AES_128_CBC_SHA', 'TLSv1.0', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-ecdhe-psk', 'auth-psk', 'ECDHEPSK', 'PSK', 'AES(128)', 'SHA1'),
+    (0x0300C01F, 'SRP-DSS-AES-128-CBC-SHA', 'TLS_SRP_SHA_DSS_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-srp', 'auth-dss', 'SRP', 'DSS', 'AES(128)', 'SHA1'),
+    (0x0300C01E, 'SRP-RSA-AES-128-CBC-SHA', 'TLS_SRP_SHA_RSA_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-srp', 'auth-rsa', 'SRP', 'RSA', 'AES(128)', 'SHA1'),
+    (0x0300C01D, 'SRP-AES-128-CBC-SHA', 'TLS_SRP_SHA_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-srp', 'auth-srp', 'SRP', 'SRP', 'AES(128)', 'SHA1'),
+    (0x030000B6, 'RSA-PSK-AES128-CBC-SHA256', 'TLS_RSA_PSK_WITH_AES_128_CBC_SHA256', 'TLSv1.0', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'AES(128)', 'SHA256'),
+    (0x030000B2, 'DHE-PSK-AES128-CBC-SHA256', 'TLS_DHE_PSK_WITH_AES_128_CBC_SHA256', 'TLSv1.0', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AES(128)', 'SHA256'),
+    (0x03000094, 'RSA-PSK-AES128-CBC-SHA', 'TLS_RSA_PSK_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'AES(128)', 'SHA1'),
+    (0x03000090, 'DHE-PSK-AES128-CBC-SHA', 'TLS_DHE_PSK_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'AES(128)', 'SHA1'),
+    (0x0300C09A, 'ECDHE-PSK-CAMELLIA128-SHA256', 'TLS_ECDHE_PSK_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.0', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-ecdhe-psk', 'auth-psk', 'ECDHEPSK', 'PSK', 'Camellia(128)', 'SHA256'),
+    (0x0300C098, 'RSA-PSK-CAMELLIA128-SHA256', 'TLS_RSA_PSK_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.0', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'Camellia(128)', 'SHA256'),
+    (0x0300C096, 'DHE-PSK-CAMELLIA128-SHA256', 'TLS_DHE_PSK_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.0', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-dhe-psk', 'auth-psk', 'DHEPSK', 'PSK', 'Camellia(128)', 'SHA256'),
+    (0x0300002F, 'AES128-SHA', 'TLS_RSA_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'AES(128)', 'SHA1'),
+    (0x03000096, 'SEED-SHA', 'TLS_RSA_WITH_SEED_CBC_SHA', 'SSLv3', 128, 128, False, 'seed-cbc', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'SEED(128)', 'SHA1'),
+    (0x03000041, 'CAMELLIA128-SHA', 'TLS_RSA_WITH_CAMELLIA_128_CBC_SHA', 'SSLv3', 128, 128, False, 'camellia-128-cbc', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'Camellia(128)', 'SHA1'),
+    (0x030000AE, 'PSK-AES128-CBC-SHA256', 'TLS_PSK_WITH_AES_128_CBC_SHA256', 'TLSv1.0', 128, 128, False, 'aes-128-cbc', 'sha256', 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AES(128)', 'SHA256'),
+    (0x0300008C, 'PSK-AES128-CBC-SHA', 'TLS_PSK_WITH_AES_128_CBC_SHA', 'SSLv3', 128, 128, False, 'aes-128-cbc', 'sha1', 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'AES(128)', 'SHA1'),
+    (0x0300C094, 'PSK-CAMELLIA128-SHA256', 'TLS_PSK_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.0', 128, 128, False, 'camellia-128-cbc', 'sha256', 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'Camellia(128)', 'SHA256'),
+    (0x0300C015, 'AECDH-NULL-SHA', 'TLS_ECDH_anon_WITH_NULL_SHA', 'TLSv1.0', 0, 0, False, None, 'sha1', 'kx-ecdhe', 'auth-null', 'ECDH', 'None', 'None', 'SHA1'),
+    (0x0000CC14, 'ECDHE-ECDSA-CHACHA20-POLY1305-OLD', None, 'TLSv1.2', None, None, True, 'chacha20-256', None, 'kx-ecdh', 'auth-ecdsa', 'ECDH', 'ECDSA', 'ChaCha20(256)', 'AEAD'),
+    (0x0000CC13, 'ECDHE-RSA-CHACHA20-POLY1305-OLD', None, 'TLSv1.2', None, None, True, 'chacha20-256', None, 'kx-ecdh', 'auth-rsa', 'ECDH', 'RSA', 'ChaCha20(256)', 'AEAD'),
+    (0x0000CC15, 'DHE-RSA-CHACHA20-POLY1305-OLD', None, 'TLSv1.2', None, None, True, 'chacha20-256', None, 'kx-dh', 'auth-rsa', 'DH', 'RSA', 'ChaCha20(256)', 'AEAD'),
+    (0x000000A5, 'DH-DSS-AES256-GCM-SHA384', 'TLS_DH_DSS_WITH_AES_256_GCM_SHA384', 'TLSv1.2', None, None, True, 'aes-256-gcm', None, 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'AESGCM(256)', 'AEAD'),
+    (0x000000A1, 'DH-RSA-AES256-GCM-SHA384', 'TLS_DH_RSA_WITH_AES_256_GCM_SHA384', 'TLSv1.2', None, None, True, 'aes-256-gcm', None, 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'AESGCM(256)', 'AEAD'),
+    (0x00000069, 'DH-RSA-AES256-SHA256', 'TLS_DH_RSA_WITH_AES_256_CBC_SHA256', 'TLSv1.2', None, None, False, 'aes-256-cbc', 'sha256', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'AES(256)', 'SHA256'),
+    (0x00000068, 'DH-DSS-AES256-SHA256', 'TLS_DH_DSS_WITH_AES_256_CBC_SHA256', 'TLSv1.2', None, None, False, 'aes-256-cbc', 'sha256', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'AES(256)', 'SHA256'),
+    (0x00000037, 'DH-RSA-AES256-SHA', 'TLS_DH_RSA_WITH_AES_256_CBC_SHA', 'SSLv3', None, None, False, 'aes-256-cbc', 'sha1', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'AES(256)', 'SHA1'),
+    (0x00000036, 'DH-DSS-AES256-SHA', 'TLS_DH_DSS_WITH_AES_256_CBC_SHA', 'SSLv3', None, None, False, 'aes-256-cbc', 'sha1', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'AES(256)', 'SHA1'),
+    (0x000000C2, 'DH-RSA-CAMELLIA256-SHA256', 'TLS_DH_RSA_WITH_CAMELLIA_256_CBC_SHA256', 'TLSv1.2', None, None, False, 'camellia-256-cbc', 'sha256', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'Camellia(256)', 'SHA256'),
+    (0x000000C1, 'DH-DSS-CAMELLIA256-SHA256', 'TLS_DH_DSS_WITH_CAMELLIA_256_CBC_SHA256', 'TLSv1.2', None, None, False, 'camellia-256-cbc', 'sha256', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'Camellia(256)', 'SHA256'),
+    (0x00000086, 'DH-RSA-CAMELLIA256-SHA', 'TLS_DH_RSA_WITH_CAMELLIA_256_CBC_SHA', 'SSLv3', None, None, False, 'camellia-256-cbc', 'sha1', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'Camellia(256)', 'SHA1'),
+    (0x00000085, 'DH-DSS-CAMELLIA256-SHA', 'TLS_DH_DSS_WITH_CAMELLIA_256_CBC_SHA', 'SSLv3', None, None, False, 'camellia-256-cbc', 'sha1', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'Camellia(256)', 'SHA1'),
+    (0x0000C032, 'ECDH-RSA-AES256-GCM-SHA384', 'TLS_ECDH_RSA_WITH_AES_256_GCM_SHA384', 'TLSv1.2', None, None, True, 'aes-256-gcm', None, 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'AESGCM(256)', 'AEAD'),
+    (0x0000C02E, 'ECDH-ECDSA-AES256-GCM-SHA384', 'TLS_ECDH_ECDSA_WITH_AES_256_GCM_SHA384', 'TLSv1.2', None, None, True, 'aes-256-gcm', None, 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'AESGCM(256)', 'AEAD'),
+    (0x0000C02A, 'ECDH-RSA-AES256-SHA384', 'TLS_ECDH_RSA_WITH_AES_256_CBC_SHA384', 'TLSv1.2', None, None, False, 'aes-256-cbc', 'sha384', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'AES(256)', 'SHA384'),
+    (0x0000C026, 'ECDH-ECDSA-AES256-SHA384', 'TLS_ECDH_ECDSA_WITH_AES_256_CBC_SHA384', 'TLSv1.2', None, None, False, 'aes-256-cbc', 'sha384', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'AES(256)', 'SHA384'),
+    (0x0000C00F, 'ECDH-RSA-AES256-SHA', 'TLS_ECDH_RSA_WITH_AES_256_CBC_SHA', 'SSLv3', None, None, False, 'aes-256-cbc', 'sha1', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'AES(256)', 'SHA1'),
+    (0x0000C005, 'ECDH-ECDSA-AES256-SHA', 'TLS_ECDH_ECDSA_WITH_AES_256_CBC_SHA', 'SSLv3', None, None, False, 'aes-256-cbc', 'sha1', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'AES(256)', 'SHA1'),
+    (0x0000C079, 'ECDH-RSA-CAMELLIA256-SHA384', 'TLS_ECDH_RSA_WITH_CAMELLIA_256_CBC_SHA384', 'TLSv1.2', None, None, False, 'camellia-256-cbc', 'sha384', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'Camellia(256)', 'SHA384'),
+    (0x0000C075, 'ECDH-ECDSA-CAMELLIA256-SHA384', 'TLS_ECDH_ECDSA_WITH_CAMELLIA_256_CBC_SHA384', 'TLSv1.2', None, None, False, 'camellia-256-cbc', 'sha384', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'Camellia(256)', 'SHA384'),
+    (0x000000A4, 'DH-DSS-AES128-GCM-SHA256', 'TLS_DH_DSS_WITH_AES_128_GCM_SHA256', 'TLSv1.2', None, None, True, 'aes-128-gcm', None, 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'AESGCM(128)', 'AEAD'),
+    (0x000000A0, 'DH-RSA-AES128-GCM-SHA256', 'TLS_DH_RSA_WITH_AES_128_GCM_SHA256', 'TLSv1.2', None, None, True, 'aes-128-gcm', None, 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'AESGCM(128)', 'AEAD'),
+    (0x0000003F, 'DH-RSA-AES128-SHA256', 'TLS_DH_RSA_WITH_AES_128_CBC_SHA256', 'TLSv1.2', None, None, False, 'aes-128-cbc', 'sha256', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'AES(128)', 'SHA256'),
+    (0x0000003E, 'DH-DSS-AES128-SHA256', 'TLS_DH_DSS_WITH_AES_128_CBC_SHA256', 'TLSv1.2', None, None, False, 'aes-128-cbc', 'sha256', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'AES(128)', 'SHA256'),
+    (0x00000031, 'DH-RSA-AES128-SHA', 'TLS_DH_RSA_WITH_AES_128_CBC_SHA', 'SSLv3', None, None, False, 'aes-128-cbc', 'sha1', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'AES(128)', 'SHA1'),
+    (0x00000030, 'DH-DSS-AES128-SHA', 'TLS_DH_DSS_WITH_AES_128_CBC_SHA', 'SSLv3', None, None, False, 'aes-128-cbc', 'sha1', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'AES(128)', 'SHA1'),
+    (0x000000BC, 'DH-RSA-CAMELLIA128-SHA256', 'TLS_DH_RSA_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', None, None, False, 'camellia-128-cbc', 'sha256', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'Camellia(128)', 'SHA256'),
+    (0x000000BB, 'DH-DSS-CAMELLIA128-SHA256', 'TLS_DH_DSS_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', None, None, False, 'camellia-128-cbc', 'sha256', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'Camellia(128)', 'SHA256'),
+    (0x00000098, 'DH-RSA-SEED-SHA', 'TLS_DH_RSA_WITH_SEED_CBC_SHA', 'SSLv3', None, None, False, 'seed-128-cbc', 'sha1', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'SEED(128)', 'SHA1'),
+    (0x00000097, 'DH-DSS-SEED-SHA', 'TLS_DH_DSS_WITH_SEED_CBC_SHA', 'SSLv3', None, None, False, 'seed-128-cbc', 'sha1', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'SEED(128)', 'SHA1'),
+    (0x00000043, 'DH-RSA-CAMELLIA128-SHA', 'TLS_DH_RSA_WITH_CAMELLIA_128_CBC_SHA', 'SSLv3', None, None, False, 'camellia-128-cbc', 'sha1', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'Camellia(128)', 'SHA1'),
+    (0x00000042, 'DH-DSS-CAMELLIA128-SHA', 'TLS_DH_DSS_WITH_CAMELLIA_128_CBC_SHA', 'SSLv3', None, None, False, 'camellia-128-cbc', 'sha1', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'Camellia(128)', 'SHA1'),
+    (0x0000C031, 'ECDH-RSA-AES128-GCM-SHA256', 'TLS_ECDH_RSA_WITH_AES_128_GCM_SHA256', 'TLSv1.2', None, None, True, 'aes-128-gcm', None, 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'AESGCM(128)', 'AEAD'),
+    (0x0000C02D, 'ECDH-ECDSA-AES128-GCM-SHA256', 'TLS_ECDH_ECDSA_WITH_AES_128_GCM_SHA256', 'TLSv1.2', None, None, True, 'aes-128-gcm', None, 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'AESGCM(128)', 'AEAD'),
+    (0x0000C029, 'ECDH-RSA-AES128-SHA256', 'TLS_ECDH_RSA_WITH_AES_128_CBC_SHA256', 'TLSv1.2', None, None, False, 'aes-128-cbc', 'sha256', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'AES(128)', 'SHA256'),
+    (0x0000C025, 'ECDH-ECDSA-AES128-SHA256', 'TLS_ECDH_ECDSA_WITH_AES_128_CBC_SHA256', 'TLSv1.2', None, None, False, 'aes-128-cbc', 'sha256', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'AES(128)', 'SHA256'),
+    (0x0000C00E, 'ECDH-RSA-AES128-SHA', 'TLS_ECDH_RSA_WITH_AES_128_CBC_SHA', 'SSLv3', None, None, False, 'aes-128-cbc', 'sha1', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'AES(128)', 'SHA1'),
+    (0x0000C004, 'ECDH-ECDSA-AES128-SHA', 'TLS_ECDH_ECDSA_WITH_AES_128_CBC_SHA', 'SSLv3', None, None, False, 'aes-128-cbc', 'sha1', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'AES(128)', 'SHA1'),
+    (0x0000C078, 'ECDH-RSA-CAMELLIA128-SHA256', 'TLS_ECDH_RSA_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', None, None, False, 'camellia-128-cbc', 'sha256', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'Camellia(128)', 'SHA256'),
+    (0x0000C074, 'ECDH-ECDSA-CAMELLIA128-SHA256', 'TLS_ECDH_ECDSA_WITH_CAMELLIA_128_CBC_SHA256', 'TLSv1.2', None, None, False, 'camellia-128-cbc', 'sha256', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'Camellia(128)', 'SHA256'),
+    (0x00000007, 'IDEA-CBC-SHA', 'TLS_RSA_WITH_IDEA_CBC_SHA', 'SSLv3', None, None, False, 'idea-128-cbc', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'IDEA(128)', 'SHA1'),
+    (0x00050080, 'IDEA-CBC-MD5', None, 'SSLv2', None, None, False, 'idea-128-cbc', 'md5', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'IDEA(128)', 'MD5'),
+    (0x00030080, 'RC2-CBC-MD5', None, 'SSLv2', None, None, False, 'rc2-128', 'md5', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'RC2(128)', 'MD5'),
+    (0x0000C011, 'ECDHE-RSA-RC4-SHA', 'TLS_ECDHE_RSA_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-ecdh', 'auth-rsa', 'ECDH', 'RSA', 'RC4(128)', 'SHA1'),
+    (0x0000C007, 'ECDHE-ECDSA-RC4-SHA', 'TLS_ECDHE_ECDSA_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-ecdh', 'auth-ecdsa', 'ECDH', 'ECDSA', 'RC4(128)', 'SHA1'),
+    (0x00000066, 'DHE-DSS-RC4-SHA', 'TLS_DHE_DSS_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-dh', 'auth-dss', 'DH', 'DSS', 'RC4(128)', 'SHA1'),
+    (0x0000C016, 'AECDH-RC4-SHA', 'TLS_ECDH_anon_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-ecdh', 'auth-none', 'ECDH', 'None', 'RC4(128)', 'SHA1'),
+    (0x00000018, 'ADH-RC4-MD5', 'TLS_DH_anon_WITH_RC4_128_MD5', 'SSLv3', None, None, False, 'rc4-128', 'md5', 'kx-dh', 'auth-none', 'DH', 'None', 'RC4(128)', 'MD5'),
+    (0x0000C00C, 'ECDH-RSA-RC4-SHA', 'TLS_ECDH_RSA_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'RC4(128)', 'SHA1'),
+    (0x0000C002, 'ECDH-ECDSA-RC4-SHA', 'TLS_ECDH_ECDSA_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'RC4(128)', 'SHA1'),
+    (0x00000005, 'RC4-SHA', 'TLS_RSA_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'RC4(128)', 'SHA1'),
+    (0x00010080, 'RC4-MD5', None, 'SSLv2', None, None, False, 'rc4-128', 'md5', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'RC4(128)', 'MD5'),
+    (0x00000092, 'RSA-PSK-RC4-SHA', 'TLS_RSA_PSK_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', 'RC4(128)', 'SHA1'),
+    (0x0000008A, 'PSK-RC4-SHA', 'TLS_PSK_WITH_RC4_128_SHA', 'SSLv3', None, None, False, 'rc4-128', 'sha1', 'kx-psk', 'auth-psk', 'PSK', 'PSK', 'RC4(128)', 'SHA1'),
+    (0x0000C012, 'ECDHE-RSA-DES-CBC3-SHA', 'TLS_ECDHE_RSA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-ecdh', 'auth-rsa', 'ECDH', 'RSA', '3DES(168)', 'SHA1'),
+    (0x0000C008, 'ECDHE-ECDSA-DES-CBC3-SHA', 'TLS_ECDHE_ECDSA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-ecdh', 'auth-ecdsa', 'ECDH', 'ECDSA', '3DES(168)', 'SHA1'),
+    (0x0000C01C, 'SRP-DSS-3DES-EDE-CBC-SHA', 'TLS_SRP_SHA_DSS_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-srp', 'auth-dss', 'SRP', 'DSS', '3DES(168)', 'SHA1'),
+    (0x0000C01B, 'SRP-RSA-3DES-EDE-CBC-SHA', 'TLS_SRP_SHA_RSA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-srp', 'auth-rsa', 'SRP', 'RSA', '3DES(168)', 'SHA1'),
+    (0x0000C01A, 'SRP-3DES-EDE-CBC-SHA', 'TLS_SRP_SHA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-srp', 'auth-srp', 'SRP', 'SRP', '3DES(168)', 'SHA1'),
+    (0x00000016, 'EDH-RSA-DES-CBC3-SHA', 'TLS_DHE_RSA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-dh', 'auth-rsa', 'DH', 'RSA', '3DES(168)', 'SHA1'),
+    (0x00000013, 'EDH-DSS-DES-CBC3-SHA', 'TLS_DHE_DSS_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-dh', 'auth-dss', 'DH', 'DSS', '3DES(168)', 'SHA1'),
+    (0x00000010, 'DH-RSA-DES-CBC3-SHA', 'TLS_DH_RSA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', '3DES(168)', 'SHA1'),
+    (0x0000000D, 'DH-DSS-DES-CBC3-SHA', 'TLS_DH_DSS_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', '3DES(168)', 'SHA1'),
+    (0x0000C017, 'AECDH-DES-CBC3-SHA', 'TLS_ECDH_anon_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-ecdh', 'auth-none', 'ECDH', 'None', '3DES(168)', 'SHA1'),
+    (0x0000001B, 'ADH-DES-CBC3-SHA', 'TLS_DH_anon_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-dh', 'auth-none', 'DH', 'None', '3DES(168)', 'SHA1'),
+    (0x0000C00D, 'ECDH-RSA-DES-CBC3-SHA', 'TLS_ECDH_RSA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', '3DES(168)', 'SHA1'),
+    (0x0000C003, 'ECDH-ECDSA-DES-CBC3-SHA', 'TLS_ECDH_ECDSA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', '3DES(168)', 'SHA1'),
+    (0x0000000A, 'DES-CBC3-SHA', 'TLS_RSA_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', '3DES(168)', 'SHA1'),
+    (0x000700C0, 'DES-CBC3-MD5', None, 'SSLv2', None, None, False, '3des-168', 'md5', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', '3DES(168)', 'MD5'),
+    (0x00000093, 'RSA-PSK-3DES-EDE-CBC-SHA', 'TLS_RSA_PSK_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-rsa-psk', 'auth-rsa', 'RSAPSK', 'RSA', '3DES(168)', 'SHA1'),
+    (0x0000008B, 'PSK-3DES-EDE-CBC-SHA', 'TLS_PSK_WITH_3DES_EDE_CBC_SHA', 'SSLv3', None, None, False, '3des-168', 'sha1', 'kx-psk', 'auth-psk', 'PSK', 'PSK', '3DES(168)', 'SHA1'),
+    (0x00080080, 'RC4-64-MD5', None, 'SSLv2', None, None, False, 'rc4-64', 'md5', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'RC4(64)', 'MD5'),
+    (0x00000063, 'EXP1024-DHE-DSS-DES-CBC-SHA', 'TLS_DHE_DSS_EXPORT1024_WITH_DES_CBC_SHA', 'SSLv3', None, None, False, 'des-56-cbc', 'sha1', 'kx-dh-1024', 'auth-dss', 'DH(1024)', 'DSS', 'DES(56)', 'SHA1'),
+    (0x00000015, 'EDH-RSA-DES-CBC-SHA', 'TLS_DHE_RSA_WITH_DES_CBC_SHA', 'SSLv3', None, None, False, 'des-56-cbc', 'sha1', 'kx-dh', 'auth-rsa', 'DH', 'RSA', 'DES(56)', 'SHA1'),
+    (0x00000012, 'EDH-DSS-DES-CBC-SHA', 'TLS_DHE_DSS_WITH_DES_CBC_SHA', 'SSLv3', None, None, False, 'des-56-cbc', 'sha1', 'kx-dh', 'auth-dss', 'DH', 'DSS', 'DES(56)', 'SHA1'),
+    (0x0000000F, 'DH-RSA-DES-CBC-SHA', 'TLS_DH_RSA_WITH_DES_CBC_SHA', 'SSLv3', None, None, False, 'des-56-cbc', 'sha1', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'DES(56)', 'SHA1'),
+    (0x0000000C, 'DH-DSS-DES-CBC-SHA', 'TLS_DH_DSS_WITH_DES_CBC_SHA', 'SSLv3', None, None, False, 'des-56-cbc', 'sha1', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'DES(56)', 'SHA1'),
+    (0x0000001A, 'ADH-DES-CBC-SHA', 'TLS_DH_anon_WITH_DES_CBC_SHA', 'SSLv3', None, None, False, 'des-56-cbc', 'sha1', 'kx-dh', 'auth-none', 'DH', 'None', 'DES(56)', 'SHA1'),
+    (0x00000062, 'EXP1024-DES-CBC-SHA', 'TLS_RSA_EXPORT1024_WITH_DES_CBC_SHA', 'SSLv3', None, None, False, 'des-56-cbc', 'sha1', 'kx-rsa-1024', 'auth-rsa', 'RSA(1024)', 'RSA', 'DES(56)', 'SHA1'),
+    (0x00000009, 'DES-CBC-SHA', 'TLS_RSA_WITH_DES_CBC_SHA', 'SSLv3', None, None, False, 'des-56-cbc', 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'DES(56)', 'SHA1'),
+    (0x00000061, 'EXP1024-RC2-CBC-MD5', 'TLS_RSA_EXPORT1024_WITH_RC2_CBC_56_MD5', 'SSLv3', None, None, False, 'rc2-56', 'md5', 'kx-rsa-1024', 'auth-rsa', 'RSA(1024)', 'RSA', 'RC2(56)', 'MD5'),
+    (0x00060040, 'DES-CBC-MD5', None, 'SSLv2', None, None, False, 'des-56-cbc', 'md5', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'DES(56)', 'MD5'),
+    (0x00000065, 'EXP1024-DHE-DSS-RC4-SHA', 'TLS_DHE_DSS_EXPORT1024_WITH_RC4_56_SHA', 'SSLv3', None, None, False, 'rc4-56', 'sha1', 'kx-dh-1024', 'auth-dss', 'DH(1024)', 'DSS', 'RC4(56)', 'SHA1'),
+    (0x00000064, 'EXP1024-RC4-SHA', 'TLS_RSA_EXPORT1024_WITH_RC4_56_SHA', 'SSLv3', None, None, False, 'rc4-56', 'sha1', 'kx-rsa-1024', 'auth-rsa', 'RSA(1024)', 'RSA', 'RC4(56)', 'SHA1'),
+    (0x00000060, 'EXP1024-RC4-MD5', 'TLS_RSA_EXPORT1024_WITH_RC4_56_MD5', 'SSLv3', None, None, False, 'rc4-56', 'md5', 'kx-rsa-1024', 'auth-rsa', 'RSA(1024)', 'RSA', 'RC4(56)', 'MD5'),
+    (0x00000014, 'EXP-EDH-RSA-DES-CBC-SHA', 'TLS_DHE_RSA_EXPORT_WITH_DES40_CBC_SHA', 'SSLv3', None, None, False, 'des-40-cbc', 'sha1', 'kx-dh-512', 'auth-rsa', 'DH(512)', 'RSA', 'DES(40)', 'SHA1'),
+    (0x00000011, 'EXP-EDH-DSS-DES-CBC-SHA', 'TLS_DHE_DSS_EXPORT_WITH_DES40_CBC_SHA', 'SSLv3', None, None, False, 'des-40-cbc', 'sha1', 'kx-dh-512', 'auth-dss', 'DH(512)', 'DSS', 'DES(40)', 'SHA1'),
+    (0x0000000E, 'EXP-DH-RSA-DES-CBC-SHA', 'TLS_DH_RSA_EXPORT_WITH_DES40_CBC_SHA', 'SSLv3', None, None, False, 'des-40-cbc', 'sha1', 'kx-dh-rsa', 'auth-dh', 'DH/RSA', 'DH', 'DES(40)', 'SHA1'),
+    (0x0000000B, 'EXP-DH-DSS-DES-CBC-SHA', 'TLS_DH_DSS_EXPORT_WITH_DES40_CBC_SHA', 'SSLv3', None, None, False, 'des-40-cbc', 'sha1', 'kx-dh-dss', 'auth-dh', 'DH/DSS', 'DH', 'DES(40)', 'SHA1'),
+    (0x00000019, 'EXP-ADH-DES-CBC-SHA', 'TLS_DH_anon_EXPORT_WITH_DES40_CBC_SHA', 'SSLv3', None, None, False, 'des-40-cbc', 'sha1', 'kx-dh-512', 'auth-none', 'DH(512)', 'None', 'DES(40)', 'SHA1'),
+    (0x00000008, 'EXP-DES-CBC-SHA', 'TLS_RSA_EXPORT_WITH_DES40_CBC_SHA', 'SSLv3', None, None, False, 'des-40-cbc', 'sha1', 'kx-rsa-512', 'auth-rsa', 'RSA(512)', 'RSA', 'DES(40)', 'SHA1'),
+    (0x00040080, 'EXP-RC2-CBC-MD5', None, 'SSLv2', None, None, False, 'rc2-40', 'md5', 'kx-rsa-512', 'auth-rsa', 'RSA(512)', 'RSA', 'RC2(40)', 'MD5'),
+    (0x00000017, 'EXP-ADH-RC4-MD5', 'TLS_DH_anon_EXPORT_WITH_RC4_40_MD5', 'SSLv3', None, None, False, 'rc4-40', 'md5', 'kx-dh-512', 'auth-none', 'DH(512)', 'None', 'RC4(40)', 'MD5'),
+    (0x00020080, 'EXP-RC4-MD5', None, 'SSLv2', None, None, False, 'rc4-40', 'md5', 'kx-rsa-512', 'auth-rsa', 'RSA(512)', 'RSA', 'RC4(40)', 'MD5'),
+    (0x0000C010, 'ECDHE-RSA-NULL-SHA', 'TLS_ECDHE_RSA_WITH_NULL_SHA', 'SSLv3', None, None, False, None, 'sha1', 'kx-ecdh', 'auth-rsa', 'ECDH', 'RSA', 'None', 'SHA1'),
+    (0x0000C006, 'ECDHE-ECDSA-NULL-SHA', 'TLS_ECDHE_ECDSA_WITH_NULL_SHA', 'SSLv3', None, None, False, None, 'sha1', 'kx-ecdh', 'auth-ecdsa', 'ECDH', 'ECDSA', 'None', 'SHA1'),
+    (0x0000C00B, 'ECDH-RSA-NULL-SHA', 'TLS_ECDH_RSA_WITH_NULL_SHA', 'SSLv3', None, None, False, None, 'sha1', 'kx-ecdh-rsa', 'auth-ecdh', 'ECDH/RSA', 'ECDH', 'None', 'SHA1'),
+    (0x0000C001, 'ECDH-ECDSA-NULL-SHA', 'TLS_ECDH_ECDSA_WITH_NULL_SHA', 'SSLv3', None, None, False, None, 'sha1', 'kx-ecdh-ecdsa', 'auth-ecdh', 'ECDH/ECDSA', 'ECDH', 'None', 'SHA1'),
+    (0x0000003B, 'NULL-SHA256', 'TLS_RSA_WITH_NULL_SHA256', 'TLSv1.2', None, None, False, None, 'sha256', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'None', 'SHA256'),
+    (0x00000002, 'NULL-SHA', 'TLS_RSA_WITH_NULL_SHA', 'SSLv3', None, None, False, None, 'sha1', 'kx-rsa', 'auth-rsa', 'RSA', 'RSA', 'None', 'SHA1'),
+    (0x00000000, 'NULL-MD5', None, 'SSLv2', None, None, False, None, 'md5', 'kx-rsa-512', 'auth-rsa', 'RSA(512)', 'RSA', 'None', 'MD5'),
+)
@@ -0,0 +1,358 @@
+"""
+Concurrent DNS resolution with a cache that respects TTLs.
+
+Answers are cached for the TTL of their RRset. Negative answers (NXDOMAIN
+and NODATA) are cached as described in RFC 2308, i.e., for the minimum of
+the TTL and the MINIMUM field of the SOA record in the authority section.
+Server failures are cached shortly; timeouts are never cached.
+
+By default, the cache is shared by all scans running in the same process.
+Call configure_default_cache() to share it with all processes on the host
+instead. The host-level cache is an SQLite database in WAL mode, so all
+processes access the same pages through shared memory.
+"""
+import asyncio
+import ipaddress
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional
+
+import dns.asyncresolver
+import dns.exception
+import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
+import dns.resolver
+
+
+DEFAULT_NEGATIVE_TTL = 300
+SERVFAIL_TTL = 60
+SHARED_CACHE_FILE = 'dnscache.sqlite3'
+
+_NEGATIVE_ERRORS = {
+    'NXDOMAIN': dns.resolver.NXDOMAIN,
+    'NoAnswer': dns.resolver.NoAnswer,
+    'NoNameservers': dns.resolver.NoNameservers,
+}
+
+
+class CacheEntry(NamedTuple):
+    expires: float
+    # Name of the negative answer (see _NEGATIVE_ERRORS) or None
+    error: Optional[str]
+    # Text representation of the records (empty for negative answers)
+    records: List[str]
+
+
+class DNSCache:
+    def __init__(self, max_entries=100000, max_ttl=86400):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, qname, rdtype):
+        key = _cache_key(qname, rdtype)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires < time.time():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, qname, rdtype, ttl, error=None, records=None):
+        key = _cache_key(qname, rdtype)
+        ttl = min(ttl, self.max_ttl)
+        self._entries[key] = CacheEntry(time.time() + ttl, error, records or [])
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class SharedDNSCache:
+    """DNSCache which is shared by all processes on the host.
+
+    It provides the same interface as DNSCache. Errors of the underlying
+    database, e.g. if it is locked for too long, are treated as cache
+    misses, because the cache must never break scanning.
+
+    Accessing the database may block, so CachingResolver calls the
+    methods in the thread of executor instead of the event loop.
+    """
+    _PURGE_INTERVAL = 1000
+
+    def __init__(self, path, max_ttl=86400):
+        self.path = str(path)
+        self.max_ttl = max_ttl
+        self.hits = 0
+        self.misses = 0
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._conn = None
+        self._lock = threading.Lock()
+        self._num_sets = 0
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=1, isolation_level=None,
+                                         check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS dns_cache ('
+                               'qname TEXT NOT NULL, rdtype TEXT NOT NULL, '
+                               'expires REAL NOT NULL, error TEXT, records TEXT NOT NULL, '
+                               'PRIMARY KEY (qname, rdtype))')
+        return self._conn
+
+    def get(self, qname, rdtype):
+        qname, rdtype = _cache_key(qname, rdtype)
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    'SELECT expires, error, records FROM dns_cache '
+                    'WHERE qname = ? AND rdtype = ? AND expires >= ?',
+                    (qname, rdtype, time.time())).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        expires, error, records = row
+        return CacheEntry(expires, error, json.loads(records))
+
+    def set(self, qname, rdtype, ttl, error=None, records=None):
+        qname, rdtype = _cache_key(qname, rdtype)
+        now = time.time()
+        expires = now + min(ttl, self.max_ttl)
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute('INSERT OR REPLACE INTO dns_cache VALUES (?, ?, ?, ?, ?)',
+                             (qname, rdtype, expires, error, json.dumps(records or [])))
+                self._num_sets += 1
+                if self._num_sets % self._PURGE_INTERVAL == 0:
+                    conn.execute('DELETE FROM dns_cache WHERE expires < ?', (now,))
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute('DELETE FROM dns_cache')
+
+
+class CachingResolver:
+    """Resolve DNS records asynchronously using a DNSCache.
+
+    resolve() behaves like dns.asyncresolver.Resolver.resolve(), i.e., it
+    raises NXDOMAIN, NoAnswer, NoNameservers and Timeout (and other DNS
+    exceptions) from dns.resolver. However, it returns a list of rdata
+    objects instead of an Answer.
+    """
+    def __init__(self, cache=None, lifetime=None, min_ttl=0):
+        self.cache = cache if cache is not None else get_default_cache()
+        # Answers are cached at least this long, e.g., when prefetching
+        # records for scans that run later. Negative answers are never
+        # kept longer than their TTL, since the records might be added.
+        self.min_ttl = min_ttl
+        # Cache statistics of this resolver only
+        self.hits = 0
+        self.misses = 0
+        self.num_queries = 0
+        # Queries in flight, so concurrent identical queries are sent once
+        self._pending = {}
+        self._resolver = dns.asyncresolver.Resolver()
+        if lifetime is not None:
+            self._resolver.lifetime = lifetime
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def log_statistics(self, logger):
+        if self.hit_rate is None:
+            return
+        logger.info('DNS cache hit rate: %.1f%% (%d hits, %d misses)',
+                    self.hit_rate * 100, self.hits, self.misses)
+
+    async def resolve(self, qname, rdtype):
+        rdtype = str(rdtype).upper()
+        entry = await self._call_cache(self.cache.get, qname, rdtype)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if entry.error is not None:
+                raise _NEGATIVE_ERRORS[entry.error]()
+            return [_rdata_from_text(rdtype, text) for text in entry.records]
+        key = _cache_key(qname, rdtype)
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve(qname, rdtype))
+            self._pending[key] = task
+            task.add_done_callback(lambda _task: self._forget(key, _task))
+        # Other callers might still wait for the query, so cancelling
+        # one of them must not cancel the query itself.
+        return list(await asyncio.shield(task))
+
+    def _forget(self, key, task):
+        self._pending.pop(key, None)
+        # Retrieve the exception, in case all callers have been cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _call_cache(self, method, *args):
+        executor = getattr(self.cache, 'executor', None)
+        if executor is None:
+            return method(*args)
+        return await asyncio.get_event_loop().run_in_executor(executor, method, *args)
+
+    async def _resolve(self, qname, rdtype):
+        self.num_queries += 1
+        try:
+            answer = await self._resolver.resolve(qname, rdtype)
+        except dns.resolver.NXDOMAIN as e:
+            await self._call_cache(self.cache.set, qname, rdtype, _negative_ttl(e),
+                                   'NXDOMAIN')
+            raise
+        except dns.resolver.NoAnswer as e:
+            await self._call_cache(self.cache.set, qname, rdtype, _negative_ttl(e),
+                                   'NoAnswer')
+            raise
+        except dns.resolver.NoNameservers:
+            # Server failures are never kept longer, we want to retry them.
+            await self._call_cache(self.cache.set, qname, rdtype, SERVFAIL_TTL,
+                                   'NoNameservers')
+            raise
+        records = list(answer)
+        await self._call_cache(self.cache.set, qname, rdtype,
+                               max(answer.rrset.ttl, self.min_ttl), None,
+                               [record.to_text() for record in records])
+        return records
+
+
+def run_with_deadline(coroutines, timeout, default=None):
+    """Run the coroutines of the dict concurrently in a new event loop.
+
+    Returns a dict with the same keys and the results of the coroutines.
+    Coroutines that have not finished after timeout seconds are cancelled
+    and their result is default. Exceptions raised by the coroutines are
+    propagated. Tasks started by the coroutines are cancelled as well
+    before the loop is closed.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        tasks = {key: loop.create_task(coroutine) for key, coroutine in coroutines.items()}
+        if not tasks:
+            return {}
+        loop.run_until_complete(asyncio.wait(list(tasks.values()), timeout=timeout))
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        return {key: default if task in pending else task.result()
+                for key, task in tasks.items()}
+    finally:
+        leftover = [task for task in asyncio.all_tasks(loop) if not task.done()]
+        for task in leftover:
+            task.cancel()
+        if leftover:
+            loop.run_until_complete(asyncio.gather(*leftover, return_exceptions=True))
+        loop.close()
+
+
+def resolve_addresses(hostnames, timeout, logger=None):
+    """Return a dict with the first IPv4 (or else IPv6) address of every host.
+
+    The address is None if the host could not be resolved in time.
+    """
+    resolver = CachingResolver(lifetime=timeout)
+
+    async def resolve(hostname):
+        try:
+            return str(ipaddress.ip_address(hostname))
+        except ValueError:
+            pass
+        for rdtype in ('A', 'AAAA'):
+            try:
+                records = await resolver.resolve(hostname, rdtype)
+            except dns.exception.DNSException:
+                continue
+            if records:
+                return records[0].to_text()
+        return None
+
+    addresses = run_with_deadline({hostname: resolve(hostname) for hostname in hostnames},
+                                  timeout)
+    if logger is not None:
+        resolver.log_statistics(logger)
+    return addresses
+
+
+_default_cache = None
+
+
+def get_default_cache():
+    global _default_cache
+
+    if _default_cache is None:
+        _default_cache = DNSCache()
+    return _default_cache
+
+
+def configure_default_cache(options):
+    """Configure the default cache based on the options of a scan module.
+
+    If the `shared_dns_cache` option is set, all processes on the host
+    share their cache via a file in the storage path. Otherwise, the
+    cache is only shared within the process.
+    """
+    global _default_cache
+
+    if not options.get('shared_dns_cache'):
+        return
+    path = str(options['storage_path'] / SHARED_CACHE_FILE)
+    if isinstance(_default_cache, SharedDNSCache) and _default_cache.path == path:
+        return
+    _default_cache = SharedDNSCache(path)
+
+
+def _cache_key(qname, rdtype):
+    qname = str(qname).lower()
+    if not qname.endswith('.'):
+        qname += '.'
+    return qname, str(rdtype).upper()
+
+
+def _rdata_from_text(rdtype, text):
+    return dns.rdata.from_text(dns.rdataclass.IN, dns.rdatatype.from_text(rdtype), text)
+
+
+def _negative_ttl(exc):
+    # See RFC 2308, Section 5: The TTL of a negative answer is taken from
+    # the SOA record in the authority section of the response.
+    try:
+        if isinstance(exc, dns.resolver.NXDOMAIN):
+            responses = exc.responses().values()
+        else:
+            responses = [exc.kwargs['response']]
+    except (AttributeError, KeyError):
+        return DEFAULT_NEGATIVE_TTL
+    for response in responses:
+        for rrset in getattr(response, 'authority', []):
+            if rrset.rdtype == dns.rdatatype.SOA:
+                return min(rrset.ttl, rrset[0].minimum)
+    return DEFAULT_NEGATIVE_TTL
@@ -0,0 +1,87 @@
+"""
+Search for many byte patterns at once.
+
+Small sets of patterns are searched one by one with bytes.find(), large
+ones are compiled into a regular expression, so the search always runs in
+C instead of byte by byte in Python. Data can be fed in chunks, e.g.,
+while a response is being downloaded. The end of a chunk is carried over
+to the next one, so matches that span chunk boundaries are found too.
+"""
+import re
+
+
+# Up to this many patterns, searching each of them with bytes.find() is
+# faster than a regular expression, which has no multi-pattern algorithm.
+MAX_LITERALS = 16
+
+
+class MultiPatternSearch:
+    def __init__(self, patterns):
+        """Prepare the search for a list of byte patterns.
+
+        Matches are reported as indexes into this list.
+        """
+        self.patterns = list(patterns)
+        self._indexes = {}
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError('Empty patterns are not supported.')
+            self._indexes.setdefault(pattern, index)
+        # Only this many bytes of a chunk can be the start of a match
+        # that ends in the next chunk.
+        self._overlap = max((len(pattern) for pattern in self.patterns), default=1) - 1
+        self._searches = {}
+
+    def _get_search(self, indexes):
+        search = self._searches.get(indexes)
+        if search is None:
+            # Longer patterns first, so a pattern is not hidden by one of
+            # its prefixes.
+            patterns = sorted({self.patterns[index] for index in indexes}, key=len,
+                              reverse=True)
+            if len(patterns) > MAX_LITERALS:
+                search = re.compile(b'|'.join(re.escape(pattern) for pattern in patterns))
+            else:
+                search = _Literals(patterns)
+            self._searches[indexes] = search
+        return search
+
+    def feed(self, data, tail=b'', indexes=None):
+        """Search data for the patterns with the given indexes (all by default).
+
+        Returns a tuple (tail, index) with the end of data that has to be
+        passed to the next call for the next chunk, and the index of a
+        pattern that was found or None. A search for a set of indexes
+        only ever reports one of them.
+        """
+        if indexes is None:
+            indexes = range(len(self.patterns))
+        search = self._get_search(frozenset(indexes))
+        # Only search the boundary with the tail instead of copying data
+        for part in (tail + data[:self._overlap], data):
+            match = search.search(part)
+            if match is not None:
+                return b'', self._indexes[match.group()]
+        if not self._overlap:
+            return b'', None
+        return (tail + data[-self._overlap:])[-self._overlap:], None
+
+
+class _Literals:
+    """Search for a few patterns with the interface of a regex."""
+    def __init__(self, patterns):
+        self._patterns = patterns
+
+    def search(self, data):
+        for pattern in self._patterns:
+            if pattern in data:
+                return _LiteralMatch(pattern)
+        return None
+
+
+class _LiteralMatch:
+    def __init__(self, pattern):
+        self._pattern = pattern
+
+    def group(self):
+        return self._pattern
@@ -0,0 +1,135 @@
+"""
+Minimal asyncio SMTP client for probing mail servers.
+
+It only supports what is needed to inspect a server: reading the
+greeting, EHLO/HELO, STARTTLS and sending simple commands. Every
+operation is limited by the timeout given to the client.
+"""
+import asyncio
+import socket
+
+
+SMTP_PORT = 25
+
+
+class SMTPError(Exception):
+    def __init__(self, code, message):
+        super().__init__(code, message)
+        self.code = code
+        self.message = message
+
+
+class SMTPHeloError(SMTPError):
+    pass
+
+
+class SMTPClient:
+    def __init__(self, host, address=None, port=SMTP_PORT, local_hostname=None,
+                 timeout=10):
+        self.host = host
+        self.address = address if address is not None else host
+        self.port = port
+        self.local_hostname = local_hostname or socket.getfqdn()
+        self.timeout = timeout
+        self.extensions = {}
+        self._reader = None
+        self._writer = None
+
+    @property
+    def ssl_object(self):
+        if self._writer is None:
+            return None
+        return self._writer.get_extra_info('ssl_object')
+
+    @property
+    def streams(self):
+        """Return (reader, writer) of the connection, e.g., to speak TLS directly."""
+        return self._reader, self._writer
+
+    async def connect(self):
+        """Connect to the server and return the greeting as (code, message)."""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.address, self.port), self.timeout)
+        return await self.get_reply()
+
+    async def get_reply(self):
+        """Read a (possibly multiline) reply and return (code, message).
+
+        Like smtplib, the message contains the lines of the reply without
+        their reply codes, separated by newlines.
+        """
+        lines = []
+        while True:
+            line = await asyncio.wait_for(self._reader.readline(), self.timeout)
+            if not line:
+                raise ConnectionResetError('Connection closed by server')
+            lines.append(line[4:].strip(b' \t\r\n'))
+            try:
+                code = int(line[:3])
+            except ValueError:
+                raise SMTPError(-1, line) from None
+            if line[3:4] != b'-':
+                return code, b'\n'.join(lines)
+
+    async def command(self, command):
+        self._writer.write(command.encode('ascii') + b'\r\n')
+        await asyncio.wait_for(self._writer.drain(), self.timeout)
+        return await self.get_reply()
+
+    async def ehlo_or_helo(self):
+        code, message = await self.command('EHLO ' + self.local_hostname)
+        if code == 250:
+            self._parse_extensions(message)
+            return
+        code, message = await self.command('HELO ' + self.local_hostname)
+        if code != 250:
+            raise SMTPHeloError(code, message)
+
+    def has_extension(self, name):
+        return name.lower() in self.extensions
+
+    async def starttls(self, context):
+        code, message = await self.command('STARTTLS')
+        if code != 220:
+            raise SMTPError(code, message)
+        if hasattr(self._writer, 'start_tls'):
+            await asyncio.wait_for(self._writer.start_tls(
+                context, server_hostname=self.host), self.timeout)
+        else:
+            self._writer = await asyncio.wait_for(_start_tls(
+                self._reader, self._writer, context, self.host), self.timeout)
+        # The server forgets everything it knew about us (RFC 3207)
+        self.extensions = {}
+
+    async def close(self):
+        if self._writer is None:
+            return
+        self._writer.close()
+        try:
+            await asyncio.wait_for(self._writer.wait_closed(), self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            pass
+        self._reader = None
+        self._writer = None
+
+    def _parse_extensions(self, message):
+        self.extensions = {}
+        # The first line is the greeting of the server
+        for line in message.decode('latin-1').split('\n')[1:]:
+            keyword, _, params = line.partition(' ')
+            self.extensions[keyword.lower()] = params.strip()
+
+
+async def _start_tls(reader, writer, context, server_hostname):
+    """Upgrade the connection to TLS before Python 3.11.
+
+    Streams cannot be upgraded there, so we upgrade the transport and
+    return a new writer for it. The protocol passes the decrypted data
+    to the same reader. The old writer must not be closed, since it
+    shares the underlying transport.
+    """
+    loop = asyncio.get_event_loop()
+    protocol = writer.transport.get_protocol()
+    tls_transport = await loop.start_tls(writer.transport, protocol, context,
+                                         server_hostname=server_hostname)
+    return asyncio.StreamWriter(tls_transport, protocol, reader, loop)
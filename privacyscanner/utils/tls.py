@@ -1,17 +1,118 @@
+import hashlib
+import ipaddress
+import re
+import ssl
+import threading
 from binascii import hexlify
-from datetime import datetime
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
 
+from cryptography.exceptions import UnsupportedAlgorithm
 from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.hazmat.primitives.asymmetric.dsa import DSAPublicKey
 from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePublicKey
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
-from cryptography.x509 import load_der_x509_certificate
+from cryptography.x509 import AuthorityInformationAccess, \
+    PrecertificateSignedCertificateTimestamps, SubjectAlternativeName, TLSFeature, \
+    TLSFeatureType, load_der_x509_certificate, load_pem_x509_certificate
+from cryptography.x509.oid import AuthorityInformationAccessOID
+from cryptography.x509.verification import DNSName, IPAddress, PolicyBuilder, Store, \
+    VerificationError
 
 from privacyscanner.utils.cipherinfo import lookup_ciphersuite
 
 
+# Certificates of the chain are exported with _ssl.Certificate.public_bytes()
+_ENCODING_DER = getattr(ssl, 'ENCODING_DER', getattr(ssl._ssl, 'ENCODING_DER', None))
+
+
+class CertificateCache:
+    """LRU cache for the analysis of certificates by the digest of their DER.
+
+    Certificates of CDNs, hosters and mail providers repeat across many
+    scans, so the cache is shared by all scans running in the same process.
+    """
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Extractors may run in threads. The analysis itself is done
+        # without holding the lock.
+        self._lock = threading.Lock()
+
+    def get(self, cert_der):
+        key = hashlib.sha256(cert_der).digest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+            self.misses += 1
+        entry = _analyze_certificate(cert_der, key)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class _CertificateAnalysis(NamedTuple):
+    info: dict
+    # Expiry depends on the time of the scan, so it is evaluated per call.
+    not_valid_after: datetime
+    features: dict
+
+
+_certificate_cache = CertificateCache()
+
+
+def get_certificate_cache():
+    return _certificate_cache
+
+
 def get_certificate_info(cert_der):
+    analysis = _certificate_cache.get(cert_der)
+    # The caller may modify the result, but not the cached analysis.
+    info = deepcopy(analysis.info)
+    info['is_expired'] = datetime.now(timezone.utc) > analysis.not_valid_after
+    return info
+
+
+def get_chain_info(chain_der):
+    """Return the certificate info of every certificate of the chain.
+
+    Certificates that cannot be analyzed are reported with their
+    fingerprint and an error instead of failing the whole chain.
+    """
+    chain_info = []
+    for cert_der in chain_der:
+        try:
+            chain_info.append(get_certificate_info(cert_der))
+        except (ValueError, UnsupportedAlgorithm):
+            chain_info.append({
+                'fingerprint_sha256': hashlib.sha256(cert_der).hexdigest(),
+                'error': 'invalid_certificate',
+            })
+    return chain_info
+
+
+def get_certificate_features(cert_der):
+    """Return whether the certificate embeds SCTs and requires OCSP stapling."""
+    return dict(_certificate_cache.get(cert_der).features)
+
+
+def _analyze_certificate(cert_der, digest):
     # See https://cryptography.io/en/latest/x509/reference/#cryptography.x509.Certificate
     cert = load_der_x509_certificate(cert_der, backend=default_backend())
     public_key = cert.public_key()
@@ -26,18 +127,152 @@ def get_certificate_info(cert_der):
     else:
         raise ValueError('Invalid key type.')
     key_info['type'] = key_type
-    return {
+    info = {
         'version': cert.version.name,
-        'fingerprint_sha256': hexlify(cert.fingerprint(hashes.SHA256())).decode(),
+        # The SHA-256 fingerprint is the digest of the DER encoding
+        'fingerprint_sha256': hexlify(digest).decode(),
         'serial_number': cert.serial_number,
-        'not_valid_before': cert.not_valid_before.timestamp(),
-        'not_valid_after': cert.not_valid_after.timestamp(),
+        'not_valid_before': cert.not_valid_before_utc.timestamp(),
+        'not_valid_after': cert.not_valid_after_utc.timestamp(),
         'issuer':  {attr.oid._name: attr.value for attr in cert.issuer},
         'subject': {attr.oid._name: attr.value for attr in cert.subject},
         'key': key_info,
-        'is_expired': datetime.now() > cert.not_valid_after
     }
-    # TODO: Add extensions
+    info.update(_analyze_extensions(cert))
+    features = {'has_sct': bool(info['sct_count']), 'must_staple': info['must_staple']}
+    return _CertificateAnalysis(info, cert.not_valid_after_utc, features)
+
+
+def _analyze_extensions(cert):
+    result = {
+        'extensions': None,
+        'san_count': 0,
+        'sct_count': 0,
+        'ocsp_urls': [],
+        'must_staple': False,
+    }
+    try:
+        extensions = cert.extensions
+    except ValueError:
+        # Malformed or duplicate extensions
+        return result
+    result['extensions'] = [{'name': ext.oid._name, 'oid': ext.oid.dotted_string,
+                             'critical': ext.critical} for ext in extensions]
+    for ext in extensions:
+        value = ext.value
+        if isinstance(value, SubjectAlternativeName):
+            result['san_count'] = len(value)
+        elif isinstance(value, PrecertificateSignedCertificateTimestamps):
+            result['sct_count'] = len(value)
+        elif isinstance(value, AuthorityInformationAccess):
+            result['ocsp_urls'] = [access.access_location.value for access in value
+                                   if access.access_method == AuthorityInformationAccessOID.OCSP]
+        elif isinstance(value, TLSFeature):
+            result['must_staple'] = TLSFeatureType.status_request in value
+    return result
+
+
+_PEM_CERTIFICATE = re.compile(
+    rb'-----BEGIN CERTIFICATE-----.+?-----END CERTIFICATE-----', re.DOTALL)
+
+_trust_stores = {}
+
+
+def get_trust_store(ca_file=None, ca_path=None):
+    """Return a store with the CA certificates of ca_file and ca_path.
+
+    Loading a CA bundle is expensive, so every store is only loaded once
+    per process. Returns None if no CA certificates could be loaded.
+    """
+    return _load_trust_store(ca_file, ca_path)[0]
+
+
+def get_trust_store_digest(ca_file=None, ca_path=None):
+    """Return a digest of the CA certificates of the store (or None).
+
+    Results that depend on the trust store, e.g., whether a certificate
+    is trusted, can only be shared between hosts with the same digest.
+    """
+    return _load_trust_store(ca_file, ca_path)[1]
+
+
+def _load_trust_store(ca_file, ca_path):
+    key = (ca_file, ca_path)
+    if key not in _trust_stores:
+        certs = []
+        paths = [Path(ca_file)] if ca_file else []
+        if ca_path:
+            paths.extend(path for path in sorted(Path(ca_path).iterdir()) if path.is_file())
+        for path in paths:
+            try:
+                pem_data = path.read_bytes()
+            except OSError:
+                continue
+            # Load the certificates one by one, so a single certificate
+            # that can not be parsed does not discard the whole bundle.
+            for pem_cert in _PEM_CERTIFICATE.findall(pem_data):
+                try:
+                    certs.append(load_pem_x509_certificate(pem_cert, backend=default_backend()))
+                except ValueError:
+                    continue
+        if certs:
+            hasher = hashlib.sha256()
+            for cert_der in sorted(cert.public_bytes(Encoding.DER) for cert in certs):
+                hasher.update(cert_der)
+            _trust_stores[key] = (Store(certs), hasher.hexdigest())
+        else:
+            _trust_stores[key] = (None, None)
+    return _trust_stores[key]
+
+
+def get_peer_chain(ssl_object):
+    """Return the certificates sent by the peer in DER, leaf first.
+
+    The chain is available even if the certificate has not been verified
+    during the handshake. Python 3.13 exposes it as public API. On 3.10 to
+    3.12 it is only available on the private _sslobj of SSLSocket and
+    SSLObject, which we use if it is present. Otherwise, e.g., on older
+    versions, only the leaf certificate is available.
+
+    Returns (chain, is_complete), where is_complete is False if the chain
+    only contains the leaf, because the intermediates are not available.
+    """
+    if hasattr(ssl_object, 'get_unverified_chain'):
+        chain = ssl_object.get_unverified_chain()
+    else:
+        sslobj = getattr(ssl_object, '_sslobj', None)
+        chain = None
+        if hasattr(sslobj, 'get_unverified_chain'):
+            chain = sslobj.get_unverified_chain()
+    if chain:
+        return [cert if isinstance(cert, bytes) else cert.public_bytes(_ENCODING_DER)
+                for cert in chain], True
+    leaf = ssl_object.getpeercert(binary_form=True)
+    return [leaf] if leaf else [], False
+
+
+def verify_chain(chain_der, hostname, store):
+    """Check offline whether the chain is trusted and valid for hostname.
+
+    chain_der is the chain as sent by the peer, leaf first. Returns True
+    if the leaf can be verified against the store with the intermediates
+    from the chain, else False. Malformed chains are not trusted.
+    """
+    if not chain_der:
+        return False
+    try:
+        leaf, *intermediates = [load_der_x509_certificate(cert_der, backend=default_backend())
+                                for cert_der in chain_der]
+        try:
+            subject = IPAddress(ipaddress.ip_address(hostname))
+        except ValueError:
+            subject = DNSName(hostname)
+        verifier = PolicyBuilder().store(store).time(datetime.now(timezone.utc))\
+            .build_server_verifier(subject)
+        verifier.verify(leaf, intermediates)
+    except (VerificationError, ValueError):
+        return False
+    return True
 
 
 def get_cipher_info(cipher_tuple):
@@ -45,38 +280,16 @@ def get_cipher_info(cipher_tuple):
     return _build_cipher_info(lookup_ciphersuite(cipher_string), protocol)
 
 
-def _build_cipher_info(cipher_info, protocol):
-    if 'symmetric' not in cipher_info:
-        raise RuntimeError('OpenSSL 1.1 is required. Even Debian 9 has it.')
-    cipher = cipher_info['symmetric'].replace('-', '_').upper()
-    params = _parse_openssl_description(cipher_info['description'])
-    key_exchange = None
-    if 'Kx' in params:
-        key_exchange = params['Kx']
-    if 'Au':
-        key_exchange += '_' + params['Au']
-    # Unfortunately, OpenSSL does not provide any information about the group.
-    key_exchange_group = None
-    mac = None
-    if 'mac' in params:
-        # AHEAD ciphers do not have a MAC
-        mac = params['mac'] if params['mac'] != 'AHEAD' else None
+def _build_cipher_info(ciphersuite, protocol):
+    cipher = None
+    if ciphersuite.symmetric is not None:
+        cipher = ciphersuite.symmetric.replace('-', '_').upper()
     return {
         'cipher': cipher,
-        'key_exchange': key_exchange,
+        'key_exchange': ciphersuite.kx + '_' + ciphersuite.au,
+        # Unfortunately, OpenSSL does not provide any information about the group.
         'key_exchange_group': None,
-        'mac': mac,
+        # AEAD ciphers do not have a MAC
+        'mac': ciphersuite.mac if ciphersuite.mac != 'AEAD' else None,
         'protocol': protocol.replace('TLSv', 'TLS '),
     }
-
-
-def _parse_openssl_description(description):
-    parts = description.split()
-    result = {}
-    for part in parts:
-        if '=' in part:
-            key, value = part.split('=', 1)
-            result[key] = value
-    result['name'] = parts[0]
-    result['protocol'] = parts[1]
-    return result
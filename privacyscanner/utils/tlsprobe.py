@@ -0,0 +1,589 @@
+"""
+Native TLS prober based on hand-crafted ClientHellos.
+
+Most probes do not complete a handshake. They send a ClientHello with the
+protocol versions, cipher suites and groups to test and read the response
+of the server up to its ServerHello. This is enough to find out which
+protocols and cipher suites a server supports and in which order it
+prefers them. Probes run concurrently over a limited number of
+connections. Only session resumption is checked with full handshakes
+using the ssl module.
+"""
+import asyncio
+import os
+import smtplib
+import socket
+import ssl
+import struct
+from typing import NamedTuple, Optional
+
+from privacyscanner.utils.cipherinfo import get_ciphersuites
+from privacyscanner.utils.smtp import SMTPClient, SMTPError
+
+
+PROTOCOLS = ('SSLv2', 'SSLv3', 'TLSv1', 'TLSv1.1', 'TLSv1.2', 'TLSv1.3')
+
+_VERSIONS = {
+    'SSLv3': 0x0300,
+    'TLSv1': 0x0301,
+    'TLSv1.1': 0x0302,
+    'TLSv1.2': 0x0303,
+    'TLSv1.3': 0x0304,
+}
+_VERSION_NAMES = {version: name for name, version in _VERSIONS.items()}
+
+# Named groups with the size of their keys in bits as reported by OpenSSL
+GROUPS = {
+    'X25519': (0x001d, 253),
+    'prime256v1': (0x0017, 256),
+    'secp384r1': (0x0018, 384),
+    'secp521r1': (0x0019, 521),
+    'X448': (0x001e, 448),
+}
+_GROUP_NAMES = {code: name for name, (code, _bits) in GROUPS.items()}
+
+_SIGNATURE_ALGORITHMS = (
+    0x0403, 0x0503, 0x0603, 0x0804, 0x0805, 0x0806, 0x0807, 0x0808,
+    0x0401, 0x0501, 0x0601, 0x0402, 0x0502, 0x0602, 0x0203, 0x0202, 0x0201,
+)
+
+# Random of a ServerHello that is a HelloRetryRequest (RFC 8446, 4.1.3)
+_HELLO_RETRY_RANDOM = bytes.fromhex(
+    'cf21ad74e59a6111be1d8c021e65b891c2a211167abb8c5e079e09e2c8a8339c')
+
+# Some servers can not handle ClientHellos with too many cipher suites,
+# so we never offer more at once.
+MAX_CIPHERS_PER_HELLO = 128
+
+_CHANGE_CIPHER_SPEC = 20
+_ALERT = 21
+_HANDSHAKE = 22
+
+_CLIENT_HELLO = 1
+_SERVER_HELLO = 2
+_SERVER_KEY_EXCHANGE = 12
+_SERVER_HELLO_DONE = 14
+
+_EXT_SERVER_NAME = 0
+_EXT_STATUS_REQUEST = 5
+_EXT_SUPPORTED_GROUPS = 10
+_EXT_EC_POINT_FORMATS = 11
+_EXT_SIGNATURE_ALGORITHMS = 13
+_EXT_SUPPORTED_VERSIONS = 43
+_EXT_KEY_SHARE = 51
+_EXT_RENEGOTIATION_INFO = 0xff01
+
+_SSL2_CLIENT_HELLO = 1
+_SSL2_SERVER_HELLO = 4
+
+
+class TLSProbeError(Exception):
+    pass
+
+
+class ServerHello(NamedTuple):
+    version: int
+    cipher: int
+    extensions: dict
+    is_retry: bool
+    group: Optional[str] = None
+    key_exchange: Optional[str] = None
+    key_exchange_bits: Optional[int] = None
+
+
+_tls_ciphers = None
+_ssl2_ciphers = None
+
+
+def _load_ciphers():
+    global _tls_ciphers, _ssl2_ciphers
+    if _tls_ciphers is None:
+        _tls_ciphers = {}
+        _ssl2_ciphers = {}
+        for info in get_ciphersuites():
+            if info.protocol == 'SSLv2':
+                _ssl2_ciphers[info.id] = info
+            else:
+                # TLS cipher suites are stored with a 0x0300 prefix
+                _tls_ciphers[info.id & 0xffff] = info
+    return _tls_ciphers, _ssl2_ciphers
+
+
+def _extension(ext_type, data):
+    return struct.pack('!HH', ext_type, len(data)) + data
+
+
+def _vector(data, length_size=2):
+    return len(data).to_bytes(length_size, 'big') + data
+
+
+def _parse_server_hello(body):
+    version = int.from_bytes(body[0:2], 'big')
+    is_retry = body[2:34] == _HELLO_RETRY_RANDOM
+    pos = 35 + body[34]
+    cipher = int.from_bytes(body[pos:pos + 2], 'big')
+    # Skip the cipher suite and the compression method
+    pos += 3
+    extensions = {}
+    if pos + 2 <= len(body):
+        end = pos + 2 + int.from_bytes(body[pos:pos + 2], 'big')
+        pos += 2
+        while pos + 4 <= end:
+            ext_type, ext_length = struct.unpack('!HH', body[pos:pos + 4])
+            extensions[ext_type] = body[pos + 4:pos + 4 + ext_length]
+            pos += 4 + ext_length
+    if _EXT_SUPPORTED_VERSIONS in extensions:
+        version = int.from_bytes(extensions[_EXT_SUPPORTED_VERSIONS][:2], 'big')
+    group = None
+    if _EXT_KEY_SHARE in extensions:
+        group = _GROUP_NAMES.get(int.from_bytes(extensions[_EXT_KEY_SHARE][:2], 'big'))
+    return ServerHello(version, cipher, extensions, is_retry, group)
+
+
+class TLSProber:
+    """Probe the TLS configuration of a single server.
+
+    host is the name of the server, which is sent as SNI unless it is an
+    IP address. address is the address to connect to (host by default).
+    starttls can be 'smtp' to upgrade an SMTP connection instead of
+    speaking TLS directly.
+    """
+    def __init__(self, host, address=None, port=443, starttls=None, timeout=10,
+                 max_connections=4):
+        if starttls not in (None, 'smtp'):
+            raise ValueError('Invalid STARTTLS protocol: `{}`.'.format(starttls))
+        self.host = host
+        self.address = address if address is not None else host
+        self.port = port
+        self.starttls = starttls
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.num_connections = 0
+        # Failed connections are treated like rejected ClientHellos
+        self.num_failed_connections = 0
+        self._semaphore = None
+        self._sni = host.encode('idna') if not _is_ip_address(host) else None
+        self._tls_ciphers, self._ssl2_ciphers = _load_ciphers()
+
+    async def probe(self):
+        """Return the protocols, cipher suites and features of the server.
+
+        The result is a dict with the keys:
+        - protocols: Whether each protocol of PROTOCOLS is supported
+        - ciphers: The OpenSSL names of the cipher suites of each supported
+          protocol in the order the server selected them
+        - server_preference: Whether the server enforces its cipher order
+        - groups: Names of the supported groups for ECDHE key exchange
+        - default: Protocol, cipher and key exchange that are negotiated
+          with a client that supports everything
+        - ocsp_stapling, session_id_resumption, session_ticket: Booleans
+        - certificate: The certificate of the server (DER)
+        Everything that could not be determined is None.
+        """
+        self._semaphore = asyncio.Semaphore(self.max_connections)
+        # Fail early if the server is not reachable at all
+        reader, writer = await self._open()
+        writer.close()
+
+        tls_versions = [_VERSIONS[name] for name in PROTOCOLS[1:]]
+        cipher_lists = await asyncio.gather(
+            self._probe_ssl2(),
+            *(self._enumerate_ciphers(version) for version in tls_versions))
+        ciphers = {protocol: cipher_list
+                   for protocol, cipher_list in zip(PROTOCOLS, cipher_lists) if cipher_list}
+        supported_versions = [version for version, cipher_list
+                              in zip(tls_versions, cipher_lists[1:]) if cipher_list]
+
+        server_preference, groups, default, ocsp_stapling, handshake = await asyncio.gather(
+            self._probe_server_preference(supported_versions, ciphers),
+            self._probe_groups(supported_versions, ciphers),
+            self._probe_default(supported_versions),
+            self._probe_ocsp_stapling(supported_versions, ciphers),
+            self._probe_resumption(supported_versions))
+        return {
+            'protocols': {protocol: protocol in ciphers for protocol in PROTOCOLS},
+            'ciphers': {protocol: [self._get_info(protocol, cipher).name for cipher in cipher_list]
+                        for protocol, cipher_list in ciphers.items()},
+            'server_preference': server_preference,
+            'groups': groups,
+            'default': default,
+            'ocsp_stapling': ocsp_stapling,
+            'session_id_resumption': handshake['session_id_resumption'],
+            'session_ticket': handshake['session_ticket'],
+            'certificate': handshake['certificate'],
+        }
+
+    def _get_info(self, protocol, cipher):
+        if protocol == 'SSLv2':
+            return self._ssl2_ciphers[cipher]
+        return self._tls_ciphers[cipher]
+
+    def _get_candidates(self, version):
+        if version == _VERSIONS['TLSv1.3']:
+            return [cipher for cipher, info in self._tls_ciphers.items()
+                    if info.protocol == 'TLSv1.3']
+        return [cipher for cipher, info in self._tls_ciphers.items()
+                if info.protocol != 'TLSv1.3']
+
+    async def _open(self):
+        self.num_connections += 1
+        try:
+            if self.starttls == 'smtp':
+                client = SMTPClient(self.host, self.address, self.port, timeout=self.timeout)
+                await client.connect()
+                await client.ehlo_or_helo()
+                code, message = await client.command('STARTTLS')
+                if code != 220:
+                    raise TLSProbeError('STARTTLS is not supported: {} {}'.format(code, message))
+                return client.streams
+            return await asyncio.wait_for(
+                asyncio.open_connection(self.address, self.port), self.timeout)
+        except (OSError, asyncio.TimeoutError, SMTPError) as e:
+            raise TLSProbeError('Could not connect to {}:{}: {}'.format(
+                self.address, self.port, e)) from e
+
+    async def _hello(self, versions, ciphers, groups=None, status_request=False,
+                     key_exchange=False):
+        """Send a ClientHello and return the ServerHello or None.
+
+        None means that the server rejected the ClientHello or that the
+        connection could not be established.
+        """
+        if groups is None:
+            groups = list(GROUPS)
+        record = self._build_client_hello(versions, ciphers, groups, status_request)
+        async with self._semaphore:
+            try:
+                reader, writer = await self._open()
+            except TLSProbeError:
+                # Rate limiting servers may refuse some of the connections.
+                # Only the first connection in probe() has to succeed.
+                self.num_failed_connections += 1
+                return None
+            try:
+                writer.write(record)
+                await asyncio.wait_for(writer.drain(), self.timeout)
+                return await asyncio.wait_for(
+                    self._read_server_hello(reader, key_exchange), self.timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                    IndexError, ValueError):
+                # Servers often close the connection instead of sending an
+                # alert. Malformed responses are treated the same way.
+                return None
+            finally:
+                writer.close()
+
+    def _build_client_hello(self, versions, ciphers, groups, status_request):
+        max_version = max(versions)
+        extensions = b''
+        if max_version > _VERSIONS['SSLv3']:
+            if self._sni is not None:
+                extensions += _extension(_EXT_SERVER_NAME, _vector(
+                    b'\x00' + _vector(self._sni)))
+            group_codes = [GROUPS[group][0] for group in groups]
+            extensions += _extension(_EXT_SUPPORTED_GROUPS, _vector(
+                b''.join(struct.pack('!H', code) for code in group_codes)))
+            extensions += _extension(_EXT_EC_POINT_FORMATS, b'\x01\x00')
+            if max_version >= _VERSIONS['TLSv1.2']:
+                extensions += _extension(_EXT_SIGNATURE_ALGORITHMS, _vector(
+                    b''.join(struct.pack('!H', alg) for alg in _SIGNATURE_ALGORITHMS)))
+            if status_request:
+                # OCSP without responder ids and request extensions
+                extensions += _extension(_EXT_STATUS_REQUEST, b'\x01\x00\x00\x00\x00')
+            extensions += _extension(_EXT_RENEGOTIATION_INFO, b'\x00')
+            if max_version == _VERSIONS['TLSv1.3']:
+                extensions += _extension(_EXT_SUPPORTED_VERSIONS, _vector(
+                    b''.join(struct.pack('!H', version)
+                             for version in sorted(versions, reverse=True)), 1))
+                # Any 32 bytes are a valid X25519 key. We never complete the
+                # handshake, so we do not need the private key. For other
+                # groups, the server answers with a HelloRetryRequest.
+                key_shares = b''
+                if 'X25519' in groups:
+                    key_shares = struct.pack('!HH', GROUPS['X25519'][0], 32) + os.urandom(32)
+                extensions += _extension(_EXT_KEY_SHARE, _vector(key_shares))
+        session_id = b''
+        if max_version == _VERSIONS['TLSv1.3']:
+            # Compatibility mode (RFC 8446, D.4)
+            session_id = os.urandom(32)
+        body = (struct.pack('!H', min(max_version, _VERSIONS['TLSv1.2'])) + os.urandom(32) +
+                _vector(session_id, 1) +
+                _vector(b''.join(struct.pack('!H', cipher) for cipher in ciphers)) +
+                b'\x01\x00')
+        if extensions:
+            body += _vector(extensions)
+        handshake = bytes([_CLIENT_HELLO]) + _vector(body, 3)
+        record_version = min(max_version, _VERSIONS['TLSv1'])
+        return struct.pack('!BHH', _HANDSHAKE, record_version, len(handshake)) + handshake
+
+    async def _read_server_hello(self, reader, key_exchange):
+        handshake = b''
+        hello = None
+        while True:
+            content_type, _version, length = struct.unpack('!BHH', await reader.readexactly(5))
+            fragment = await reader.readexactly(length)
+            if content_type == _CHANGE_CIPHER_SPEC:
+                continue
+            if content_type != _HANDSHAKE:
+                # An alert or something that is not TLS at all
+                return hello
+            handshake += fragment
+            while len(handshake) >= 4:
+                msg_length = int.from_bytes(handshake[1:4], 'big')
+                if len(handshake) < 4 + msg_length:
+                    break
+                msg_type = handshake[0]
+                body = handshake[4:4 + msg_length]
+                handshake = handshake[4 + msg_length:]
+                if msg_type == _SERVER_HELLO:
+                    hello = _parse_server_hello(body)
+                    # Everything after the ServerHello is encrypted in TLS 1.3
+                    if (not key_exchange or hello.is_retry or
+                            hello.version == _VERSIONS['TLSv1.3']):
+                        return hello
+                elif msg_type == _SERVER_KEY_EXCHANGE and hello is not None:
+                    return self._parse_key_exchange(hello, body)
+                elif msg_type == _SERVER_HELLO_DONE:
+                    return hello
+
+    def _parse_key_exchange(self, hello, body):
+        info = self._tls_ciphers.get(hello.cipher)
+        if info is None:
+            return hello
+        if info.kea == 'kx-ecdhe' and body[0] == 3:
+            # Named curve
+            group = _GROUP_NAMES.get(int.from_bytes(body[1:3], 'big'))
+            bits = GROUPS[group][1] if group else None
+            return hello._replace(group=group, key_exchange='ECDH', key_exchange_bits=bits)
+        if info.kea == 'kx-dhe':
+            prime = body[2:2 + int.from_bytes(body[0:2], 'big')]
+            return hello._replace(key_exchange='DH',
+                                  key_exchange_bits=int.from_bytes(prime, 'big').bit_length())
+        return hello
+
+    async def _probe_ssl2(self):
+        specs = b''.join(cipher.to_bytes(3, 'big') for cipher in self._ssl2_ciphers)
+        challenge = os.urandom(16)
+        body = (bytes([_SSL2_CLIENT_HELLO]) + struct.pack('!HHHH', 0x0002, len(specs), 0,
+                                                          len(challenge)) +
+                specs + challenge)
+        record = struct.pack('!H', 0x8000 | len(body)) + body
+        async with self._semaphore:
+            try:
+                reader, writer = await self._open()
+            except TLSProbeError:
+                self.num_failed_connections += 1
+                return []
+            try:
+                writer.write(record)
+                await asyncio.wait_for(writer.drain(), self.timeout)
+                header = await asyncio.wait_for(reader.readexactly(2), self.timeout)
+                if not header[0] & 0x80:
+                    return []
+                length = ((header[0] & 0x7f) << 8) | header[1]
+                data = await asyncio.wait_for(reader.readexactly(length), self.timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                return []
+            finally:
+                writer.close()
+        if len(data) < 11 or data[0] != _SSL2_SERVER_HELLO or data[3:5] != b'\x00\x02':
+            return []
+        cert_length, specs_length = struct.unpack('!HH', data[5:9])
+        specs = data[11 + cert_length:11 + cert_length + specs_length]
+        ciphers = [int.from_bytes(specs[pos:pos + 3], 'big') for pos in range(0, len(specs), 3)]
+        return [cipher for cipher in ciphers if cipher in self._ssl2_ciphers]
+
+    async def _enumerate_ciphers(self, version):
+        """Return the cipher suites the server supports for version.
+
+        We offer all remaining cipher suites and remove the one the server
+        selects until it rejects the ClientHello. Thus, the order is the
+        preference of the server if it enforces one.
+        """
+        supported = []
+        remaining = self._get_candidates(version)
+        while remaining:
+            offer = remaining[:MAX_CIPHERS_PER_HELLO]
+            hello = await self._hello([version], offer)
+            if hello is None or hello.version != version or hello.cipher not in offer:
+                # Nothing left in this part of the cipher suites
+                remaining = remaining[MAX_CIPHERS_PER_HELLO:]
+                continue
+            supported.append(hello.cipher)
+            remaining.remove(hello.cipher)
+        return supported
+
+    async def _probe_server_preference(self, supported_versions, ciphers):
+        # The newest protocol with at least two cipher suites tells whether
+        # the order of the client or the server decides.
+        for version in sorted(supported_versions, reverse=True):
+            cipher_list = ciphers[_VERSION_NAMES[version]]
+            if len(cipher_list) < 2:
+                continue
+            first, last = cipher_list[0], cipher_list[-1]
+            hellos = await asyncio.gather(self._hello([version], [first, last]),
+                                          self._hello([version], [last, first]))
+            if None in hellos:
+                return None
+            return hellos[0].cipher == hellos[1].cipher
+        return None
+
+    async def _probe_groups(self, supported_versions, ciphers):
+        tls12 = _VERSIONS['TLSv1.2']
+        tls13 = _VERSIONS['TLSv1.3']
+        ecdhe_ciphers = [cipher for cipher in ciphers.get('TLSv1.2', [])
+                         if self._tls_ciphers[cipher].kea == 'kx-ecdhe']
+        if tls13 in supported_versions:
+            version, offer = tls13, ciphers['TLSv1.3']
+        elif ecdhe_ciphers:
+            version, offer = tls12, ecdhe_ciphers
+        else:
+            return None
+
+        if version == tls12:
+            # With ECDSA certificates, TLS 1.2 servers require the curve of
+            # the certificate in the offered groups. Therefore, we offer all
+            # remaining groups and remove the one the server selects.
+            remaining = list(GROUPS)
+            supported = []
+            while remaining:
+                hello = await self._hello([version], offer, groups=remaining,
+                                          key_exchange=True)
+                if hello is None or hello.group not in remaining:
+                    break
+                supported.append(hello.group)
+                remaining.remove(hello.group)
+            return [group for group in GROUPS if group in supported]
+
+        async def probe_group(group):
+            hello = await self._hello([version], offer, groups=[group])
+            if hello is None or hello.cipher not in offer:
+                return False
+            return hello.group in (None, group)
+
+        groups = list(GROUPS)
+        results = await asyncio.gather(*(probe_group(group) for group in groups))
+        return [group for group, supported in zip(groups, results) if supported]
+
+    async def _probe_default(self, supported_versions):
+        if not supported_versions:
+            return None
+        # Offer the strongest cipher suites like a modern client does
+        candidates = sorted(self._tls_ciphers,
+                            key=lambda cipher: (self._tls_ciphers[cipher].protocol == 'TLSv1.3',
+                                                self._tls_ciphers[cipher].aead,
+                                                self._tls_ciphers[cipher].strength_bits or 0),
+                            reverse=True)
+        hello = await self._hello(supported_versions, candidates[:MAX_CIPHERS_PER_HELLO],
+                                  key_exchange=True)
+        if hello is None or hello.cipher not in self._tls_ciphers:
+            return None
+        key_exchange = hello.key_exchange
+        key_exchange_bits = hello.key_exchange_bits
+        if hello.version == _VERSIONS['TLSv1.3'] and hello.group is not None:
+            key_exchange = 'ECDH'
+            key_exchange_bits = GROUPS[hello.group][1]
+        return {
+            'protocol': _VERSION_NAMES.get(hello.version),
+            'cipher': self._tls_ciphers[hello.cipher].name,
+            'key_exchange': key_exchange,
+            'key_exchange_bits': key_exchange_bits,
+            'group': hello.group,
+        }
+
+    async def _probe_ocsp_stapling(self, supported_versions, ciphers):
+        # In TLS 1.3, the stapled response is encrypted. We therefore
+        # check whether the server acknowledges the request in TLS 1.2.
+        versions = [version for version in supported_versions
+                    if version < _VERSIONS['TLSv1.3']]
+        if not versions:
+            return None
+        version = max(versions)
+        offer = ciphers[_VERSION_NAMES[version]][:MAX_CIPHERS_PER_HELLO]
+        hello = await self._hello([version], offer, status_request=True)
+        if hello is None:
+            return None
+        return _EXT_STATUS_REQUEST in hello.extensions
+
+    async def _probe_resumption(self, supported_versions):
+        result = {
+            'session_id_resumption': None,
+            'session_ticket': None,
+            'certificate': None,
+        }
+        # Sessions are checked with TLS 1.2, where they are available
+        # right after the handshake.
+        if not any(version < _VERSIONS['TLSv1.3'] for version in supported_versions):
+            return result
+        loop = asyncio.get_event_loop()
+        async with self._semaphore:
+            try:
+                session, _reused, certificate = await loop.run_in_executor(
+                    None, self._handshake, _create_context(tickets=True), None)
+                result['certificate'] = certificate
+                result['session_ticket'] = session.has_ticket
+                # A session can only be resumed with the same context
+                context = _create_context(tickets=False)
+                session, _reused, _certificate = await loop.run_in_executor(
+                    None, self._handshake, context, None)
+                if session.id:
+                    _session, reused, _certificate = await loop.run_in_executor(
+                        None, self._handshake, context, session)
+                    result['session_id_resumption'] = reused
+                else:
+                    result['session_id_resumption'] = False
+            except (OSError, ssl.SSLError, smtplib.SMTPException, TLSProbeError):
+                pass
+        return result
+
+    def _handshake(self, context, session):
+        """Do a full (blocking) handshake.
+
+        Returns (session, session_reused, certificate).
+        """
+        self.num_connections += 1
+        if self.starttls == 'smtp':
+            smtp = smtplib.SMTP(timeout=self.timeout)
+            smtp.connect(self.address, self.port)
+            smtp.ehlo_or_helo_if_needed()
+            code, message = smtp.docmd('STARTTLS')
+            if code != 220:
+                smtp.close()
+                raise TLSProbeError('STARTTLS is not supported: {} {}'.format(code, message))
+            sock = smtp.sock
+        else:
+            sock = socket.create_connection((self.address, self.port), self.timeout)
+        try:
+            server_hostname = self._sni.decode('ascii') if self._sni else None
+            tls_sock = context.wrap_socket(sock, server_hostname=server_hostname,
+                                           session=session)
+            result = (tls_sock.session, tls_sock.session_reused,
+                      tls_sock.getpeercert(binary_form=True))
+            # Servers drop sessions of connections that were not shut down
+            # properly, so we could not resume it.
+            try:
+                tls_sock.unwrap()
+            except (OSError, ValueError):
+                pass
+            return result
+        finally:
+            sock.close()
+
+
+def _create_context(tickets):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    context.maximum_version = ssl.TLSVersion.TLSv1_2
+    context.set_ciphers('ALL:@SECLEVEL=0')
+    if not tickets:
+        context.options |= ssl.OP_NO_TICKET
+    return context
+
+
+def _is_ip_address(host):
+    try:
+        socket.inet_pton(socket.AF_INET6 if ':' in host else socket.AF_INET, host)
+    except OSError:
+        return False
+    return True
@@ -12,7 +12,7 @@ import psycopg2
 
 from privacyscanner.exceptions import RetryScan, RescheduleLater
 from privacyscanner.filehandlers import NoOpFileHandler
-from privacyscanner.jobqueue import JobQueue
+from privacyscanner.jobqueue import JobQueue, configure_queue_db
 from privacyscanner.raven import has_raven, raven
 from privacyscanner.result import Result
 from privacyscanner.scanmeta import ScanMeta
@@ -55,8 +55,11 @@ class WorkerInfo:
         self.read_pipe = read_pipe
         self.stop_event = stop_event
         self.ack_event = ack_event
-        self.scan_id = None
-        self.scan_module = None
+        # Maps the scan ids of the running jobs to their scan module. A
+        # worker runs more than one job at once if it scans a batch.
+        self.jobs = {}
+        # Number of jobs in the current batch, including finished ones
+        self.batch_size = 0
         self._heartbeat = None
         self._last_execution_time = None
         self.ping()
@@ -71,14 +74,20 @@ class WorkerInfo:
     def ack(self):
         self.ack_event.set()
 
+    @property
+    def scan_module(self):
+        # All jobs of a batch belong to the same scan module
+        return next(iter(self.jobs.values()), None)
+
     def notify_job_started(self, scan_id, scan_module):
-        self.scan_id = scan_id
-        self.scan_module = scan_module
-        self._last_execution_time = time.time()
+        if not self.jobs:
+            self._last_execution_time = time.time()
+            self.batch_size = 0
+        self.jobs[scan_id] = scan_module
+        self.batch_size += 1
 
-    def notify_job_finished(self):
-        self.scan_id = None
-        self.scan_module = None
+    def notify_job_finished(self, scan_id):
+        self.jobs.pop(scan_id, None)
 
     notify_job_failed = notify_job_finished
 
@@ -91,7 +100,10 @@ class WorkerInfo:
         self.stop_event.set()
 
     def __str__(self):
-        return '<{}/{} pid={}>'.format(self.scan_id, self.scan_module, self.pid)
+        if not self.jobs:
+            return '<None/None pid={}>'.format(self.pid)
+        scan_ids = ','.join(str(scan_id) for scan_id in self.jobs)
+        return '<{}/{} pid={}>'.format(scan_ids, self.scan_module, self.pid)
 
 
 class WorkerMaster:
@@ -195,16 +207,22 @@ class WorkerMaster:
             self._event_job_started(scan_id, scan_module_name, time_started)
             worker_info.notify_job_started(scan_id, scan_module_name)
         elif action == 'job_finished':
-            self._event_job_finished(
-                worker_info.scan_id, worker_info.scan_module, time_finished=args[0])
-            worker_info.notify_job_finished()
+            scan_id, time_finished = args
+            # The job is unknown if it has already been marked as failed
+            # because the worker was hanging.
+            if scan_id in worker_info.jobs:
+                self._event_job_finished(scan_id, worker_info.jobs[scan_id], time_finished)
+                worker_info.notify_job_finished(scan_id)
         elif action == 'job_failed':
-            self._event_job_failed(worker_info.scan_id, worker_info.scan_module)
-            worker_info.notify_job_failed()
+            scan_id, _time_failed = args
+            if scan_id in worker_info.jobs:
+                self._event_job_failed(scan_id, worker_info.jobs[scan_id])
+                worker_info.notify_job_failed(scan_id)
         elif action == 'log':
-            log_time, level, message = args
-            self._event_job_log(worker_info.scan_id, worker_info.scan_module,
-                                log_time, level, message)
+            scan_id, log_time, level, message = args
+            if scan_id in worker_info.jobs:
+                self._event_job_log(scan_id, worker_info.jobs[scan_id],
+                                    log_time, level, message)
         elif action == 'add_file':
             pass
         elif action == 'add_debug_file':
@@ -246,9 +264,13 @@ class WorkerMaster:
                 worker_info.scan_module, self.max_execution_time)
             if max_execution_time is None:
                 continue
+            # The sites of a batch are scanned by a single run, so the
+            # limit applies to every job of the batch.
+            max_execution_time *= max(worker_info.batch_size, 1)
             if worker_info.get_execution_time() > max_execution_time:
-                worker_info.notify_job_failed()
-                self._event_job_failed(worker_info.scan_id, worker_info.scan_module)
+                for scan_id, scan_module in list(worker_info.jobs.items()):
+                    worker_info.notify_job_failed(scan_id)
+                    self._event_job_failed(scan_id, scan_module)
                 kill_everything(worker_info.pid)
                 self._terminated_worker_pids.add(worker_info.pid)
 
@@ -294,6 +316,7 @@ class Worker:
         self._raven_client = None
         if has_raven and raven_dsn:
             self._raven_client = raven.Client(raven_dsn)
+        configure_queue_db(db_dsn)
         scan_modules = load_modules(scan_module_list, scan_module_options)
         self._job_queue = JobQueue(db_dsn, scan_modules, max_tries)
 
@@ -310,44 +333,70 @@ class Worker:
             if job is None:
                 time.sleep(1)
                 continue
-            start_info = (job.scan_id, job.scan_module.name, datetime.today(), job.num_tries)
-            self._notify_master('job_started', start_info)
-            result = Result(job.current_result, NoOpFileHandler())
-            logger = logging.Logger(job.scan_module.name)
-            logger.addHandler(WorkerWritePipeHandler(self._pid, self._write_pipe))
-            logger.addHandler(ScanStreamHandler())
-            scan_meta = ScanMeta(worker_id=self._id, num_tries=job.num_tries)
+            scan_module = job.scan_module
+            jobs = [job]
+            # Scan modules that can scan several sites at once set the
+            # batch_size option. The jobs of a batch are claimed together.
+            batch_size = scan_module.options.get('batch_size', 1)
+            if batch_size > 1:
+                jobs += self._job_queue.get_more_jobs_nowait(scan_module, batch_size - 1)
+            sites = []
+            for job in jobs:
+                start_info = (job.scan_id, job.scan_module.name, datetime.today(), job.num_tries)
+                self._notify_master('job_started', start_info)
+                result = Result(job.current_result, NoOpFileHandler())
+                logger = logging.Logger(job.scan_module.name)
+                logger.addHandler(WorkerWritePipeHandler(self._pid, self._write_pipe,
+                                                         job.scan_id))
+                logger.addHandler(ScanStreamHandler())
+                scan_meta = ScanMeta(worker_id=self._id, num_tries=job.num_tries,
+                                     scan_id=job.scan_id)
+                sites.append((result, scan_meta, logger))
             with tempfile.TemporaryDirectory() as temp_dir:
                 old_cwd = os.getcwd()
                 os.chdir(temp_dir)
                 try:
-                    job.scan_module.logger = logger
-                    job.scan_module.scan_site(result, scan_meta)
-                except RetryScan:
-                    self._job_queue.report_failure()
-                    self._notify_master('job_failed', (datetime.today(),))
-                except RescheduleLater as e:
-                    self._job_queue.reschedule(e.not_before)
-                    self._job_queue.report_result(result.get_updates())
-                    self._notify_master('job_finished', (datetime.today(),))
-                except Exception:
-                    logger.exception('Scan module `%s` failed.', job.scan_module.name)
-                    self._job_queue.report_failure()
-                    self._notify_master('job_failed', (datetime.today(),))
-                    if self._raven_client:
-                        self._raven_client.captureException(tags={
-                            'scan_id': job.scan_id,
-                            'scan_module_name': job.scan_module.name
-                        }, extra={'result': result.get_results()})
-                else:
-                    self._job_queue.report_result(result.get_updates())
-                    self._notify_master('job_finished', (datetime.today(),))
+                    if len(jobs) == 1:
+                        result, scan_meta, logger = sites[0]
+                        try:
+                            scan_module.logger = logger
+                            scan_module.scan_site(result, scan_meta)
+                        except Exception as e:
+                            errors = [e]
+                        else:
+                            errors = [None]
+                    else:
+                        errors = scan_module.scan_sites(sites)
+                    for job, (result, _scan_meta, logger), error in zip(jobs, sites, errors):
+                        self._report_job(job, result, logger, error)
                 finally:
                     os.chdir(old_cwd)
                     kill_everything(self._pid, only_children=True)
-            self._max_executions -= 1
+            self._max_executions -= len(jobs)
         kill_everything(self._pid)
 
+    def _report_job(self, job, result, logger, error):
+        if error is None:
+            self._job_queue.report_result(result.get_updates(), job)
+            self._notify_master('job_finished', (job.scan_id, datetime.today()))
+        elif isinstance(error, RetryScan):
+            self._job_queue.report_failure(job)
+            self._notify_master('job_failed', (job.scan_id, datetime.today()))
+        elif isinstance(error, RescheduleLater):
+            self._job_queue.reschedule(error.not_before, job)
+            self._job_queue.report_result(result.get_updates(), job)
+            self._notify_master('job_finished', (job.scan_id, datetime.today()))
+        else:
+            exc_info = (type(error), error, error.__traceback__)
+            logger.error('Scan module `%s` failed.', job.scan_module.name, exc_info=exc_info)
+            self._job_queue.report_failure(job)
+            self._notify_master('job_failed', (job.scan_id, datetime.today()))
+            if self._raven_client:
+                self._raven_client.captureException(exc_info, tags={
+                    'scan_id': job.scan_id,
+                    'scan_module_name': job.scan_module.name
+                }, extra={'result': result.get_results()})
+
     def _notify_master(self, action, args):
         self._write_pipe.send((self._pid, action, args))
         self._ack_event.wait()
@@ -159,6 +159,17 @@ CREATE FUNCTION update_scan_info() RETURNS trigger
 
 CREATE TRIGGER scan_update AFTER INSERT OR DELETE OR UPDATE OF time_finished ON scanner_scan FOR EACH ROW EXECUTE PROCEDURE update_scan_info();
 
+-- Partial results that are shared between scans, e.g., results of
+-- mail servers that are used by many sites. Filled by PrivacyScanner.
+CREATE TABLE scanner_resultcache (
+    namespace character varying(80) NOT NULL,
+    key text NOT NULL,
+    value jsonb NOT NULL,
+    source character varying(80) NOT NULL,
+    time_created timestamp with time zone NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+
 -- TODO: Add trigger function which sets the scanner_scan(scan_finished) field.
 
 COMMIT;
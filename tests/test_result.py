@@ -0,0 +1,163 @@
+import copy
+import json
+import os
+import pickle
+import unittest
+
+from privacyscanner.filehandlers import NoOpFileHandler
+from privacyscanner.result import DELETED, Result
+
+
+class ResultTest(unittest.TestCase):
+    def setUp(self):
+        self.result = Result({
+            'site_url': 'http://example.com/',
+            'mail': {'domain': 'example.com', 'mx': {'records': []}},
+            'requests': [{'url': 'http://example.com/'}],
+        }, NoOpFileHandler())
+
+    def test_nested_changes(self):
+        self.result['mail']['mx']['records'].append('mx.example.com')
+        self.result['mail']['has_starttls'] = True
+        del self.result['mail']['domain']
+        self.result['https'] = {'has_tls': True}
+        # Patches are only ordered by the length of their path
+        self.assertEqual(dict(self.result.get_updates()), {
+            ('https',): {'has_tls': True},
+            ('mail', 'domain'): DELETED,
+            ('mail', 'has_starttls'): True,
+            ('mail', 'mx', 'records'): ['mx.example.com'],
+        })
+
+    def test_ancestor_contains_changes(self):
+        self.result['mail']['mx']['records'].append('mx.example.com')
+        self.result.setdefault('mail', {})['domain'] = 'example.org'
+        self.result.mark_dirty('mail')
+        self.assertEqual(self.result.get_updates(), [
+            (('mail',), self.result.get_results()['mail']),
+        ])
+
+    def test_list_items_mark_list(self):
+        self.result['requests'][0]['status_code'] = 200
+        for request in self.result['requests']:
+            request['mime_type'] = 'text/html'
+        self.assertEqual(self.result.get_updates(), [
+            (('requests',), [{'url': 'http://example.com/', 'status_code': 200,
+                              'mime_type': 'text/html'}]),
+        ])
+
+    def test_items_and_values_are_tracked(self):
+        for key, value in self.result.items():
+            if key == 'mail':
+                value['domain'] = 'example.org'
+        for value in self.result['mail'].values():
+            if isinstance(value, dict):
+                value['records'] = []
+        self.assertEqual({path for path, value in self.result.get_updates()},
+                         {('mail', 'domain'), ('mail', 'mx', 'records')})
+
+    def test_values_behave_like_builtins(self):
+        mail = self.result['mail']
+        requests = self.result['requests']
+        self.assertIsInstance(mail, dict)
+        self.assertIsInstance(requests, list)
+        self.assertEqual(json.loads(json.dumps(mail)), mail)
+        self.assertEqual(len([{}] + requests), 2)
+        self.assertEqual(pickle.loads(pickle.dumps(self.result.get_results())),
+                         self.result.get_results())
+        other = Result({}, NoOpFileHandler())
+        other.update(mail)
+        self.assertEqual(other.get_results(), mail)
+
+    def test_stored_values_are_detached(self):
+        self.result['copy'] = {'mail': self.result['mail']}
+        self.assertIs(type(self.result.get_results()['copy']['mail']), dict)
+        self.result['copy']['mail']['domain'] = 'example.org'
+        self.assertEqual(self.result['mail']['domain'], 'example.com')
+
+    def test_stored_values_keep_their_identity(self):
+        https = {'has_tls': True}
+        self.result['https'] = https
+        self.result['https']['hsts'] = {}
+        https['has_tls'] = False
+        self.assertIs(self.result.get_results()['https'], https)
+        self.assertEqual(self.result.get_updates(), [
+            (('https',), {'has_tls': False, 'hsts': {}}),
+        ])
+
+    def test_copies_are_not_tracked(self):
+        shallow = copy.copy(self.result['mail'])
+        deep = copy.deepcopy(self.result['mail'])
+        shallow['domain'] = 'example.org'
+        deep['mx']['records'].append('mx.example.com')
+        self.assertEqual(self.result.get_updates(), [])
+        self.assertEqual(self.result['mail']['domain'], 'example.com')
+        self.assertEqual(self.result['mail']['mx']['records'], [])
+
+    def test_apply_updates(self):
+        self.result['mail']['has_starttls'] = True
+        del self.result['mail']['domain']
+        self.result['requests'].clear()
+        updates = pickle.loads(pickle.dumps(self.result.get_updates()))
+        other = Result({
+            'mail': {'domain': 'example.com', 'mx': {}},
+            'requests': [{}],
+            'dns': {},
+        }, NoOpFileHandler())
+        other.apply_updates(updates)
+        self.assertEqual(other.get_results(), {
+            'mail': {'has_starttls': True, 'mx': {}},
+            'requests': [],
+            'dns': {},
+        })
+
+
+class PatchExpressionTest(unittest.TestCase):
+    def test_patches(self):
+        from privacyscanner.jobqueue import _build_patch_expression
+
+        expression, params = _build_patch_expression([
+            (('https',), {'has_tls': True}),
+            (('mail', 'domain'), DELETED),
+            (('mail', 'mx', 0), 'mx.example.com'),
+        ])
+        self.assertEqual(expression, 'jsonb_set((jsonb_set(jsonb_set(result, %s::text[], '
+                                     "COALESCE(result #> %s::text[], '{}'::jsonb)), %s::text[], "
+                                     "COALESCE(result #> %s::text[], '{}'::jsonb)) "
+                                     '#- %s::text[]), %s::text[], %s::jsonb) || %s::jsonb')
+        self.assertEqual(params[:4], [['mail'], ['mail'], ['mail', 'mx'], ['mail', 'mx']])
+        self.assertEqual(params[4], ['mail', 'domain'])
+        self.assertEqual(params[5], ['mail', 'mx', '0'])
+        self.assertEqual(params[6].adapted, 'mx.example.com')
+        self.assertEqual(params[7].adapted, {'https': {'has_tls': True}})
+
+    @unittest.skipUnless(os.environ.get('PRIVACYSCANNER_TEST_DSN'),
+                         'PRIVACYSCANNER_TEST_DSN is not set')
+    def test_missing_parent(self):
+        import psycopg2
+        from privacyscanner.jobqueue import _build_patch_expression
+
+        expression, params = _build_patch_expression([
+            (('mail', 'mx', 'records'), ['mx.example.com']),
+            (('dns', 'a'), []),
+        ])
+        conn = psycopg2.connect(os.environ['PRIVACYSCANNER_TEST_DSN'])
+        try:
+            with conn.cursor() as c:
+                c.execute('SELECT {} FROM (SELECT %s::jsonb AS result) AS s'.format(expression),
+                          params + [json.dumps({'mail': {}})])
+                self.assertEqual(c.fetchone()[0], {
+                    'mail': {'mx': {'records': ['mx.example.com']}},
+                    'dns': {'a': []},
+                })
+        finally:
+            conn.close()
+
+    def test_no_patches(self):
+        from privacyscanner.jobqueue import _build_patch_expression
+
+        self.assertEqual(_build_patch_expression([]), ('result', []))
+
+
+if __name__ == '__main__':
+    unittest.main()
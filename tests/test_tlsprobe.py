@@ -0,0 +1,105 @@
+import asyncio
+import datetime
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from privacyscanner.utils.tlsprobe import TLSProbeError, TLSProber
+
+
+def _create_certificate(directory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = x509.CertificateBuilder().subject_name(name).issuer_name(name)\
+        .public_key(key.public_key()).serial_number(x509.random_serial_number())\
+        .not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1))\
+        .sign(key, hashes.SHA256())
+    cert_file = directory / 'cert.pem'
+    key_file = directory / 'key.pem'
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(key.private_bytes(serialization.Encoding.PEM,
+                                           serialization.PrivateFormat.PKCS8,
+                                           serialization.NoEncryption()))
+    return cert.public_bytes(serialization.Encoding.DER), cert_file, key_file
+
+
+def _get_free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class _FlakyProber(TLSProber):
+    """Prober whose connections fail every now and then after the first."""
+    async def _open(self):
+        if self.num_connections and self.num_connections % 5 == 0:
+            self.num_connections += 1
+            raise TLSProbeError('Connection refused')
+        return await super()._open()
+
+
+@unittest.skipIf(shutil.which('openssl') is None, 'openssl is not installed')
+class TLSProberTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.cert_der, cert_file, key_file = _create_certificate(Path(cls._temp_dir.name))
+        cls.port = _get_free_port()
+        cls._server = subprocess.Popen(
+            ['openssl', 's_server', '-quiet', '-accept', str(cls.port),
+             '-cert', str(cert_file), '-key', str(key_file), '-no_tls1', '-no_tls1_1',
+             '-cipher', 'ECDHE-ECDSA-AES128-GCM-SHA256:ECDHE-ECDSA-AES256-GCM-SHA384'],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(50):
+            try:
+                socket.create_connection(('127.0.0.1', cls.port)).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._server.terminate()
+        cls._server.wait()
+        cls._temp_dir.cleanup()
+
+    def _probe(self, prober_class=TLSProber):
+        prober = prober_class('localhost', '127.0.0.1', self.port, timeout=5)
+        return prober, asyncio.run(prober.probe())
+
+    def test_probe(self):
+        prober, result = self._probe()
+        self.assertEqual(result['protocols'], {
+            'SSLv2': False, 'SSLv3': False, 'TLSv1': False, 'TLSv1.1': False,
+            'TLSv1.2': True, 'TLSv1.3': True,
+        })
+        self.assertEqual(sorted(result['ciphers']['TLSv1.2']),
+                         ['ECDHE-ECDSA-AES128-GCM-SHA256', 'ECDHE-ECDSA-AES256-GCM-SHA384'])
+        self.assertIn('TLS_AES_256_GCM_SHA384', result['ciphers']['TLSv1.3'])
+        self.assertIn('prime256v1', result['groups'])
+        self.assertEqual(result['certificate'], self.cert_der)
+        self.assertEqual(prober.num_failed_connections, 0)
+
+    def test_failed_connections(self):
+        prober, result = self._probe(_FlakyProber)
+        self.assertGreater(prober.num_failed_connections, 0)
+        self.assertTrue(result['protocols']['TLSv1.3'])
+
+    def test_unreachable(self):
+        prober = TLSProber('localhost', '127.0.0.1', _get_free_port(), timeout=5)
+        with self.assertRaises(TLSProbeError):
+            asyncio.run(prober.probe())
+
+
+if __name__ == '__main__':
+    unittest.main()